@@ -1,3 +1,6 @@
+default_app_config = "koytola.account.apps.AccountAppConfig"
+
+
 class AccountEvents:
     """The different account event types."""
 
@@ -6,7 +6,7 @@ from .models import (
     StaffNotificationRecipient,
     Countries
 )
-from ..core.utils import download_csv
+from ..core.utils.export import download_csv, download_jsonl, download_xlsx
 
 
 class AddressAdmin(admin.ModelAdmin):
@@ -17,7 +17,7 @@ class AddressAdmin(admin.ModelAdmin):
     search_fields = ["address_name", "company_name", "country"]
     list_filter = []
     list_per_page = 800
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["id"]
@@ -31,7 +31,8 @@ class UserAdmin(admin.ModelAdmin):
     search_fields = ["email", "user_id", "first_name", "last_name", "jwt_token_key"]
     list_filter = ["is_superuser", "is_staff", "is_active", "date_joined"]
     list_per_page = 50
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
+    export_exclude = ["password", "jwt_token_key"]
 
     def get_ordering(self, request):
         return ["-date_joined"]
@@ -41,7 +42,7 @@ class AccountEventAdmin(admin.ModelAdmin):
     list_display = ["id", "date", "type", "user"]
     search_fields = ["type", "user"]
     list_filter = ["date", "type"]
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-date"]
@@ -51,7 +52,7 @@ class StaffNotificationRecipientAdmin(admin.ModelAdmin):
     list_display = ["id", "user", "staff_email", "active"]
     search_fields = ["user", "staff_email"]
     list_filter = ["active"]
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-id"]
@@ -60,7 +61,7 @@ class StaffNotificationRecipientAdmin(admin.ModelAdmin):
 class CountriesAdmin(admin.ModelAdmin):
     list_display = ["id", "code", "name", "latitude", "longitude", "flag", "created_at"]
     search_fields = ["code", "code", "latitude", "longitude"]
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-id"]
@@ -18,7 +18,12 @@ from phonenumber_field.modelfields import PhoneNumber, PhoneNumberField
 from versatileimagefield.fields import VersatileImageField
 
 from ..core.models import ModelWithMetadata
-from ..core.permissions import AccountPermissions, BasePermissionEnum, get_permissions
+from ..core.permissions import (
+    AccountPermissions,
+    BasePermissionEnum,
+    get_permissions,
+    get_user_permission_names,
+)
 from ..core.utils.json_serializer import CustomJsonEncoder
 from . import AccountEvents
 from .validators import validate_possible_number
@@ -235,8 +240,31 @@ class User(PermissionsMixin, ModelWithMetadata, AbstractBaseUser):
         # Active superusers have all permissions.
         if self.is_active and self.is_superuser and not self._effective_permissions:
             return True
+        if obj is None:
+            self._load_cached_permissions()
         return _user_has_perm(self, perm, obj)
 
+    def get_all_permissions(self, obj=None):
+        if obj is None:
+            self._load_cached_permissions()
+        return super().get_all_permissions(obj)
+
+    def _load_cached_permissions(self):
+        """Fill the caches of the authentication backends with the shared set.
+
+        Permissions overridden with `effective_permissions`, e.g. by the tokens
+        issued for apps, are still computed by the backends.
+        """
+        if (
+            not self.is_active
+            or self._effective_permissions is not None
+            or hasattr(self, "_perm_cache")
+        ):
+            return
+        permissions = get_user_permission_names(self)
+        self._perm_cache = permissions
+        self._effective_permissions_cache = permissions
+
 
 class AccountEvent(models.Model):
     """Model used to store events that happened during the account lifecycle."""
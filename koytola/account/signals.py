@@ -0,0 +1,67 @@
+from django.contrib.auth.models import Group
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+
+from ..core.permissions import (
+    invalidate_groups_permissions,
+    invalidate_users_permissions,
+)
+from .models import User
+from .utils import invalidate_auth_users
+
+M2M_CHANGE_ACTIONS = ("post_add", "post_remove", "pre_clear")
+
+
+def _invalidate_user(instance, **_kwargs):
+    invalidate_auth_users([instance.user_id])
+    # Superuser and active flags change the effective permissions as well.
+    invalidate_users_permissions([instance.pk])
+
+
+def _invalidate_group_users(instance, **_kwargs):
+    invalidate_users_permissions(instance.user_set.values_list("pk", flat=True))
+
+
+def _invalidate_user_permissions(instance, action, reverse, pk_set, **_kwargs):
+    """Handle changes of the user's groups and permissions."""
+    if action not in M2M_CHANGE_ACTIONS:
+        return
+    if not reverse:
+        invalidate_users_permissions([instance.pk])
+    elif action == "pre_clear":
+        invalidate_users_permissions(instance.user_set.values_list("pk", flat=True))
+    else:
+        invalidate_users_permissions(pk_set)
+
+
+def _invalidate_group_permissions(instance, action, reverse, pk_set, **_kwargs):
+    if action not in M2M_CHANGE_ACTIONS:
+        return
+    if not reverse:
+        invalidate_groups_permissions([instance.pk])
+    elif action == "pre_clear":
+        invalidate_groups_permissions(instance.group_set.values_list("pk", flat=True))
+    else:
+        invalidate_groups_permissions(pk_set)
+
+
+def connect_signals():
+    post_save.connect(_invalidate_user, sender=User, dispatch_uid="invalidate_user")
+    post_delete.connect(_invalidate_user, sender=User, dispatch_uid="invalidate_user")
+    pre_delete.connect(
+        _invalidate_group_users, sender=Group, dispatch_uid="invalidate_group_users"
+    )
+    m2m_changed.connect(
+        _invalidate_user_permissions,
+        sender=User.groups.through,
+        dispatch_uid="invalidate_user_groups",
+    )
+    m2m_changed.connect(
+        _invalidate_user_permissions,
+        sender=User.user_permissions.through,
+        dispatch_uid="invalidate_user_permissions",
+    )
+    m2m_changed.connect(
+        _invalidate_group_permissions,
+        sender=Group.permissions.through,
+        dispatch_uid="invalidate_group_permissions",
+    )
@@ -1,16 +1,20 @@
+from datetime import timedelta
 from urllib.parse import urlencode
 
 import i18naddress
+import jwt
 import pytest
 from django.core.exceptions import ValidationError
 from django.http import QueryDict
 from django.template import Context, Template
 from django_countries.fields import Country
 
+from ...core.jwt import JWT_ACCESS_TYPE, get_user_from_payload, jwt_user_payload
+from ...core.permissions import AccountPermissions, get_user_permission_names
 from .. import forms, i18n
 from ..models import User
 from ..templatetags.i18n_address_tags import format_address
-from ..utils import remove_staff_member
+from ..utils import cache_auth_user, get_cached_auth_user, remove_staff_member
 from ..validators import validate_possible_number
 
 
@@ -304,3 +308,102 @@ def test_remove_staff_member_with_orders(staff_user, permission_manage_products,
 def test_remove_staff_member(staff_user):
     remove_staff_member(staff_user)
     assert not User.objects.filter(pk=staff_user.pk).exists()
+
+
+def test_get_user_from_payload_uses_cached_user(
+    staff_user, permission_manage_users, django_assert_num_queries
+):
+    staff_user.user_permissions.add(permission_manage_users)
+    payload = jwt_user_payload(staff_user, JWT_ACCESS_TYPE, timedelta(minutes=5))
+    get_user_from_payload(payload)
+
+    with django_assert_num_queries(0):
+        user = get_user_from_payload(payload)
+        assert user.has_perm(AccountPermissions.MANAGE_USERS)
+
+    assert user.pk == staff_user.pk
+
+
+def test_get_cached_auth_user(customer_user, django_assert_num_queries):
+    cache_auth_user(customer_user)
+
+    with django_assert_num_queries(0):
+        user = get_cached_auth_user(customer_user.user_id)
+        assert user.pk == customer_user.pk
+        assert user.email == customer_user.email
+        assert user.user_id == customer_user.user_id
+        assert user.jwt_token_key == customer_user.jwt_token_key
+        assert user.is_superuser is False
+        assert user.is_active is True
+    assert not user._state.adding
+    # Fields missing from the snapshot are loaded on first access.
+    assert user.get_deferred_fields()
+
+
+def test_get_user_from_payload_rotated_token(customer_user):
+    payload = jwt_user_payload(customer_user, JWT_ACCESS_TYPE, timedelta(minutes=5))
+    get_user_from_payload(payload)
+
+    customer_user.jwt_token_key = "new-key"
+    customer_user.save(update_fields=["jwt_token_key"])
+
+    with pytest.raises(jwt.InvalidTokenError):
+        get_user_from_payload(payload)
+
+
+def test_get_user_from_payload_deactivated_user(customer_user):
+    payload = jwt_user_payload(customer_user, JWT_ACCESS_TYPE, timedelta(minutes=5))
+    get_user_from_payload(payload)
+
+    customer_user.is_active = False
+    customer_user.save(update_fields=["is_active"])
+
+    with pytest.raises(jwt.InvalidTokenError):
+        get_user_from_payload(payload)
+
+
+def test_cached_user_invalidated_on_group_change(
+    staff_user, permission_group_manage_users
+):
+    payload = jwt_user_payload(staff_user, JWT_ACCESS_TYPE, timedelta(minutes=5))
+    assert not get_user_from_payload(payload).has_perm(AccountPermissions.MANAGE_USERS)
+
+    permission_group_manage_users.user_set.add(staff_user)
+
+    assert get_user_from_payload(payload).has_perm(AccountPermissions.MANAGE_USERS)
+
+
+def test_user_permission_names_shared_between_requests(
+    staff_user, permission_group_manage_users, django_assert_num_queries
+):
+    permission_group_manage_users.user_set.add(staff_user)
+    get_user_permission_names(staff_user)
+
+    with django_assert_num_queries(0):
+        assert get_user_permission_names(staff_user) == {"account.manage_users"}
+
+
+def test_user_permission_names_invalidated_on_group_permissions_change(
+    staff_user, permission_group_manage_users, permission_manage_staff
+):
+    permission_group_manage_users.user_set.add(staff_user)
+    assert get_user_permission_names(staff_user) == {"account.manage_users"}
+
+    permission_group_manage_users.permissions.add(permission_manage_staff)
+
+    assert get_user_permission_names(staff_user) == {
+        "account.manage_users",
+        "account.manage_staff",
+    }
+
+
+def test_has_perms_uses_shared_permission_names(
+    staff_user, permission_manage_users, django_assert_num_queries
+):
+    staff_user.user_permissions.add(permission_manage_users)
+    get_user_permission_names(staff_user)
+    user = User.objects.get(pk=staff_user.pk)
+
+    with django_assert_num_queries(0):
+        assert user.has_perms([AccountPermissions.MANAGE_USERS])
+        assert not user.has_perms([AccountPermissions.MANAGE_STAFF])
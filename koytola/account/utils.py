@@ -1,7 +1,32 @@
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import DEFERRED
+
 from ..core.utils import create_thumbnails
 from ..plugins.manager import get_plugins_manager
 from .models import User
 
+AUTH_USER_KEY_PREFIX = "koytola:auth-user:"
+
+# Fields kept in the cached snapshots of the authenticated users, the remaining
+# fields are loaded from the database on first access.
+AUTH_USER_FIELDS = (
+    "id",
+    "email",
+    "user_id",
+    "jwt_token_key",
+    "first_name",
+    "last_name",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+    "is_seller",
+    "is_buyer",
+)
+
 
 class AddressType:
     BILLING = "billing"
@@ -81,3 +106,50 @@ def remove_staff_member(staff):
         staff.save()
     else:
         staff.delete()
+
+
+def _get_auth_user_key(user_id: str) -> str:
+    return AUTH_USER_KEY_PREFIX + user_id
+
+
+def cache_auth_user(user: User):
+    """Store a snapshot of the authenticated user."""
+    snapshot = {field: getattr(user, field) for field in AUTH_USER_FIELDS}
+    cache.set(
+        _get_auth_user_key(user.user_id),
+        snapshot,
+        timeout=settings.JWT_TTL_USER_CACHE.total_seconds(),
+    )
+
+
+def get_cached_auth_user(user_id: Optional[str]) -> Optional[User]:
+    """Return the cached user with the given `user_id`, if any.
+
+    The user is built without querying the database. Fields missing from the
+    snapshot are deferred and loaded on first access.
+    """
+    if not user_id:
+        return None
+    snapshot = cache.get(_get_auth_user_key(user_id))
+    if snapshot is None:
+        return None
+    # `from_db` expects the values in the order of the concrete fields.
+    fields = User._meta.concrete_fields
+    return User.from_db(
+        User.objects.db,
+        [field.attname for field in fields],
+        [snapshot.get(field.attname, DEFERRED) for field in fields],
+    )
+
+
+def invalidate_auth_users(user_ids: Iterable[str]):
+    """Drop the cached snapshots of the given users.
+
+    Snapshots are dropped again after the commit, as concurrent requests could
+    have cached the data which is being changed.
+    """
+    keys = [_get_auth_user_key(user_id) for user_id in user_ids]
+    if not keys:
+        return
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
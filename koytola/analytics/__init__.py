@@ -12,3 +12,15 @@ class TrackingTypes:
         (COMPANY, "company visit tracking"),
         (PRODUCT, "product visit tracking"),
     ]
+
+
+class TrackingStatsGranularity:
+    """The periods the tracking stats are aggregated by."""
+
+    HOUR = "hour"
+    DAY = "day"
+
+    CHOICES = [
+        (HOUR, "Hourly tracking stats"),
+        (DAY, "Daily tracking stats"),
+    ]
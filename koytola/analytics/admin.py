@@ -1,8 +1,23 @@
+from django import forms
 from django.contrib import admin
+from django.core.exceptions import PermissionDenied
+from django.http import HttpResponseBadRequest, StreamingHttpResponse
+from django.urls import path
+from django.utils import timezone
+
+from . import TrackingTypes
+from .export import get_export_queryset, iter_gzip_csv, iter_rows
 from .models import (
     Tracking,
 )
-from ..core.utils import download_csv, download_json
+from ..core.permissions import AnalyticsPermissions
+from ..core.utils.export import download_csv, download_jsonl, download_xlsx
+
+
+class TrackingExportForm(forms.Form):
+    date_from = forms.DateField(required=False)
+    date_to = forms.DateField(required=False)
+    type = forms.MultipleChoiceField(choices=TrackingTypes.CHOICES, required=False)
 
 
 class TrackingAdmin(admin.ModelAdmin):
@@ -17,10 +32,44 @@ class TrackingAdmin(admin.ModelAdmin):
     ]
     list_filter = ["date"]
     list_per_page = 100
-    actions = [download_csv, download_json]
+    # Counting all the trackings would scan every partition of the table.
+    show_full_result_count = False
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-date", "-id"]
 
+    def get_urls(self):
+        urls = [
+            path(
+                "export/",
+                self.admin_site.admin_view(self.export_view),
+                name="analytics_tracking_export",
+            ),
+        ]
+        return urls + super().get_urls()
+
+    def export_view(self, request):
+        """Stream the trackings filtered by the query parameters as gzipped CSV.
+
+        Accepts `date_from` and `date_to` days and any number of `type`s.
+        """
+        if not request.user.has_perm(AnalyticsPermissions.MANAGE_TRACKING):
+            raise PermissionDenied()
+        form = TrackingExportForm(request.GET)
+        if not form.is_valid():
+            return HttpResponseBadRequest(form.errors.as_json())
+        queryset = get_export_queryset(
+            form.cleaned_data["date_from"],
+            form.cleaned_data["date_to"],
+            form.cleaned_data["type"],
+        )
+        response = StreamingHttpResponse(
+            iter_gzip_csv(iter_rows(queryset)), content_type="application/gzip"
+        )
+        filename = "trackings-%s.csv.gz" % timezone.now().strftime("%Y-%m-%d")
+        response["Content-Disposition"] = "attachment; filename=%s" % filename
+        return response
+
 
 admin.site.register(Tracking, TrackingAdmin)
@@ -0,0 +1,182 @@
+"""Streaming export of the trackings.
+
+The trackings are read with a server-side cursor in chunks of
+`TRACKING_EXPORT_CHUNK_SIZE` rows and written out as they come, so the memory
+used doesn't depend on the number of the exported trackings. Files are split
+by the UTC day of the trackings: `<output_dir>/date=<YYYY-MM-DD>/trackings.<ext>`.
+
+Parquet files require the optional `pyarrow` package.
+"""
+import csv
+import gzip
+import io
+import json
+import os
+from datetime import date, datetime, time, timedelta
+from itertools import groupby, islice
+from typing import Iterable, Iterator, List, Optional
+
+import pytz
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from ..core.utils.json_serializer import CustomJsonEncoder
+from .models import Tracking
+
+CSV = "csv"
+PARQUET = "parquet"
+FORMATS = [CSV, PARQUET]
+FILE_EXTENSIONS = {CSV: "csv.gz", PARQUET: "parquet"}
+
+EXPORT_FIELDS = [
+    "id",
+    "date",
+    "type",
+    "user_id",
+    "category_id",
+    "company_id",
+    "product_id",
+    "ip",
+    "country",
+    "region",
+    "city",
+    "postal",
+    "location_details",
+    "referrer",
+    "device_type",
+    "device",
+    "browser",
+    "browser_version",
+    "system",
+    "system_version",
+    "parameters",
+]
+ID_FIELDS = {"id", "user_id", "category_id", "company_id", "product_id"}
+JSON_FIELDS = {"location_details", "parameters"}
+DATE_INDEX = EXPORT_FIELDS.index("date")
+JSON_INDEXES = [EXPORT_FIELDS.index(field) for field in JSON_FIELDS]
+
+
+def _get_day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=pytz.utc)
+
+
+def get_export_queryset(
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    types: Optional[List[str]] = None,
+):
+    trackings = Tracking.objects.order_by("date", "id")
+    if date_from:
+        trackings = trackings.filter(date__gte=_get_day_start(date_from))
+    if date_to:
+        trackings = trackings.filter(
+            date__lt=_get_day_start(date_to + timedelta(days=1))
+        )
+    if types:
+        trackings = trackings.filter(type__in=types)
+    return trackings.values_list(*EXPORT_FIELDS)
+
+
+def iter_rows(queryset, chunk_size: Optional[int] = None) -> Iterator[list]:
+    """Yield the rows of the trackings with the JSON fields serialized."""
+    chunk_size = chunk_size or settings.TRACKING_EXPORT_CHUNK_SIZE
+    for row in queryset.iterator(chunk_size=chunk_size):
+        row = list(row)
+        for index in JSON_INDEXES:
+            row[index] = json.dumps(row[index], cls=CustomJsonEncoder)
+        yield row
+
+
+def _get_day(row) -> date:
+    return row[DATE_INDEX].astimezone(pytz.utc).date()
+
+
+def _chunked(rows: Iterable[list], size: int) -> Iterator[List[list]]:
+    rows = iter(rows)
+    chunk = list(islice(rows, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(rows, size))
+
+
+def write_csv(path: str, rows: Iterable[list]):
+    with gzip.open(path, "wt", encoding="utf-8", newline="") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(EXPORT_FIELDS)
+        writer.writerows(rows)
+
+
+def _get_parquet_schema(pa):
+    fields = []
+    for field in EXPORT_FIELDS:
+        if field in ID_FIELDS:
+            field_type = pa.int64()
+        elif field == "date":
+            field_type = pa.timestamp("us", tz="UTC")
+        else:
+            field_type = pa.string()
+        fields.append(pa.field(field, field_type))
+    return pa.schema(fields)
+
+
+def write_parquet(path: str, rows: Iterable[list], chunk_size: int):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImproperlyConfigured(
+            "Exporting trackings to Parquet requires the pyarrow package."
+        )
+    schema = _get_parquet_schema(pa)
+    with pq.ParquetWriter(path, schema) as writer:
+        # Every chunk is written as a separate row group.
+        for chunk in _chunked(rows, chunk_size):
+            columns = [
+                pa.array(column, type=field.type)
+                for column, field in zip(zip(*chunk), schema)
+            ]
+            writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+
+
+def export_trackings(
+    output_dir: str,
+    file_format: str = CSV,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    types: Optional[List[str]] = None,
+    chunk_size: Optional[int] = None,
+) -> List[str]:
+    """Export the trackings into files split by day and return their paths."""
+    chunk_size = chunk_size or settings.TRACKING_EXPORT_CHUNK_SIZE
+    queryset = get_export_queryset(date_from, date_to, types)
+    paths = []
+    for day, rows in groupby(iter_rows(queryset, chunk_size), key=_get_day):
+        day_dir = os.path.join(output_dir, f"date={day.isoformat()}")
+        os.makedirs(day_dir, exist_ok=True)
+        path = os.path.join(day_dir, f"trackings.{FILE_EXTENSIONS[file_format]}")
+        if file_format == PARQUET:
+            write_parquet(path, rows, chunk_size)
+        else:
+            write_csv(path, rows)
+        paths.append(path)
+    return paths
+
+
+def iter_gzip_csv(rows: Iterable[list], flush_every: int = 1000) -> Iterator[bytes]:
+    """Yield the gzipped CSV of the rows in pieces, e.g. for a streaming response."""
+    buffer = io.BytesIO()
+    gzip_file = gzip.GzipFile(fileobj=buffer, mode="wb")
+    csv_file = io.TextIOWrapper(gzip_file, encoding="utf-8", newline="")
+    writer = csv.writer(csv_file)
+    writer.writerow(EXPORT_FIELDS)
+    for index, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if index % flush_every == 0:
+            csv_file.flush()
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    # Closing the wrapper closes the gzip file too, which writes its trailer.
+    csv_file.close()
+    yield buffer.getvalue()
@@ -0,0 +1,225 @@
+"""Buffered ingestion of the tracking events.
+
+Every worker keeps the incoming events in memory and writes them with a single
+`bulk_create` once `TRACKING_BATCH_SIZE` of them are waiting or the oldest of
+them waited for `TRACKING_FLUSH_INTERVAL` seconds. The interval is also checked
+by a background thread of every worker, so that the events don't stay in the
+memory of the workers which stopped receiving them. The buffer holds at most
+`TRACKING_BUFFER_SIZE` events; the ones that don't fit are dropped and counted,
+so that a slow database can't exhaust the memory of the workers.
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, transaction
+
+from ..core.geoip import geoip
+from ..core.utils import get_client_ip
+from . import TrackingTypes
+from .models import Tracking
+from .utils import parse_user_agent
+
+logger = logging.getLogger(__name__)
+
+RELATION_FIELDS = ["user", "category", "company", "product"]
+
+
+def _truncate(field_name: str, value: Optional[str]) -> str:
+    max_length = Tracking._meta.get_field(field_name).max_length
+    return (value or "")[:max_length]
+
+
+def get_request_details(request) -> dict:
+    """Return the tracking details shared by all the events sent in a request."""
+    ip = get_client_ip(request) or ""
+    details = {
+        "ip": ip,
+        "referrer": request.META.get("HTTP_REFERER", ""),
+    }
+    geo_data = geoip.lookup(ip) if ip not in settings.INTERNAL_IPS else None
+    if geo_data:
+        details.update(
+            country=geo_data.country,
+            region=geo_data.region,
+            city=geo_data.city,
+            postal=geo_data.postal,
+        )
+    details = {field: _truncate(field, value) for field, value in details.items()}
+    if geo_data:
+        details["location_details"] = geo_data.location
+    user_agent = parse_user_agent(request.META.get("HTTP_USER_AGENT", ""))
+    details.update(user_agent._asdict())
+
+    user = getattr(request, "user", None)
+    if user and user.is_authenticated:
+        details["user_id"] = user.pk
+    return details
+
+
+def get_tracking_type(event: dict) -> str:
+    if event.get("type"):
+        return event["type"]
+    for tracking_type in [
+        TrackingTypes.PRODUCT,
+        TrackingTypes.COMPANY,
+        TrackingTypes.CATEGORY,
+    ]:
+        if event.get(f"{tracking_type}_id"):
+            return tracking_type
+    return TrackingTypes.OTHER
+
+
+def build_trackings(events: Iterable[dict], details: dict) -> List[Tracking]:
+    """Create unsaved trackings of the events enriched with the request details.
+
+    Each event may refer to one of `category_id`, `company_id` or `product_id`
+    and override the `referrer` of the request.
+    """
+    trackings = []
+    for event in events:
+        data = dict(details)
+        if event.get("referrer"):
+            data["referrer"] = _truncate("referrer", event["referrer"])
+        trackings.append(
+            Tracking(
+                **data,
+                type=get_tracking_type(event),
+                category_id=event.get("category_id"),
+                company_id=event.get("company_id"),
+                product_id=event.get("product_id"),
+                parameters=event.get("parameters") or {},
+            )
+        )
+    return trackings
+
+
+def _clear_missing_relations(trackings: List[Tracking]):
+    """Unset the relations to the objects that don't exist (anymore).
+
+    The ids sent by the clients aren't checked when the events are received,
+    so a single invalid one can't make the whole batch fail to be written.
+    """
+    for field_name in RELATION_FIELDS:
+        field = Tracking._meta.get_field(field_name)
+        ids = {getattr(tracking, field.attname) for tracking in trackings}
+        ids.discard(None)
+        if not ids:
+            continue
+        existing_ids = set(
+            field.related_model.objects.filter(pk__in=ids).values_list(
+                "pk", flat=True
+            )
+        )
+        for tracking in trackings:
+            if getattr(tracking, field.attname) not in existing_ids:
+                setattr(tracking, field.attname, None)
+
+
+class TrackingBuffer:
+    """Per-process buffer of the trackings waiting to be written."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._trackings: List[Tracking] = []
+        self._flushed_at = time.monotonic()
+        self._flusher_pid: Optional[int] = None
+        self.dropped = 0
+
+    def __len__(self):
+        return len(self._trackings)
+
+    def add(self, trackings: List[Tracking]) -> int:
+        """Buffer the trackings and return the number of the accepted ones."""
+        with self._lock:
+            self._start_flusher()
+            free = max(settings.TRACKING_BUFFER_SIZE - len(self._trackings), 0)
+            accepted = trackings[:free]
+            dropped = len(trackings) - len(accepted)
+            self._trackings.extend(accepted)
+            self.dropped += dropped
+            should_flush = (
+                len(self._trackings) >= settings.TRACKING_BATCH_SIZE
+                or time.monotonic() - self._flushed_at
+                >= settings.TRACKING_FLUSH_INTERVAL
+            )
+        if dropped:
+            logger.warning(
+                "The tracking buffer is full, dropped %s event(s).", dropped
+            )
+        if should_flush:
+            # Requests that come while the events are written don't wait for
+            # it, they only add their events to the buffer.
+            self.flush(blocking=False)
+        return len(accepted)
+
+    def _start_flusher(self):
+        # Threads don't survive a fork, so each worker process starts its own.
+        pid = os.getpid()
+        if self._flusher_pid == pid:
+            return
+        self._flusher_pid = pid
+        threading.Thread(
+            target=self._run_flusher, name="tracking-flusher", daemon=True
+        ).start()
+
+    def _run_flusher(self):
+        while True:
+            time.sleep(settings.TRACKING_FLUSH_INTERVAL)
+            if not self._trackings:
+                continue
+            try:
+                self.flush(blocking=False)
+            except Exception:
+                logger.exception("Cannot flush the tracking buffer.")
+            finally:
+                close_old_connections()
+
+    def flush(self, blocking: bool = True) -> int:
+        """Write the buffered trackings and return the number of written ones."""
+        if not self._flush_lock.acquire(blocking=blocking):
+            return 0
+        try:
+            with self._lock:
+                trackings, self._trackings = self._trackings, []
+                self._flushed_at = time.monotonic()
+            if not trackings:
+                return 0
+            try:
+                with transaction.atomic():
+                    _clear_missing_relations(trackings)
+                    Tracking.objects.bulk_create(
+                        trackings, batch_size=settings.TRACKING_BATCH_SIZE
+                    )
+            except DatabaseError:
+                logger.exception("Cannot write %s tracking event(s).", len(trackings))
+                with self._lock:
+                    self.dropped += len(trackings)
+                return 0
+            return len(trackings)
+        finally:
+            self._flush_lock.release()
+
+    def clear(self):
+        with self._lock:
+            self._trackings = []
+            self.dropped = 0
+
+
+tracking_buffer = TrackingBuffer()
+atexit.register(tracking_buffer.flush)
+
+
+def track_events(request, events: Iterable[dict]) -> int:
+    """Buffer the events sent in the request and return the number of accepted.
+
+    Each event is a dict of `type`, `category_id`, `company_id`, `product_id`,
+    `referrer` and `parameters`, all of them optional.
+    """
+    trackings = build_trackings(events, get_request_details(request))
+    return tracking_buffer.add(trackings)
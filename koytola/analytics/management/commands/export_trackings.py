@@ -0,0 +1,65 @@
+from datetime import date
+from typing import Any
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import BaseCommand, CommandError
+from django.core.management.base import CommandParser
+
+from ... import TrackingTypes
+from ...export import CSV, FORMATS, export_trackings
+
+
+class Command(BaseCommand):
+    help = "Export trackings into files split by day."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("output_dir", type=str, help="Directory of the files.")
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            default=CSV,
+            dest="file_format",
+            help="Format of the files, gzipped CSV by default.",
+        )
+        parser.add_argument(
+            "--date-from",
+            type=date.fromisoformat,
+            dest="date_from",
+            help="Export the trackings from the day (YYYY-MM-DD).",
+        )
+        parser.add_argument(
+            "--date-to",
+            type=date.fromisoformat,
+            dest="date_to",
+            help="Export the trackings up to and including the day (YYYY-MM-DD).",
+        )
+        parser.add_argument(
+            "--type",
+            action="append",
+            choices=[tracking_type for tracking_type, _ in TrackingTypes.CHOICES],
+            default=[],
+            dest="types",
+            help="Export only the trackings of the type. "
+            "Argument can be specified multiple times.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            dest="chunk_size",
+            help="Number of the trackings fetched from the database at once.",
+        )
+
+    def handle(self, *args: Any, **options: Any):
+        try:
+            paths = export_trackings(
+                options["output_dir"],
+                file_format=options["file_format"],
+                date_from=options["date_from"],
+                date_to=options["date_to"],
+                types=options["types"],
+                chunk_size=options["chunk_size"],
+            )
+        except ImproperlyConfigured as e:
+            raise CommandError(str(e))
+        for path in paths:
+            self.stdout.write(path)
@@ -0,0 +1,77 @@
+# Generated by Django 3.1 on 2021-07-05 09:12
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tracking',
+            name='date',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now, editable=False),
+        ),
+        migrations.CreateModel(
+            name='DailyTrackingStats',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period_start', models.DateTimeField()),
+                ('type', models.CharField(max_length=255)),
+                ('item_id', models.PositiveIntegerField(blank=True, null=True)),
+                ('country', models.CharField(blank=True, max_length=255)),
+                ('device_type', models.CharField(blank=True, max_length=255)),
+                ('referrer_host', models.CharField(blank=True, max_length=255)),
+                ('views', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['period_start'],
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='HourlyTrackingStats',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period_start', models.DateTimeField()),
+                ('type', models.CharField(max_length=255)),
+                ('item_id', models.PositiveIntegerField(blank=True, null=True)),
+                ('country', models.CharField(blank=True, max_length=255)),
+                ('device_type', models.CharField(blank=True, max_length=255)),
+                ('referrer_host', models.CharField(blank=True, max_length=255)),
+                ('views', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['period_start'],
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='TrackingStatsWatermark',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=32, unique=True)),
+                ('timestamp', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='dailytrackingstats',
+            index=models.Index(fields=['type', 'item_id', 'period_start'], name='daily_stats_item_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dailytrackingstats',
+            index=models.Index(fields=['period_start'], name='daily_stats_period_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hourlytrackingstats',
+            index=models.Index(fields=['type', 'item_id', 'period_start'], name='hourly_stats_item_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hourlytrackingstats',
+            index=models.Index(fields=['period_start'], name='hourly_stats_period_idx'),
+        ),
+    ]
@@ -0,0 +1,121 @@
+# Generated by Django 3.1 on 2021-07-12 08:41
+
+from datetime import date, datetime
+
+from django.db import migrations, models
+import django.utils.timezone
+import pytz
+
+# Number of the monthly partitions created after the current month.
+PARTITIONS_AHEAD = 3
+
+PARTITION_TRACKING_SQL = """
+ALTER TABLE analytics_tracking RENAME TO analytics_tracking_unpartitioned;
+ALTER TABLE analytics_tracking_unpartitioned
+    RENAME CONSTRAINT analytics_tracking_pkey TO analytics_tracking_unpartitioned_pkey;
+
+CREATE TABLE analytics_tracking (
+    LIKE analytics_tracking_unpartitioned INCLUDING DEFAULTS
+) PARTITION BY RANGE (date);
+-- The partitioning column has to be a part of the primary key.
+ALTER TABLE analytics_tracking ADD PRIMARY KEY (id, date);
+ALTER SEQUENCE analytics_tracking_id_seq OWNED BY analytics_tracking.id;
+CREATE TABLE analytics_tracking_default PARTITION OF analytics_tracking DEFAULT;
+
+ALTER TABLE analytics_tracking
+    ADD CONSTRAINT analytics_tracking_user_id_fk FOREIGN KEY (user_id)
+    REFERENCES account_user (id) DEFERRABLE INITIALLY DEFERRED;
+ALTER TABLE analytics_tracking
+    ADD CONSTRAINT analytics_tracking_category_id_fk FOREIGN KEY (category_id)
+    REFERENCES product_category (id) DEFERRABLE INITIALLY DEFERRED;
+ALTER TABLE analytics_tracking
+    ADD CONSTRAINT analytics_tracking_company_id_fk FOREIGN KEY (company_id)
+    REFERENCES profile_company (id) DEFERRABLE INITIALLY DEFERRED;
+ALTER TABLE analytics_tracking
+    ADD CONSTRAINT analytics_tracking_product_id_fk FOREIGN KEY (product_id)
+    REFERENCES product_product (id) DEFERRABLE INITIALLY DEFERRED;
+CREATE INDEX analytics_tracking_user_id_idx ON analytics_tracking (user_id);
+CREATE INDEX analytics_tracking_category_id_idx ON analytics_tracking (category_id);
+CREATE INDEX analytics_tracking_company_id_idx ON analytics_tracking (company_id);
+CREATE INDEX analytics_tracking_product_id_idx ON analytics_tracking (product_id);
+"""
+
+
+CREATE_PARTITION_SQL = (
+    "CREATE TABLE analytics_tracking_p{month:%Y_%m} PARTITION OF analytics_tracking "
+    "FOR VALUES FROM (%s) TO (%s)"
+)
+
+
+def _add_months(month, months):
+    year, month_index = divmod(month.year * 12 + month.month - 1 + months, 12)
+    return date(year, month_index + 1, 1)
+
+
+def _create_partitions(cursor, first_month):
+    current_month = datetime.now(pytz.utc).date().replace(day=1)
+    month = min(first_month or current_month, current_month)
+    while month <= _add_months(current_month, PARTITIONS_AHEAD):
+        next_month = _add_months(month, 1)
+        cursor.execute(
+            CREATE_PARTITION_SQL.format(month=month),
+            [
+                datetime(month.year, month.month, 1, tzinfo=pytz.utc),
+                datetime(next_month.year, next_month.month, 1, tzinfo=pytz.utc),
+            ],
+        )
+        month = next_month
+
+
+def partition_tracking(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(PARTITION_TRACKING_SQL)
+        cursor.execute("SELECT min(date) FROM analytics_tracking_unpartitioned")
+        first_date = cursor.fetchone()[0]
+        _create_partitions(
+            cursor, first_date.date().replace(day=1) if first_date else None
+        )
+        cursor.execute(
+            "INSERT INTO analytics_tracking "
+            "SELECT * FROM analytics_tracking_unpartitioned"
+        )
+        cursor.execute("DROP TABLE analytics_tracking_unpartitioned")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0002_tracking_stats'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tracking',
+            name='date',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+        migrations.RunPython(partition_tracking, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='tracking',
+            index=models.Index(fields=['date', 'id'], name='tracking_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tracking',
+            index=models.Index(fields=['type', 'date'], name='tracking_type_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tracking',
+            index=models.Index(fields=['country', 'id'], name='tracking_country_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tracking',
+            index=models.Index(fields=['device_type', 'id'], name='tracking_device_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tracking',
+            index=models.Index(fields=['browser', 'id'], name='tracking_browser_idx'),
+        ),
+    ]
@@ -59,3 +59,59 @@ class Tracking(ModelWithMetadata):
         permissions = (
             (AnalyticsPermissions.MANAGE_TRACKING.codename, "Manage tracking."),
         )
+        # The table is partitioned by the date on PostgreSQL, see `partitions`.
+        indexes = [
+            models.Index(fields=["date", "id"], name="tracking_date_idx"),
+            models.Index(fields=["type", "date"], name="tracking_type_date_idx"),
+            models.Index(fields=["country", "id"], name="tracking_country_idx"),
+            models.Index(
+                fields=["device_type", "id"], name="tracking_device_type_idx"
+            ),
+            models.Index(fields=["browser", "id"], name="tracking_browser_idx"),
+        ]
+
+
+class TrackingStats(models.Model):
+    """Number of the tracked views aggregated per period and dimensions."""
+
+    period_start = models.DateTimeField()
+    type = models.CharField(max_length=255)
+    # Primary key of the category, company or product, depending on the type.
+    item_id = models.PositiveIntegerField(blank=True, null=True)
+    country = models.CharField(max_length=255, blank=True)
+    device_type = models.CharField(max_length=255, blank=True)
+    referrer_host = models.CharField(max_length=255, blank=True)
+    views = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        abstract = True
+        ordering = ["period_start"]
+
+
+class HourlyTrackingStats(TrackingStats):
+    class Meta(TrackingStats.Meta):
+        indexes = [
+            models.Index(
+                fields=["type", "item_id", "period_start"],
+                name="hourly_stats_item_idx",
+            ),
+            models.Index(fields=["period_start"], name="hourly_stats_period_idx"),
+        ]
+
+
+class DailyTrackingStats(TrackingStats):
+    class Meta(TrackingStats.Meta):
+        indexes = [
+            models.Index(
+                fields=["type", "item_id", "period_start"],
+                name="daily_stats_item_idx",
+            ),
+            models.Index(fields=["period_start"], name="daily_stats_period_idx"),
+        ]
+
+
+class TrackingStatsWatermark(models.Model):
+    """The end of the trackings already rolled up into the stats."""
+
+    name = models.CharField(max_length=32, unique=True)
+    timestamp = models.DateTimeField(blank=True, null=True)
@@ -0,0 +1,202 @@
+"""Monthly partitions of the trackings table on PostgreSQL.
+
+The trackings are partitioned by their date, one partition per month, so that
+queries limited to the recent dates only scan the recent partitions. Rows that
+don't belong to any monthly partition, e.g. sent by clients with a wrong clock,
+are kept in the default partition.
+
+Partitions are created `TRACKING_PARTITIONS_AHEAD` months in advance. The ones
+older than `TRACKING_RETENTION_MONTHS` are detached, exported to gzipped CSV
+files in the default storage and dropped.
+"""
+import gzip
+import logging
+import re
+import tempfile
+from datetime import date, datetime
+from typing import List, Optional
+
+import pytz
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import Tracking
+
+logger = logging.getLogger(__name__)
+
+PARTITION_NAME_RE = re.compile(r"_p(?P<year>\d{4})_(?P<month>\d{2})$")
+
+
+def get_table_name() -> str:
+    return Tracking._meta.db_table
+
+
+def get_default_partition_name() -> str:
+    return f"{get_table_name()}_default"
+
+
+def get_partition_name(month: date) -> str:
+    return f"{get_table_name()}_p{month.year:04d}_{month.month:02d}"
+
+
+def get_month_start(value: datetime) -> date:
+    return value.date().replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    year, month_index = divmod(month.year * 12 + month.month - 1 + months, 12)
+    return date(year, month_index + 1, 1)
+
+
+def _get_bounds(month: date):
+    next_month = add_months(month, 1)
+    return (
+        datetime(month.year, month.month, 1, tzinfo=pytz.utc),
+        datetime(next_month.year, next_month.month, 1, tzinfo=pytz.utc),
+    )
+
+
+def is_partitioned() -> bool:
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table "
+            "WHERE partrelid = %s::regclass",
+            [get_table_name()],
+        )
+        return cursor.fetchone() is not None
+
+
+def get_partitions() -> List[date]:
+    """Return the months of the existing monthly partitions."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = %s::regclass",
+            [get_table_name()],
+        )
+        names = [name for name, in cursor.fetchall()]
+    months = []
+    for name in names:
+        match = PARTITION_NAME_RE.search(name)
+        if match:
+            months.append(date(int(match["year"]), int(match["month"]), 1))
+    return sorted(months)
+
+
+def create_partition(month: date):
+    """Create the partition of the month.
+
+    The partition is attached only after the rows of the month are moved to it
+    from the default partition, as PostgreSQL refuses to create a partition
+    for the rows that are already stored in the default one.
+    """
+    table = get_table_name()
+    partition = get_partition_name(month)
+    default_partition = get_default_partition_name()
+    start, end = _get_bounds(month)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TABLE {partition} (LIKE {table} INCLUDING DEFAULTS)"
+        )
+        cursor.execute(
+            f"WITH moved AS ("
+            f"DELETE FROM {default_partition} WHERE date >= %s AND date < %s "
+            f"RETURNING *"
+            f") INSERT INTO {partition} SELECT * FROM moved",
+            [start, end],
+        )
+        cursor.execute(
+            f"ALTER TABLE {table} ATTACH PARTITION {partition} "
+            f"FOR VALUES FROM (%s) TO (%s)",
+            [start, end],
+        )
+
+
+def create_partitions(
+    first_month: Optional[date] = None, months_ahead: Optional[int] = None
+) -> List[date]:
+    """Create the missing partitions up to the given number of months ahead."""
+    if months_ahead is None:
+        months_ahead = settings.TRACKING_PARTITIONS_AHEAD
+    current_month = get_month_start(timezone.now())
+    month = first_month or current_month
+    last_month = add_months(current_month, months_ahead)
+    existing = set(get_partitions())
+    created = []
+    while month <= last_month:
+        if month not in existing:
+            create_partition(month)
+            created.append(month)
+        month = add_months(month, 1)
+    return created
+
+
+def get_archive_path(month: date) -> str:
+    return (
+        f"{settings.TRACKING_ARCHIVE_PATH}/"
+        f"{get_partition_name(month)}.csv.gz"
+    )
+
+
+def export_partition(month: date) -> str:
+    """Export the rows of the partition to a gzipped CSV file in the storage."""
+    partition = get_partition_name(month)
+    with tempfile.TemporaryFile() as archive:
+        with gzip.GzipFile(fileobj=archive, mode="wb") as gzip_file:
+            with connection.cursor() as cursor:
+                cursor.copy_expert(
+                    f"COPY {partition} TO STDOUT WITH (FORMAT csv, HEADER)",
+                    gzip_file,
+                )
+        archive.seek(0)
+        return default_storage.save(get_archive_path(month), File(archive))
+
+
+def _alter_table(sql: str):
+    with transaction.atomic(), connection.cursor() as cursor:
+        # The deferred foreign key checks of the rows written earlier in the
+        # transaction would prevent altering the table.
+        cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+        cursor.execute(sql)
+
+
+def archive_partitions(retention_months: Optional[int] = None) -> List[date]:
+    """Detach, export and drop the partitions older than the retention period.
+
+    Partitions are detached first, so that no rows can be written to them after
+    they are exported. A partition whose export fails is left detached, with
+    its rows, for the export to be retried by hand.
+    """
+    if retention_months is None:
+        retention_months = settings.TRACKING_RETENTION_MONTHS
+    if not retention_months:
+        return []
+    oldest_month = add_months(get_month_start(timezone.now()), -retention_months)
+    archived = []
+    for month in get_partitions():
+        if month >= oldest_month:
+            break
+        partition = get_partition_name(month)
+        _alter_table(f"ALTER TABLE {get_table_name()} DETACH PARTITION {partition}")
+        try:
+            path = export_partition(month)
+        except Exception:
+            logger.exception("Cannot export the detached partition %s.", partition)
+            raise
+        _alter_table(f"DROP TABLE {partition}")
+        logger.info("Archived the trackings of %s to %s.", month, path)
+        archived.append(month)
+    return archived
+
+
+def maintain_partitions():
+    if not is_partitioned():
+        return
+    create_partitions()
+    archive_partitions()
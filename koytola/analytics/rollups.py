@@ -0,0 +1,171 @@
+"""Incremental rollups of the trackings into the hourly and daily stats.
+
+The hours are rolled up once they're over and `TRACKING_STATS_DELAY` seconds
+passed, so that the trackings still buffered by the workers are written first.
+The end of the last rolled up hour is stored as a watermark, every run picks
+up from it. Stats of a period are always recomputed as a whole, so rolling up
+the same hours again is safe. Periods are aligned to UTC.
+"""
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import List, Optional
+from urllib.parse import urlparse
+
+import pytz
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Min, Sum
+from django.db.models.functions import TruncDay
+from django.utils import timezone
+
+from . import TrackingTypes
+from .models import (
+    DailyTrackingStats,
+    HourlyTrackingStats,
+    Tracking,
+    TrackingStatsWatermark,
+)
+
+HOURLY_WATERMARK = "hourly"
+# Limits the time a single run takes when catching up with a long history.
+MAX_HOURS_PER_RUN = 24 * 7
+
+STATS_DIMENSIONS = ["country", "device_type", "referrer_host"]
+
+ITEM_FIELDS = {
+    TrackingTypes.CATEGORY: "category_id",
+    TrackingTypes.COMPANY: "company_id",
+    TrackingTypes.PRODUCT: "product_id",
+}
+
+
+def floor_hour(value: datetime) -> datetime:
+    return value.astimezone(pytz.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def floor_day(value: datetime) -> datetime:
+    return floor_hour(value).replace(hour=0)
+
+
+def get_referrer_host(referrer: str) -> str:
+    try:
+        return (urlparse(referrer).hostname or "")[:255]
+    except ValueError:
+        return ""
+
+
+def _aggregate_hour(start: datetime) -> List[HourlyTrackingStats]:
+    rows = (
+        Tracking.objects.filter(date__gte=start, date__lt=start + timedelta(hours=1))
+        .values(
+            "type",
+            "category_id",
+            "company_id",
+            "product_id",
+            "country",
+            "device_type",
+            "referrer",
+        )
+        .annotate(views=Count("id"))
+        .order_by()
+    )
+    # Referrers are grouped by the database, only their hosts are merged here.
+    views = Counter()
+    for row in rows.iterator():
+        tracking_type = row["type"].lower()
+        item_field = ITEM_FIELDS.get(tracking_type)
+        key = (
+            tracking_type,
+            row[item_field] if item_field else None,
+            row["country"],
+            row["device_type"],
+            get_referrer_host(row["referrer"]),
+        )
+        views[key] += row["views"]
+    return [
+        HourlyTrackingStats(
+            period_start=start,
+            type=tracking_type,
+            item_id=item_id,
+            country=country,
+            device_type=device_type,
+            referrer_host=referrer_host,
+            views=count,
+        )
+        for (
+            tracking_type,
+            item_id,
+            country,
+            device_type,
+            referrer_host,
+        ), count in views.items()
+    ]
+
+
+def rollup_days(start: datetime, end: datetime):
+    """Recompute the daily stats of the days in the range from the hourly ones."""
+    DailyTrackingStats.objects.filter(
+        period_start__gte=start, period_start__lt=end
+    ).delete()
+    rows = (
+        HourlyTrackingStats.objects.filter(
+            period_start__gte=start, period_start__lt=end
+        )
+        .annotate(day=TruncDay("period_start", tzinfo=pytz.utc))
+        .values("day", "type", "item_id", *STATS_DIMENSIONS)
+        .annotate(total=Sum("views"))
+        .order_by()
+    )
+    DailyTrackingStats.objects.bulk_create(
+        [
+            DailyTrackingStats(
+                period_start=row["day"],
+                type=row["type"],
+                item_id=row["item_id"],
+                country=row["country"],
+                device_type=row["device_type"],
+                referrer_host=row["referrer_host"],
+                views=row["total"],
+            )
+            for row in rows.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+def rollup_hours(start: datetime, end: datetime):
+    """Recompute the hourly stats of the hours in the range and their days."""
+    HourlyTrackingStats.objects.filter(
+        period_start__gte=start, period_start__lt=end
+    ).delete()
+    hour = start
+    while hour < end:
+        HourlyTrackingStats.objects.bulk_create(
+            _aggregate_hour(hour), batch_size=1000
+        )
+        hour += timedelta(hours=1)
+    rollup_days(floor_day(start), floor_day(end - timedelta(hours=1)) + timedelta(days=1))
+
+
+def update_tracking_stats(now: Optional[datetime] = None) -> Optional[datetime]:
+    """Roll up the trackings of the hours finished since the last run.
+
+    Return the new watermark, i.e. the end of the last rolled up hour.
+    """
+    now = now or timezone.now()
+    end = floor_hour(now - timedelta(seconds=settings.TRACKING_STATS_DELAY))
+    with transaction.atomic():
+        # Locked, so that concurrent runs don't roll up the same hours.
+        watermark, _ = TrackingStatsWatermark.objects.select_for_update().get_or_create(
+            name=HOURLY_WATERMARK
+        )
+        start = watermark.timestamp
+        if start is None:
+            first_date = Tracking.objects.aggregate(first_date=Min("date"))["first_date"]
+            start = floor_hour(first_date) if first_date else end
+        end = min(end, start + timedelta(hours=MAX_HOURS_PER_RUN))
+        if start < end:
+            rollup_hours(start, end)
+            watermark.timestamp = end
+            watermark.save(update_fields=["timestamp"])
+    return watermark.timestamp
@@ -0,0 +1,13 @@
+from ..celeryconf import app
+from .partitions import maintain_partitions
+from .rollups import update_tracking_stats
+
+
+@app.task
+def update_tracking_stats_task():
+    update_tracking_stats()
+
+
+@app.task
+def maintain_tracking_partitions_task():
+    maintain_partitions()
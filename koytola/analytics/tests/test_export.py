@@ -0,0 +1,74 @@
+import csv
+import gzip
+import io
+from datetime import date, datetime
+
+import pytz
+
+from .. import TrackingTypes
+from ..export import (
+    EXPORT_FIELDS,
+    export_trackings,
+    get_export_queryset,
+    iter_gzip_csv,
+    iter_rows,
+)
+from ..models import Tracking
+
+
+def _create_tracking(date, **kwargs):
+    tracking = Tracking.objects.create(**kwargs)
+    Tracking.objects.filter(pk=tracking.pk).update(date=date)
+    return tracking
+
+
+def _read_csv(data):
+    return list(csv.reader(io.StringIO(gzip.decompress(data).decode())))
+
+
+def test_export_trackings_split_by_day(db, tmpdir):
+    first = _create_tracking(
+        datetime(2021, 7, 5, 10, tzinfo=pytz.utc),
+        type=TrackingTypes.PRODUCT,
+        parameters={"source": "search"},
+    )
+    second = _create_tracking(
+        datetime(2021, 7, 6, 10, tzinfo=pytz.utc), type=TrackingTypes.PRODUCT
+    )
+    _create_tracking(
+        datetime(2021, 7, 6, 11, tzinfo=pytz.utc), type=TrackingTypes.COMPANY
+    )
+
+    paths = export_trackings(
+        str(tmpdir), types=[TrackingTypes.PRODUCT], chunk_size=1
+    )
+
+    assert paths == [
+        str(tmpdir.join("date=2021-07-05", "trackings.csv.gz")),
+        str(tmpdir.join("date=2021-07-06", "trackings.csv.gz")),
+    ]
+    with open(paths[0], "rb") as export_file:
+        rows = _read_csv(export_file.read())
+    assert rows[0] == EXPORT_FIELDS
+    assert [row[0] for row in rows[1:]] == [str(first.pk)]
+    assert rows[1][EXPORT_FIELDS.index("parameters")] == '{"source": "search"}'
+    with open(paths[1], "rb") as export_file:
+        assert [row[0] for row in _read_csv(export_file.read())[1:]] == [
+            str(second.pk)
+        ]
+
+
+def test_iter_gzip_csv_filtered_by_date(db):
+    _create_tracking(datetime(2021, 7, 4, 23, tzinfo=pytz.utc))
+    trackings = [
+        _create_tracking(datetime(2021, 7, 5, hour, tzinfo=pytz.utc))
+        for hour in range(3)
+    ]
+    queryset = get_export_queryset(
+        date_from=date(2021, 7, 5), date_to=date(2021, 7, 5)
+    )
+
+    data = b"".join(iter_gzip_csv(iter_rows(queryset), flush_every=2))
+
+    rows = _read_csv(data)
+    assert [row[0] for row in rows[1:]] == [str(tracking.pk) for tracking in trackings]
@@ -0,0 +1,119 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from .. import TrackingTypes
+from ..ingestion import (
+    TrackingBuffer,
+    build_trackings,
+    get_request_details,
+    tracking_buffer,
+)
+from ..models import Tracking
+from ..utils import _parse_user_agent, parse_user_agent
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/86.0.4240.75 Safari/537.36"
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_tracking_buffer(settings):
+    settings.TRACKING_BATCH_SIZE = 10
+    settings.TRACKING_BUFFER_SIZE = 20
+    settings.TRACKING_FLUSH_INTERVAL = 3600
+    tracking_buffer.clear()
+    yield
+    tracking_buffer.clear()
+
+
+def test_get_request_details(rf, customer_user):
+    request = rf.get(
+        "/", HTTP_USER_AGENT=USER_AGENT, REMOTE_ADDR="8.8.8.8", HTTP_REFERER="/a"
+    )
+    request.user = customer_user
+
+    details = get_request_details(request)
+
+    assert details["ip"] == "8.8.8.8"
+    assert details["country"] == "US"
+    assert details["referrer"] == "/a"
+    assert details["browser"] == "Chrome"
+    assert details["device_type"] == "PC"
+    assert details["user_id"] == customer_user.pk
+
+
+def test_build_trackings(product):
+    events = [{"product_id": product.pk}, {"referrer": "/b"}]
+
+    trackings = build_trackings(events, {"ip": "8.8.8.8", "referrer": "/a"})
+
+    assert trackings[0].type == TrackingTypes.PRODUCT
+    assert trackings[0].product_id == product.pk
+    assert trackings[0].referrer == "/a"
+    assert trackings[1].type == TrackingTypes.OTHER
+    assert trackings[1].referrer == "/b"
+
+
+def test_buffer_flushed_once_batch_is_full(db):
+    tracking_buffer.add(build_trackings([{}] * 9, {}))
+    assert Tracking.objects.count() == 0
+
+    tracking_buffer.add(build_trackings([{}], {}))
+
+    assert Tracking.objects.count() == 10
+    assert len(tracking_buffer) == 0
+
+
+def test_buffer_drops_events_when_full(db):
+    with patch.object(tracking_buffer, "flush"):
+        assert tracking_buffer.add(build_trackings([{}] * 15, {})) == 15
+        assert tracking_buffer.add(build_trackings([{}] * 10, {})) == 5
+
+    assert tracking_buffer.dropped == 5
+    assert tracking_buffer.flush() == 20
+
+
+def test_buffer_flushed_by_background_thread(settings):
+    settings.TRACKING_FLUSH_INTERVAL = 0.01
+    buffer = TrackingBuffer()
+    flushed = threading.Event()
+
+    def flush(blocking=True):
+        if threading.current_thread().name == "tracking-flusher":
+            buffer.clear()
+            flushed.set()
+        return 0
+
+    with patch.object(buffer, "flush", side_effect=flush):
+        buffer.add(build_trackings([{}], {}))
+        assert flushed.wait(timeout=5)
+
+    assert len(buffer) == 0
+
+
+def test_buffer_flush_clears_missing_relations(product):
+    trackings = build_trackings([{"product_id": product.pk}, {"product_id": -1}], {})
+    tracking_buffer.add(trackings)
+
+    assert tracking_buffer.flush() == 2
+
+    assert set(Tracking.objects.values_list("product_id", flat=True)) == {
+        product.pk,
+        None,
+    }
+
+
+def test_parse_user_agent():
+    _parse_user_agent.cache_clear()
+
+    details = parse_user_agent(USER_AGENT)
+    parse_user_agent(USER_AGENT)
+
+    assert details.browser == "Chrome"
+    assert details.browser_version == "86.0.4240"
+    assert details.system == "Windows"
+    assert details.device_type == "PC"
+    assert _parse_user_agent.cache_info().hits == 1
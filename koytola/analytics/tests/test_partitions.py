@@ -0,0 +1,72 @@
+import gzip
+from datetime import date, datetime
+
+import pytest
+import pytz
+from django.core.files.storage import default_storage
+from django.db import connection
+
+from ..models import Tracking
+from ..partitions import (
+    add_months,
+    archive_partitions,
+    create_partition,
+    get_partition_name,
+    get_partitions,
+    is_partitioned,
+)
+
+
+def _count_rows(table):
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT count(*) FROM {table}")
+        return cursor.fetchone()[0]
+
+
+def _create_tracking(date):
+    tracking = Tracking.objects.create()
+    Tracking.objects.filter(pk=tracking.pk).update(date=date)
+    return tracking
+
+
+def test_add_months():
+    assert add_months(date(2021, 11, 1), 2) == date(2022, 1, 1)
+    assert add_months(date(2021, 1, 1), -1) == date(2020, 12, 1)
+
+
+def test_get_partition_name():
+    assert get_partition_name(date(2021, 7, 1)) == "analytics_tracking_p2021_07"
+
+
+@pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Partitioning requires PostgreSQL."
+)
+def test_create_partition_moves_rows_from_default_partition(db):
+    assert is_partitioned()
+    tracking = _create_tracking(datetime(2031, 1, 15, tzinfo=pytz.utc))
+
+    create_partition(date(2031, 1, 1))
+
+    assert date(2031, 1, 1) in get_partitions()
+    assert _count_rows("analytics_tracking_p2031_01") == 1
+    assert Tracking.objects.get().pk == tracking.pk
+
+
+@pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Partitioning requires PostgreSQL."
+)
+def test_archive_partitions(db, media_root):
+    create_partition(date(2000, 1, 1))
+    tracking = _create_tracking(datetime(2000, 1, 15, tzinfo=pytz.utc))
+
+    archived = archive_partitions(retention_months=1)
+
+    assert archived == [date(2000, 1, 1)]
+    assert date(2000, 1, 1) not in get_partitions()
+    assert not Tracking.objects.exists()
+    with default_storage.open(
+        "tracking-archive/analytics_tracking_p2000_01.csv.gz"
+    ) as archive:
+        lines = gzip.decompress(archive.read()).decode().splitlines()
+    assert lines[0].startswith("id,")
+    assert lines[1].startswith(f"{tracking.pk},")
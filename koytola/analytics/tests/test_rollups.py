@@ -0,0 +1,79 @@
+from datetime import datetime
+
+import pytz
+
+from .. import TrackingTypes
+from ..models import (
+    DailyTrackingStats,
+    HourlyTrackingStats,
+    Tracking,
+    TrackingStatsWatermark,
+)
+from ..rollups import HOURLY_WATERMARK, get_referrer_host, update_tracking_stats
+
+NOW = datetime(2021, 7, 5, 10, 30, tzinfo=pytz.utc)
+
+
+def _create_tracking(date, **kwargs):
+    tracking = Tracking.objects.create(**kwargs)
+    Tracking.objects.filter(pk=tracking.pk).update(date=date)
+
+
+def test_get_referrer_host():
+    assert get_referrer_host("https://example.com/products/1/") == "example.com"
+    assert get_referrer_host("/products/1/") == ""
+    assert get_referrer_host("") == ""
+
+
+def test_update_tracking_stats(product, settings):
+    settings.TRACKING_STATS_DELAY = 300
+    for minute in [5, 10]:
+        _create_tracking(
+            NOW.replace(hour=8, minute=minute),
+            type=TrackingTypes.PRODUCT,
+            product=product,
+            country="PL",
+            referrer="https://example.com/a",
+        )
+    _create_tracking(
+        NOW.replace(hour=9, minute=5),
+        type=TrackingTypes.PRODUCT,
+        product=product,
+        country="US",
+        referrer="https://example.com/b",
+    )
+    # The current hour isn't over yet.
+    _create_tracking(NOW, type=TrackingTypes.PRODUCT, product=product)
+
+    watermark = update_tracking_stats(now=NOW)
+
+    assert watermark == NOW.replace(minute=0)
+    hourly_stats = HourlyTrackingStats.objects.filter(item_id=product.pk)
+    assert [
+        (stats.period_start.hour, stats.country, stats.views)
+        for stats in hourly_stats
+    ] == [(8, "PL", 2), (9, "US", 1)]
+    assert hourly_stats[0].referrer_host == "example.com"
+    daily_stats = DailyTrackingStats.objects.get(item_id=product.pk, country="PL")
+    assert daily_stats.views == 2
+
+
+def test_update_tracking_stats_continues_from_watermark(product, settings):
+    settings.TRACKING_STATS_DELAY = 300
+    TrackingStatsWatermark.objects.create(
+        name=HOURLY_WATERMARK, timestamp=NOW.replace(hour=9, minute=0)
+    )
+    _create_tracking(
+        NOW.replace(hour=8), type=TrackingTypes.PRODUCT, product=product
+    )
+    _create_tracking(
+        NOW.replace(hour=9), type=TrackingTypes.PRODUCT, product=product
+    )
+
+    update_tracking_stats(now=NOW)
+    update_tracking_stats(now=NOW)
+
+    stats = HourlyTrackingStats.objects.get()
+    assert stats.period_start.hour == 9
+    assert stats.views == 1
+    assert DailyTrackingStats.objects.get().views == 1
@@ -0,0 +1,66 @@
+from functools import lru_cache
+from typing import NamedTuple
+
+from django.conf import settings
+from user_agents import parse
+
+from .models import Tracking
+
+# Longer User-Agent headers are cut, so that the cache keys stay small.
+MAX_USER_AGENT_LENGTH = 512
+
+
+class UserAgentDetails(NamedTuple):
+    device_type: str
+    device: str
+    browser: str
+    browser_version: str
+    system: str
+    system_version: str
+
+
+def get_device_type(data):
+    if data.is_bot:
+        device_type = "Bot"
+    elif data.is_email_client:
+        device_type = "Email Client"
+    elif data.is_mobile:
+        device_type = "Mobile"
+    elif data.is_pc:
+        device_type = "PC"
+    elif data.is_tablet:
+        device_type = "Tablet"
+    elif data.is_touch_capable:
+        device_type = "Touch Device"
+    else:
+        device_type = "Unknown"
+    return device_type
+
+
+@lru_cache(maxsize=settings.USER_AGENT_CACHE_SIZE)
+def _parse_user_agent(user_agent: str) -> UserAgentDetails:
+    ua_data = parse(user_agent)
+    details = UserAgentDetails(
+        device_type=get_device_type(ua_data),
+        device=ua_data.device.family,
+        browser=ua_data.browser.family,
+        browser_version=ua_data.browser.version_string,
+        system=ua_data.os.family,
+        system_version=ua_data.os.version_string,
+    )
+    return UserAgentDetails(
+        *[
+            (value or "")[: Tracking._meta.get_field(field).max_length]
+            for field, value in zip(UserAgentDetails._fields, details)
+        ]
+    )
+
+
+def parse_user_agent(user_agent: str) -> UserAgentDetails:
+    """Return the device, browser and system details of the User-Agent header.
+
+    Parsing runs a number of regular expressions, so the results are kept in an
+    LRU cache of `USER_AGENT_CACHE_SIZE` entries. The values are already cut to
+    the lengths of the tracking fields.
+    """
+    return _parse_user_agent((user_agent or "")[:MAX_USER_AGENT_LENGTH])
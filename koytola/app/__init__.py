@@ -0,0 +1 @@
+default_app_config = "koytola.app.apps.AppAppConfig"
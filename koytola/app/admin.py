@@ -1,13 +1,13 @@
 from django.contrib import admin
 from .models import App, AppToken
-from ..core.utils import download_csv
+from ..core.utils.export import download_csv, download_jsonl, download_xlsx
 
 
 class AppAdmin(admin.ModelAdmin):
     list_display = ["id", "name", "created", "is_active", "type", "identifier", "about_app", "version"]
     search_fields = ["name", "type", "about_app"]
     list_filter = ["created", "is_active", "permissions"]
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["name"]
@@ -17,7 +17,8 @@ class AppTokenAdmin(admin.ModelAdmin):
     list_display = ["id", "app", "name", "auth_token"]
     search_fields = ["app", "name"]
     list_filter = []
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
+    export_exclude = ["auth_token"]
 
     def get_ordering(self, request):
         return ["app"]
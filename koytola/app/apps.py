@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class AppAppConfig(AppConfig):
+    name = "koytola.app"
+
+    def ready(self):
+        from .signals import connect_signals
+
+        connect_signals()
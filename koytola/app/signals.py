@@ -0,0 +1,42 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from .models import App, AppToken
+from .utils import invalidate_app_tokens
+
+M2M_CHANGE_ACTIONS = ("post_add", "post_remove", "pre_clear")
+
+
+def _invalidate_token(instance, **_kwargs):
+    invalidate_app_tokens([instance.auth_token])
+
+
+def _invalidate_app(instance, **_kwargs):
+    invalidate_app_tokens(instance.tokens.values_list("auth_token", flat=True))
+
+
+def _invalidate_app_permissions(instance, action, reverse, pk_set, **_kwargs):
+    if action not in M2M_CHANGE_ACTIONS:
+        return
+    if not reverse:
+        tokens = instance.tokens.all()
+    elif action == "pre_clear":
+        tokens = AppToken.objects.filter(app__permissions=instance)
+    else:
+        tokens = AppToken.objects.filter(app__pk__in=pk_set)
+    invalidate_app_tokens(tokens.values_list("auth_token", flat=True))
+
+
+def connect_signals():
+    post_save.connect(
+        _invalidate_token, sender=AppToken, dispatch_uid="invalidate_app_token"
+    )
+    post_delete.connect(
+        _invalidate_token, sender=AppToken, dispatch_uid="invalidate_app_token"
+    )
+    # Tokens of deleted apps are deleted, and invalidated, along with them.
+    post_save.connect(_invalidate_app, sender=App, dispatch_uid="invalidate_app")
+    m2m_changed.connect(
+        _invalidate_app_permissions,
+        sender=App.permissions.through,
+        dispatch_uid="invalidate_app_permissions",
+    )
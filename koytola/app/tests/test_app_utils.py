@@ -0,0 +1,75 @@
+from ...core.permissions import AppPermission
+from ..utils import get_app_by_token
+
+
+def test_get_app_by_token_uses_cached_app(
+    app, permission_manage_apps, django_assert_num_queries
+):
+    app.permissions.add(permission_manage_apps)
+    auth_token = app.tokens.get().auth_token
+    get_app_by_token(auth_token)
+
+    with django_assert_num_queries(0):
+        cached_app = get_app_by_token(auth_token)
+        assert cached_app.has_perms([AppPermission.MANAGE_APPS])
+
+    assert cached_app.pk == app.pk
+
+
+def test_get_app_by_token_unknown_token():
+    assert get_app_by_token("unknown") is None
+
+
+def test_get_app_by_token_new_token(app):
+    assert get_app_by_token("new-token") is None
+
+    app.tokens.create(auth_token="new-token")
+
+    assert get_app_by_token("new-token").pk == app.pk
+
+
+def test_get_app_by_token_deleted_token(app):
+    token = app.tokens.get()
+    get_app_by_token(token.auth_token)
+
+    token.delete()
+
+    assert get_app_by_token(token.auth_token) is None
+
+
+def test_get_app_by_token_deactivated_app(app):
+    auth_token = app.tokens.get().auth_token
+    get_app_by_token(auth_token)
+
+    app.is_active = False
+    app.save(update_fields=["is_active"])
+
+    assert get_app_by_token(auth_token) is None
+
+
+def test_get_app_by_token_permissions_changed(app, permission_manage_apps):
+    auth_token = app.tokens.get().auth_token
+    assert not get_app_by_token(auth_token).has_perms([AppPermission.MANAGE_APPS])
+
+    app.permissions.add(permission_manage_apps)
+
+    assert get_app_by_token(auth_token).has_perms([AppPermission.MANAGE_APPS])
+
+
+def test_get_app_by_token_restores_fields(app, django_assert_num_queries):
+    app.identifier = "koytola.app.sample"
+    app.about_app = "About"
+    app.save(update_fields=["identifier", "about_app"])
+    auth_token = app.tokens.get().auth_token
+    get_app_by_token(auth_token)
+
+    with django_assert_num_queries(0):
+        cached_app = get_app_by_token(auth_token)
+        assert cached_app.name == app.name
+        assert cached_app.is_active is True
+        assert cached_app.type == app.type
+        assert cached_app.identifier == "koytola.app.sample"
+
+    # Fields missing from the snapshot are loaded on first access.
+    assert cached_app.get_deferred_fields()
+    assert cached_app.about_app == "About"
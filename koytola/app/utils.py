@@ -0,0 +1,68 @@
+import hashlib
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import DEFERRED
+
+from .models import App
+
+APP_TOKEN_KEY_PREFIX = "koytola:app-token:"
+
+# Fields kept in the cached snapshots of the apps, the remaining fields are
+# loaded from the database on first access.
+APP_FIELDS = ("id", "name", "is_active", "type", "identifier")
+
+
+def _get_app_token_key(auth_token: str) -> str:
+    # Tokens are hashed, so that they are never stored in the cache as they are.
+    return APP_TOKEN_KEY_PREFIX + hashlib.sha256(auth_token.encode()).hexdigest()
+
+
+def _build_app_snapshot(auth_token: str) -> dict:
+    app = App.objects.filter(tokens__auth_token=auth_token, is_active=True).first()
+    if app is None:
+        # Unknown tokens are cached as well, so that they don't hit the database.
+        return {}
+    return {
+        "fields": {field: getattr(app, field) for field in APP_FIELDS},
+        "permissions": app.get_permissions(),
+    }
+
+
+def get_app_by_token(auth_token: str) -> Optional[App]:
+    """Return the active app which owns the given token.
+
+    Apps are cached together with their permissions, so authenticating an app
+    and checking its permissions doesn't query the database.
+    """
+    key = _get_app_token_key(auth_token)
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = _build_app_snapshot(auth_token)
+        cache.set(key, snapshot, timeout=settings.APP_TOKEN_CACHE_TTL)
+    if not snapshot:
+        return None
+    # `from_db` expects the values in the order of the concrete fields.
+    fields = App._meta.concrete_fields
+    app = App.from_db(
+        App.objects.db,
+        [field.attname for field in fields],
+        [snapshot["fields"].get(field.attname, DEFERRED) for field in fields],
+    )
+    app._app_perm_cache = set(snapshot["permissions"])
+    return app
+
+
+def invalidate_app_tokens(auth_tokens: Iterable[str]):
+    """Drop the cached apps of the given tokens.
+
+    Entries are dropped again after the commit, as concurrent requests could
+    have cached the data which is being changed.
+    """
+    keys = [_get_app_token_key(auth_token) for auth_token in auth_tokens]
+    if not keys:
+        return
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
@@ -1,6 +1,6 @@
 from django.contrib import admin
 from .models import Blog, BlogCategory, BlogImages
-from ..core.utils import download_csv
+from ..core.utils.export import download_csv, download_jsonl, download_xlsx
 
 
 class BlogAdmin(admin.ModelAdmin):
@@ -9,7 +9,7 @@ class BlogAdmin(admin.ModelAdmin):
     ]
     search_fields = ["slug", "title", "description", "content"]
     list_filter = ["is_published", "creation_date", "publication_date", "update_date"]
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-creation_date"]
@@ -1,6 +1,9 @@
 import os
 
 from celery import Celery
+from celery.signals import task_postrun, task_prerun, worker_init
+
+from .core.metrics import record_task_end, record_task_start, start_worker_server
 
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "koytola.settings")
@@ -9,3 +12,7 @@ app = Celery("koytola")
 
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
+
+task_prerun.connect(record_task_start)
+task_postrun.connect(record_task_end)
+worker_init.connect(start_worker_server)
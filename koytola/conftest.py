@@ -0,0 +1,12 @@
+import pytest
+
+from .core.cache import clear_versioned_caches
+
+
+@pytest.fixture(autouse=True)
+def clear_versioned_caches_between_tests():
+    # The caches are shared by the whole process, and the stamps bumped by the
+    # previous tests are only bumped on commit, which never happens in tests.
+    clear_versioned_caches()
+    yield
+    clear_versioned_caches()
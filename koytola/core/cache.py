@@ -0,0 +1,126 @@
+"""Version-stamped caches shared between the application processes.
+
+A version stamp is a counter kept in the default Django cache. Writers bump it
+whenever the underlying data changes and readers compare it with the version
+their copy was built from. Checking a stamp costs a single cache lookup, so
+the expensive queries only run again after the data has actually changed.
+
+Stamps are only shared between the workers when the default cache is shared
+as well (e.g. Redis configured with `CACHE_URL`).
+"""
+import threading
+import time
+import weakref
+from typing import Callable, Dict, Generic, Iterable, Optional, TypeVar
+
+from django.core.cache import cache
+from django.db import transaction
+
+from .metrics import record_local_cache
+
+T = TypeVar("T")
+
+VERSION_KEY_PREFIX = "koytola:version:"
+
+_versioned_caches: "weakref.WeakSet[VersionedCache]" = weakref.WeakSet()
+
+
+def _get_version_key(name: str) -> str:
+    return VERSION_KEY_PREFIX + name
+
+
+def _initial_version() -> int:
+    # Stamps start from the current time, so a stamp evicted from the cache
+    # never comes back with a value that some process has already seen.
+    return int(time.time() * 1000)
+
+
+def get_version(name: str) -> int:
+    """Return the current version stamp of the given name."""
+    key = _get_version_key(name)
+    version = cache.get(key)
+    if version is None:
+        version = _initial_version()
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key, version)
+    return version
+
+
+def get_versions(names: Iterable[str]) -> Dict[str, int]:
+    """Return the current version stamps of the given names at once."""
+    keys = {_get_version_key(name): name for name in names}
+    versions = {
+        keys[key]: version for key, version in cache.get_many(list(keys)).items()
+    }
+    for name in keys.values():
+        if name not in versions:
+            versions[name] = get_version(name)
+    return versions
+
+
+def bump_version(name: str, immediately: bool = False):
+    """Invalidate everything built from the previous version of the given name.
+
+    The stamp is bumped once the current transaction commits, so that other
+    processes can't rebuild their copies from the data that isn't visible yet.
+    With `immediately` it's bumped right away as well, so that the current
+    transaction doesn't keep using the data built before its changes.
+    """
+
+    def _bump():
+        key = _get_version_key(name)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, _initial_version(), timeout=None)
+
+    if immediately:
+        _bump()
+    transaction.on_commit(_bump)
+
+
+class VersionedCache(Generic[T]):
+    """Process-local value rebuilt whenever its version stamp changes."""
+
+    def __init__(self, name: str, builder: Callable[[], T]):
+        self.name = name
+        self.builder = builder
+        self._lock = threading.Lock()
+        self._version: Optional[int] = None
+        self._value: Optional[T] = None
+        _versioned_caches.add(self)
+
+    def get(self) -> T:
+        version = get_version(self.name)
+        hit = self._version == version
+        if not hit:
+            with self._lock:
+                if self._version != version:
+                    # The version is read before the value is built, so a
+                    # concurrent bump results in another rebuild later on.
+                    self._value = self.builder()
+                    self._version = version
+        record_local_cache(self.name, hit)
+        return self._value  # type: ignore
+
+    def invalidate(self):
+        bump_version(self.name)
+
+    def clear(self):
+        """Drop the local copy without bumping the shared version stamp."""
+        with self._lock:
+            self._version = None
+            self._value = None
+
+
+def clear_versioned_caches():
+    """Drop the local copies of all the versioned caches and their stamps.
+
+    Meant for the tests, whose transactions are rolled back without running
+    the on-commit callbacks that bump the stamps.
+    """
+    names = set()
+    for versioned_cache in list(_versioned_caches):
+        versioned_cache.clear()
+        names.add(versioned_cache.name)
+    cache.delete_many([_get_version_key(name) for name in names])
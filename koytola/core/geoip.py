@@ -0,0 +1,124 @@
+"""GeoIP lookups shared by the country middleware, the site and the analytics.
+
+The bundled GeoLite2 snapshot is used unless `GEOIP_PATH` points to a MaxMind
+database file. That file is memory-mapped and reopened once it changes, e.g.
+after `geoipupdate` replaced it, without restarting the application servers.
+Results of the lookups are kept in an LRU cache of `GEOIP_CACHE_SIZE` entries.
+"""
+import logging
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+import maxminddb
+from django.conf import settings
+from geolite2 import geolite2
+
+logger = logging.getLogger(__name__)
+
+
+class GeoData(NamedTuple):
+    country: str
+    region: str
+    city: str
+    postal: str
+    location: Dict[str, Any]
+
+
+class _Database(NamedTuple):
+    path: Optional[str]
+    mtime: Optional[float]
+    lookup: Callable[[str], Optional[GeoData]]
+
+
+def _get_name(record: dict) -> str:
+    return record.get("names", {}).get("en", "")
+
+
+def _parse_record(record: Optional[dict]) -> Optional[GeoData]:
+    if not record:
+        return None
+    subdivisions = record.get("subdivisions") or [{}]
+    return GeoData(
+        country=record.get("country", {}).get("iso_code", ""),
+        region=_get_name(subdivisions[0]),
+        city=_get_name(record.get("city", {})),
+        postal=record.get("postal", {}).get("code", ""),
+        location=record.get("location", {}),
+    )
+
+
+def _open_database() -> _Database:
+    path = settings.GEOIP_PATH
+    if path:
+        mtime = os.stat(path).st_mtime
+        reader = maxminddb.open_database(path, maxminddb.MODE_MMAP)
+    else:
+        mtime = None
+        reader = geolite2.reader()
+
+    @lru_cache(maxsize=settings.GEOIP_CACHE_SIZE)
+    def lookup(ip_address: str) -> Optional[GeoData]:
+        return _parse_record(reader.get(ip_address))
+
+    return _Database(path, mtime, lookup)
+
+
+class GeoIPService:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._database: Optional[_Database] = None
+        self._checked_at = 0.0
+
+    def _is_outdated(self, database: _Database) -> bool:
+        if database.path != settings.GEOIP_PATH:
+            return True
+        if not database.path:
+            return False
+        try:
+            return os.stat(database.path).st_mtime != database.mtime
+        except OSError:
+            # The file is being replaced, the current database is kept for now.
+            return False
+
+    def _get_database(self) -> _Database:
+        database = self._database
+        now = time.monotonic()
+        if database is None or now - self._checked_at >= settings.GEOIP_RELOAD_INTERVAL:
+            with self._lock:
+                database = self._database
+                if database is None or self._is_outdated(database):
+                    # The database is replaced along with its cache in a single
+                    # assignment, so that concurrent lookups never mix them.
+                    database = self._open_database(database)
+                    self._database = database
+                self._checked_at = now
+        return database
+
+    @staticmethod
+    def _open_database(current: Optional[_Database]) -> _Database:
+        try:
+            return _open_database()
+        except (OSError, maxminddb.InvalidDatabaseError):
+            if current is None:
+                raise
+            logger.exception("Cannot reload the GeoIP database, using the previous one")
+            return current
+
+    def lookup(self, ip_address: Optional[str]) -> Optional[GeoData]:
+        if not ip_address:
+            return None
+        try:
+            return self._get_database().lookup(ip_address)
+        except ValueError:
+            # Not a valid IP address.
+            return None
+
+    def reset(self):
+        with self._lock:
+            self._database = None
+
+
+geoip = GeoIPService()
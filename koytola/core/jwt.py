@@ -7,6 +7,7 @@ from django.conf import settings
 from django.core.handlers.wsgi import WSGIRequest
 
 from ..account.models import User
+from ..account.utils import cache_auth_user, get_cached_auth_user
 from ..app.models import App
 from .permissions import get_permission_names
 
@@ -98,7 +99,11 @@ def get_token_from_request(request: WSGIRequest) -> Optional[str]:
 
 
 def get_user_from_payload(payload: Dict[str, Any]) -> Optional[User]:
-    user = User.objects.filter(email=payload["email"], is_active=True).first()
+    user = get_cached_auth_user(payload.get("user_id"))
+    if user is None or user.email != payload["email"]:
+        user = User.objects.filter(email=payload["email"], is_active=True).first()
+        if user:
+            cache_auth_user(user)
     user_jwt_token = payload.get("token")
     if not user_jwt_token or not user:
         raise jwt.InvalidTokenError(
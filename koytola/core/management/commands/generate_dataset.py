@@ -0,0 +1,69 @@
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection
+
+from ...utils.synthetic_data import SCALE_UNIT, DatasetGenerator
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a deterministic synthetic dataset for the load tests. "
+        "One unit of the scale is %d products." % SCALE_UNIT["products"]
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--scale",
+            type=float,
+            default=1,
+            help="Size of the dataset, 100 generates a million products.",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Seed of the random values, the same seed gives the same dataset.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Number of the rows inserted at once.",
+        )
+        parser.add_argument(
+            "--end-date",
+            type=date.fromisoformat,
+            help="Date the generated dates are relative to, today by default.",
+        )
+
+    def make_database_faster(self):
+        """Skip waiting for the WAL flush on each commit of this session.
+
+        A crash can lose the last transactions but never corrupts the database,
+        which is fine for generated data.
+        """
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET synchronous_commit TO OFF")
+
+    def handle(self, *args, **options):
+        if options["scale"] <= 0:
+            raise CommandError("The scale must be positive.")
+        generator = DatasetGenerator(
+            scale=options["scale"],
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+            end_date=options["end_date"],
+        )
+        if generator.exists():
+            raise CommandError(
+                "The dataset has already been generated, run cleardb first."
+            )
+        self.make_database_faster()
+        started = time.monotonic()
+        for msg in generator.generate():
+            self.stdout.write(
+                "%s (%.1fs)" % (msg, time.monotonic() - started)
+            )
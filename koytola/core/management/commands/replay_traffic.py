@@ -0,0 +1,82 @@
+import json
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from ....graphql.replay import PERCENTILES, Replay, load_entries
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay the GraphQL traffic captured to GRAPHQL_CAPTURE_PATH against an API "
+        "and report the latency percentiles of each operation."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("path", help="JSON Lines file of the captured traffic.")
+        parser.add_argument(
+            "--url", required=True, help="URL of the GraphQL API to send requests to."
+        )
+        parser.add_argument(
+            "--concurrency", type=int, default=8, help="Number of concurrent requests."
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            help="Maximum number of requests per second, unlimited by default.",
+        )
+        parser.add_argument(
+            "--token", help="JWT access token sent with all the requests."
+        )
+        parser.add_argument(
+            "--operation",
+            action="append",
+            default=[],
+            dest="operations",
+            help="Replay only the given operation, can be repeated.",
+        )
+        parser.add_argument(
+            "--limit", type=int, help="Replay only the first requests of the capture."
+        )
+        parser.add_argument(
+            "--timeout", type=float, default=30, help="Timeout of a request in seconds."
+        )
+        parser.add_argument(
+            "--json", action="store_true", help="Print the results as JSON."
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with open(options["path"]) as f:
+                entries = load_entries(f, options["operations"])
+        except (OSError, ValueError, KeyError) as e:
+            raise CommandError("Cannot read the capture: %s" % e)
+        entries = list(islice(entries, options["limit"]))
+        if not entries:
+            raise CommandError("No requests to replay.")
+
+        replay = Replay(
+            options["url"],
+            concurrency=options["concurrency"],
+            rate=options["rate"],
+            token=options["token"],
+            timeout=options["timeout"],
+        )
+        stats = replay.run(entries)
+
+        if options["json"]:
+            self.stdout.write(json.dumps([item._asdict() for item in stats]))
+            return
+        self.stdout.write(
+            "%-40s %8s %7s " % ("operation", "requests", "errors")
+            + " ".join("%9s" % ("p%d ms" % percentile) for percentile in PERCENTILES)
+            + " %9s" % "max ms"
+        )
+        for item in stats:
+            self.stdout.write(
+                "%-40s %8d %7d " % (item.operation_name[:40], item.requests, item.errors)
+                + " ".join(
+                    "%9.1f" % item.percentiles[percentile] for percentile in PERCENTILES
+                )
+                + " %9.1f" % item.max_ms
+            )
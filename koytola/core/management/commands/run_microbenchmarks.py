@@ -0,0 +1,71 @@
+import json
+import logging
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from ... import microbenchmarks  # noqa: F401 registers the benchmarks
+from ...utils.microbenchmark import BENCHMARKS, run
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the operations per second and the memory allocated by the hot "
+        "helpers. Available benchmarks: %s." % ", ".join(sorted(BENCHMARKS))
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "names", nargs="*", help="Benchmarks to run, all of them by default."
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=5, help="Number of timed repetitions."
+        )
+        parser.add_argument(
+            "--min-time",
+            type=float,
+            default=0.2,
+            help="Minimum duration of a repetition in seconds.",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=float,
+            default=0.1,
+            help="Duration of the warm-up in seconds.",
+        )
+        parser.add_argument(
+            "--json", action="store_true", help="Print the results as JSON."
+        )
+
+    def handle(self, *args, **options):
+        # Some of the helpers log, e.g. the formatted errors.
+        logging.disable(logging.CRITICAL)
+        try:
+            results = run(
+                options["names"],
+                repeat=options["repeat"],
+                min_time=options["min_time"],
+                warmup=options["warmup"],
+            )
+        except KeyError as e:
+            raise CommandError(e.args[0])
+        finally:
+            logging.disable(logging.NOTSET)
+
+        if options["json"]:
+            self.stdout.write(json.dumps([result._asdict() for result in results]))
+            return
+        self.stdout.write(
+            "%-28s %14s %12s %12s %14s"
+            % ("benchmark", "ops/sec", "ns/op", "peak B/op", "retained B/op")
+        )
+        for result in results:
+            self.stdout.write(
+                "%-28s %14.0f %12.0f %12d %14.1f"
+                % (
+                    result.name,
+                    result.ops_per_sec,
+                    result.ns_per_op,
+                    result.peak_bytes,
+                    result.retained_bytes,
+                )
+            )
@@ -0,0 +1,152 @@
+"""Prometheus metrics of the API, database, caches, tasks and websockets.
+
+The metrics are kept in the default registry of `prometheus_client` and served
+at `/metrics/`. With several worker processes, the directory given by the
+`prometheus_multiproc_dir` environment variable makes the processes share
+their values through the files in it. It must be empty when the workers start,
+and the server should call `prometheus_client.multiprocess.mark_process_dead`
+when a worker exits, so that the websocket connections it held are dropped.
+
+Each deployment only serves the metrics of its own processes, so every one of
+them has to be scraped:
+
+* the WSGI and ASGI servers serve the API and websocket metrics at
+  `/metrics/`, the ASGI application routes it to Django like any request;
+* the Celery workers don't serve HTTP, they start a separate server on
+  `METRICS_WORKER_PORT` for the task metrics. Tasks run in the pool processes,
+  so a prefork worker needs `prometheus_multiproc_dir` as well. The port isn't
+  protected by `METRICS_TOKEN` and mustn't be reachable from the outside.
+
+The GraphQL operations are observed from their profiles (see
+`koytola.core.profiling`), hence the SQL queries, data loaders and shared
+cache lookups are only counted for the API requests.
+"""
+import os
+import re
+import threading
+import time
+from typing import Dict, Optional, Set
+
+from django.conf import settings
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    multiprocess,
+    start_http_server,
+)
+
+from .profiling import Profile
+
+OPERATION_NAME_PATTERN = re.compile(r"^[_A-Za-z][_0-9A-Za-z]*$")
+# Operation names are chosen by the clients, the ones seen after the limit is
+# reached are counted together.
+OTHER_OPERATIONS = "other"
+UNNAMED_OPERATION = "unnamed"
+
+GRAPHQL_OPERATION_DURATION = Histogram(
+    "koytola_graphql_operation_duration_seconds",
+    "Time spent executing the GraphQL operations.",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+SQL_QUERIES = Histogram(
+    "koytola_sql_queries_per_request",
+    "Number of the SQL queries run by a GraphQL operation.",
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+SQL_DURATION = Histogram(
+    "koytola_sql_duration_seconds_per_request",
+    "Time spent in the SQL queries of a GraphQL operation.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+DATALOADER_BATCH_SIZE = Histogram(
+    "koytola_dataloader_batch_size",
+    "Number of the keys loaded in a batch by the data loaders.",
+    ["loader"],
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+CACHE_LOOKUPS = Counter(
+    "koytola_cache_lookups",
+    "Lookups of the caches by their result.",
+    ["layer", "cache", "result"],
+)
+TASK_DURATION = Histogram(
+    "koytola_celery_task_duration_seconds",
+    "Time spent running the Celery tasks.",
+    ["task", "state"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+WEBSOCKET_CONNECTIONS = Gauge(
+    "koytola_websocket_connections",
+    "Number of the open websocket connections.",
+    ["consumer"],
+    multiprocess_mode="livesum",
+)
+
+_operations: Set[str] = set()
+_operations_lock = threading.Lock()
+# Start times of the tasks run by the current worker process, by task ID.
+_task_starts: Dict[str, float] = {}
+
+
+def get_operation_label(operation_name: Optional[str]) -> str:
+    if not operation_name:
+        return UNNAMED_OPERATION
+    if not OPERATION_NAME_PATTERN.match(operation_name):
+        return OTHER_OPERATIONS
+    if operation_name not in _operations:
+        with _operations_lock:
+            if len(_operations) >= settings.METRICS_MAX_OPERATIONS:
+                return OTHER_OPERATIONS
+            _operations.add(operation_name)
+    return operation_name
+
+
+def observe_operation(operation_name: Optional[str], profile: Profile):
+    GRAPHQL_OPERATION_DURATION.labels(get_operation_label(operation_name)).observe(
+        profile.duration
+    )
+    SQL_QUERIES.observe(profile.sql_count)
+    SQL_DURATION.observe(profile.sql_time)
+    for loader, sizes in profile.batches.items():
+        histogram = DATALOADER_BATCH_SIZE.labels(loader)
+        for size in sizes:
+            histogram.observe(size)
+    for cache, (hits, misses) in profile.caches.items():
+        if hits:
+            CACHE_LOOKUPS.labels("shared", cache, "hit").inc(hits)
+        if misses:
+            CACHE_LOOKUPS.labels("shared", cache, "miss").inc(misses)
+
+
+def record_local_cache(name: str, hit: bool):
+    CACHE_LOOKUPS.labels("local", name, "hit" if hit else "miss").inc()
+
+
+def record_task_start(task_id=None, **kwargs):
+    _task_starts[task_id] = time.perf_counter()
+
+
+def record_task_end(task_id=None, task=None, state=None, **kwargs):
+    start = _task_starts.pop(task_id, None)
+    if start is not None and task is not None:
+        TASK_DURATION.labels(task.name, state or "UNKNOWN").observe(
+            time.perf_counter() - start
+        )
+
+
+def start_worker_server(**kwargs):
+    """Serve the metrics of a Celery worker, which has no HTTP server."""
+    if settings.METRICS_ENABLED and settings.METRICS_WORKER_PORT:
+        start_http_server(settings.METRICS_WORKER_PORT, registry=get_registry())
+
+
+def get_registry() -> CollectorRegistry:
+    if "prometheus_multiproc_dir" not in os.environ:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
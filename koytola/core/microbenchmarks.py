@@ -0,0 +1,110 @@
+"""Fixed inputs of the micro-benchmarks, see `core.utils.microbenchmark`.
+
+The inputs are sized like the ones seen in production: a product description
+of a few dozen blocks, a cursor of the default product sorting and so on.
+"""
+from graphql.error import GraphQLError
+
+from ..graphql.core.connection import (
+    from_global_cursor,
+    get_field_value,
+    to_global_cursor,
+)
+from ..graphql.product import types as product_types
+from ..graphql.views import GraphQLView, obj_set
+from ..product.models import Category, Product
+from ..profile.models import Company
+from .exceptions import PermissionDenied
+from .utils import generate_unique_slug
+from .utils.draftjs import json_content_to_raw_text
+from .utils.editorjs import clean_editor_js
+from .utils.microbenchmark import register
+
+CURSOR_VALUES = ["Organic Dried Apricots", "12.50", None, 4821]
+TAGS = str(["organic", "dried fruit", "apricot", "turkey", "bulk", "private label"])
+
+
+def get_editor_js_content(blocks: int = 30) -> dict:
+    link = '<a href=\\"https://www.example.com/products/%d\\">product</a>'
+    content = []
+    for index in range(blocks):
+        if index % 5 == 4:
+            items = ["Item %d with %s" % (item, link % item) for item in range(5)]
+            content.append({"type": "list", "data": {"style": "ordered", "items": items}})
+        else:
+            text = "Paragraph %d of the description with a %s." % (index, link % index)
+            content.append({"type": "paragraph", "data": {"text": text}})
+    return {"time": 1600000000000, "blocks": content, "version": "2.18.0"}
+
+
+def get_draft_js_content(blocks: int = 30) -> dict:
+    return {
+        "blocks": [
+            {"key": "b%d" % index, "text": "  Block %d of the page  " % index}
+            for index in range(blocks)
+        ],
+        "entityMap": {},
+    }
+
+
+@register("to_global_cursor")
+def bench_to_global_cursor():
+    return lambda: to_global_cursor(CURSOR_VALUES)
+
+
+@register("from_global_cursor")
+def bench_from_global_cursor():
+    cursor = to_global_cursor(CURSOR_VALUES)
+    return lambda: from_global_cursor(cursor)
+
+
+@register("get_field_value")
+def bench_get_field_value():
+    category = Category(name="Dried Fruit")
+    company = Company(name="Anatolia Foods")
+    product = Product(name="Dried Apricots", category=category, company=company)
+    return lambda: get_field_value(product, "category__name")
+
+
+@register("clean_editor_js")
+def bench_clean_editor_js():
+    content = get_editor_js_content()
+    return lambda: clean_editor_js(content)
+
+
+@register("clean_editor_js_to_string")
+def bench_clean_editor_js_to_string():
+    content = get_editor_js_content()
+    return lambda: clean_editor_js(content, to_string=True)
+
+
+@register("json_content_to_raw_text")
+def bench_json_content_to_raw_text():
+    content = get_draft_js_content()
+    return lambda: json_content_to_raw_text(content)
+
+
+@register("generate_unique_slug")
+def bench_generate_unique_slug():
+    # Runs a query, which is part of the cost measured here.
+    product = Product(name="Organic Dried Apricots")
+    return lambda: generate_unique_slug(product, product.name)
+
+
+@register("resolve_tags")
+def bench_resolve_tags():
+    product = Product(tags=TAGS)
+    return lambda: product_types.Product.resolve_tags(product, None)
+
+
+@register("format_error")
+def bench_format_error():
+    error = GraphQLError("You do not have permission to perform this action")
+    error.original_error = PermissionDenied()
+    return lambda: GraphQLView.format_error(error)
+
+
+@register("obj_set")
+def bench_obj_set():
+    operations = {"query": "", "variables": {"input": {"images": [None] * 5}}}
+    return lambda: obj_set(operations, "variables.input.images.3", "3", False)
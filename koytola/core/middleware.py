@@ -2,12 +2,13 @@ import logging
 from datetime import datetime
 
 from django.conf import settings
-from django.contrib.sites.models import Site
 from django.utils import timezone
 from django.utils.functional import SimpleLazyObject
 from django_countries.fields import Country
 
 from ..plugins.manager import get_plugins_manager
+from ..plugins.webhook.tasks import webhook_batch
+from ..site.utils import get_current_site
 from .jwt import JWT_REFRESH_TOKEN_COOKIE_NAME, jwt_decode
 from .utils import get_client_ip, get_country_by_ip, get_currency_for_country
 
@@ -50,20 +51,15 @@ def currency(get_response):
 
 
 def site(get_response):
-    """Clear the Sites cache and assign the current site to `request.site`.
+    """Assign the current site to `request.site`.
 
-    By default django.contrib.sites caches Site instances at the module
-    level. This leads to problems when updating Site instances, as it's
-    required to restart all application servers in order to invalidate
-    the cache. Using this middleware solves this problem.
+    The site and its settings are cached by all the application servers and
+    rebuilt only when the version stamp of the site changes, so updates of the
+    site are visible everywhere without clearing the cache on every request.
     """
 
-    def _get_site():
-        Site.objects.clear_cache()
-        return Site.objects.get_current()
-
     def _site_middleware(request):
-        request.site = SimpleLazyObject(_get_site)
+        request.site = SimpleLazyObject(get_current_site)
         return get_response(request)
 
     return _site_middleware
@@ -77,6 +73,9 @@ def plugins(get_response):
 
     def _plugins_middleware(request):
         request.plugins = SimpleLazyObject(lambda: _get_manager())
+        if settings.WEBHOOK_BATCH_ENABLED:
+            with webhook_batch():
+                return get_response(request)
         return get_response(request)
 
     return _plugins_middleware
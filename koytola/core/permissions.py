@@ -1,7 +1,11 @@
 from enum import Enum
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Set
 
+from django.conf import settings
 from django.contrib.auth.models import Permission
+from django.core.cache import cache
+
+from .cache import bump_version, get_version, get_versions
 
 
 class BasePermissionEnum(Enum):
@@ -146,3 +150,93 @@ def get_permissions(permissions=None):
         .prefetch_related("content_type")
         .order_by("codename")
     )
+
+
+ALL_PERMISSIONS_VERSION_NAME = "permissions"
+PERMISSIONS_KEY_PREFIX = "koytola:permissions:"
+
+
+def get_user_permissions_version_name(user_pk) -> str:
+    return f"user-permissions:{user_pk}"
+
+
+def get_group_permissions_version_name(group_pk) -> str:
+    return f"group-permissions:{group_pk}"
+
+
+def _get_permissions_key(version_name: str, version: int) -> str:
+    return f"{PERMISSIONS_KEY_PREFIX}{version_name}:{version}"
+
+
+def _get_permission_names(permissions) -> Set[str]:
+    return {
+        "%s.%s" % (app_label, codename)
+        for app_label, codename in permissions.values_list(
+            "content_type__app_label", "codename"
+        ).order_by()
+    }
+
+
+def _get_groups_permission_names(group_ids: List[int]) -> Dict[int, Set[str]]:
+    version_names = {pk: get_group_permissions_version_name(pk) for pk in group_ids}
+    versions = get_versions(version_names.values())
+    keys = {
+        pk: _get_permissions_key(name, versions[name])
+        for pk, name in version_names.items()
+    }
+    cached = cache.get_many(list(keys.values()))
+    names = {pk: cached[key] for pk, key in keys.items() if key in cached}
+    missing = [pk for pk in group_ids if pk not in names]
+    if missing:
+        fetched: Dict[int, Set[str]] = {pk: set() for pk in missing}
+        permissions = Permission.objects.filter(group__pk__in=missing)
+        for group_pk, app_label, codename in permissions.values_list(
+            "group__pk", "content_type__app_label", "codename"
+        ).order_by():
+            fetched[group_pk].add("%s.%s" % (app_label, codename))
+        cache.set_many(
+            {keys[pk]: group_names for pk, group_names in fetched.items()},
+            timeout=settings.PERMISSIONS_CACHE_TTL,
+        )
+        names.update(fetched)
+    return names
+
+
+def get_user_permission_names(user) -> Set[str]:
+    """Return names of all the permissions of the user, e.g. `order.manage_orders`.
+
+    Sets are shared between the requests. Permissions of the user and of each
+    of their groups are cached separately under their own version stamps, so
+    changing a group only invalidates the permissions of that group.
+    """
+    if user.is_superuser:
+        version_name = ALL_PERMISSIONS_VERSION_NAME
+        key = _get_permissions_key(version_name, get_version(version_name))
+        names = cache.get(key)
+        if names is None:
+            names = _get_permission_names(Permission.objects.all())
+            cache.set(key, names, timeout=settings.PERMISSIONS_CACHE_TTL)
+        return names
+
+    version_name = get_user_permissions_version_name(user.pk)
+    key = _get_permissions_key(version_name, get_version(version_name))
+    entry = cache.get(key)
+    if entry is None:
+        group_ids = list(user.groups.values_list("pk", flat=True))
+        entry = (group_ids, _get_permission_names(user.user_permissions.all()))
+        cache.set(key, entry, timeout=settings.PERMISSIONS_CACHE_TTL)
+    group_ids, user_names = entry
+    names = set(user_names)
+    for group_names in _get_groups_permission_names(group_ids).values():
+        names.update(group_names)
+    return names
+
+
+def invalidate_users_permissions(user_pks: Iterable[int]):
+    for pk in user_pks:
+        bump_version(get_user_permissions_version_name(pk), immediately=True)
+
+
+def invalidate_groups_permissions(group_pks: Iterable[int]):
+    for pk in group_pks:
+        bump_version(get_group_permissions_version_name(pk), immediately=True)
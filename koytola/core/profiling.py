@@ -0,0 +1,158 @@
+"""Profile of a single request: SQL queries, resolvers, data loaders and caches.
+
+A profile is only collected inside `profile_request()`, the rest of the time
+the recording functions return right away. The SQL queries are counted with
+an execute wrapper of the connection, and the hits of the default cache by
+wrapping the cache of the current thread, so the code which is profiled
+doesn't need to know about it. Resolvers and data loaders record themselves.
+"""
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.db import connection
+
+_MISSING = object()
+
+_profile: ContextVar[Optional["Profile"]] = ContextVar("profile", default=None)
+
+
+class Profile:
+    def __init__(self, time_resolvers: bool = True):
+        self.time_resolvers = time_resolvers
+        self.started = time.perf_counter()
+        self.duration = 0.0
+        self.sql_count = 0
+        self.sql_time = 0.0
+        # Number of calls and total time of each resolver.
+        self.resolvers: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0])
+        self.batches: Dict[str, List[int]] = defaultdict(list)
+        # Number of hits and misses of each group of the cache keys.
+        self.caches: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+
+    def as_dict(self, top_resolvers: int = 10) -> dict:
+        resolvers = sorted(
+            self.resolvers.items(), key=lambda item: item[1][1], reverse=True
+        )
+        return {
+            "duration_ms": round(self.duration * 1000, 3),
+            "sql": {"count": self.sql_count, "time_ms": round(self.sql_time * 1000, 3)},
+            "resolvers": [
+                {"field": field, "calls": calls, "time_ms": round(total * 1000, 3)}
+                for field, (calls, total) in resolvers[:top_resolvers]
+            ],
+            "dataloaders": [
+                {
+                    "name": name,
+                    "batches": len(sizes),
+                    "keys": sum(sizes),
+                    "max_batch_size": max(sizes),
+                }
+                for name, sizes in sorted(self.batches.items())
+            ],
+            "caches": [
+                {
+                    "name": name,
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_rate": round(hits / (hits + misses), 3),
+                }
+                for name, (hits, misses) in sorted(self.caches.items())
+                if hits + misses
+            ],
+        }
+
+
+def get_profile() -> Optional[Profile]:
+    return _profile.get()
+
+
+def is_timing_resolvers() -> bool:
+    profile = _profile.get()
+    return profile is not None and profile.time_resolvers
+
+
+def record_resolver(field: str, duration: float):
+    profile = _profile.get()
+    if profile is not None and profile.time_resolvers:
+        stats = profile.resolvers[field]
+        stats[0] += 1
+        stats[1] += duration
+
+
+def record_batch(name: str, size: int):
+    profile = _profile.get()
+    if profile is not None:
+        profile.batches[name].append(size)
+
+
+def _get_cache_name(key) -> str:
+    # Keys are namespaced like `koytola:permissions:...`.
+    return ":".join(str(key).split(":")[:2])
+
+
+def _record_cache(key, hit: bool):
+    profile = _profile.get()
+    if profile is not None:
+        profile.caches[_get_cache_name(key)][0 if hit else 1] += 1
+
+
+def _sql_wrapper(execute, sql, params, many, context):
+    profile = _profile.get()
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        if profile is not None:
+            profile.sql_count += 1
+            profile.sql_time += time.perf_counter() - start
+
+
+@contextmanager
+def _count_cache_hits() -> Iterator[None]:
+    # Each thread has its own instance of the cache backend, so the wrappers
+    # only see the lookups of the current request.
+    backend = caches[DEFAULT_CACHE_ALIAS]
+    get, get_many = backend.get, backend.get_many
+    # Some backends implement `get_many` with `get`, whose lookups are then
+    # recorded by `get_many` instead.
+    in_get_many = False
+
+    def _get(key, default=None, version=None):
+        value = get(key, _MISSING, version=version)
+        if not in_get_many:
+            _record_cache(key, value is not _MISSING)
+        return default if value is _MISSING else value
+
+    def _get_many(keys, version=None):
+        nonlocal in_get_many
+        keys = list(keys)
+        in_get_many = True
+        try:
+            values = get_many(keys, version=version)
+        finally:
+            in_get_many = False
+        for key in keys:
+            _record_cache(key, key in values)
+        return values
+
+    backend.get, backend.get_many = _get, _get_many
+    try:
+        yield
+    finally:
+        del backend.get, backend.get_many
+
+
+@contextmanager
+def profile_request(time_resolvers: bool = True) -> Iterator[Profile]:
+    profile = Profile(time_resolvers)
+    token = _profile.set(profile)
+    try:
+        with connection.execute_wrapper(_sql_wrapper), _count_cache_hits():
+            yield profile
+    finally:
+        profile.duration = time.perf_counter() - profile.started
+        _profile.reset(token)
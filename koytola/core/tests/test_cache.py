@@ -0,0 +1,14 @@
+from django.core.cache import cache
+
+from ..cache import VERSION_KEY_PREFIX, VersionedCache, clear_versioned_caches
+
+
+def test_clear_versioned_caches():
+    values = iter(["first", "second"])
+    versioned_cache = VersionedCache("cache-test", lambda: next(values))
+    assert versioned_cache.get() == "first"
+
+    clear_versioned_caches()
+
+    assert cache.get(VERSION_KEY_PREFIX + "cache-test") is None
+    assert versioned_cache.get() == "second"
@@ -0,0 +1,94 @@
+import csv
+import io
+import json
+
+from django.contrib.admin.sites import site
+from django.contrib.auth.models import Group, Permission
+from openpyxl import load_workbook
+
+from ...account.models import User
+from ...analytics.models import Tracking
+from ..utils.export import (
+    CSV,
+    JSONL,
+    XLSX,
+    download_csv,
+    download_jsonl,
+    export_response,
+    get_export_fields,
+    iter_export_rows,
+)
+
+
+def _get_content(response):
+    return b"".join(
+        part if isinstance(part, bytes) else part.encode()
+        for part in response.streaming_content
+    )
+
+
+def test_iter_export_rows_resolves_many_to_many(db):
+    permissions = list(Permission.objects.order_by("pk")[:2])
+    group = Group.objects.create(name="Editors")
+    group.permissions.set(permissions)
+    Group.objects.create(name="Empty")
+    fields = get_export_fields(Group)
+
+    rows = list(iter_export_rows(Group.objects.order_by("pk"), fields))
+
+    assert [field.name for field in fields] == ["id", "name", "permissions"]
+    assert rows[0] == [
+        group.pk,
+        "Editors",
+        ", ".join(str(permission) for permission in permissions),
+    ]
+    assert rows[1][2] == ""
+
+
+def test_export_response_csv(customer_user):
+    tracking = Tracking.objects.create(user=customer_user, country="PL")
+
+    response = export_response(Tracking.objects.all(), CSV)
+
+    assert response["Content-Type"] == "text/csv"
+    rows = list(csv.reader(io.StringIO(_get_content(response).decode())))
+    assert rows[1][0] == str(tracking.pk)
+    assert str(customer_user) in rows[1]
+
+
+def test_export_response_jsonl(customer_user):
+    Tracking.objects.create(user=customer_user, parameters={"source": "search"})
+
+    response = export_response(Tracking.objects.all(), JSONL)
+
+    lines = _get_content(response).decode().splitlines()
+    data = json.loads(lines[0])
+    assert data["user"] == str(customer_user)
+    assert data["parameters"] == {"source": "search"}
+
+
+def test_user_export_leaves_secrets_out(customer_user, rf):
+    modeladmin = site._registry[User]
+    queryset = User.objects.filter(pk=customer_user.pk)
+
+    content = _get_content(download_csv(modeladmin, rf.get("/"), queryset)).decode()
+    header = next(csv.reader(io.StringIO(content)))
+    line = _get_content(download_jsonl(modeladmin, rf.get("/"), queryset)).decode()
+    data = json.loads(line)
+
+    assert "password" not in header
+    assert "jwt token key" not in header
+    assert customer_user.password not in content
+    assert "password" not in data
+    assert "jwt_token_key" not in data
+    assert data["email"] == customer_user.email
+
+
+def test_export_response_xlsx(db):
+    tracking = Tracking.objects.create(country="PL")
+
+    response = export_response(Tracking.objects.all(), XLSX)
+
+    worksheet = load_workbook(io.BytesIO(_get_content(response))).active
+    rows = list(worksheet.values)
+    assert rows[1][0] == tracking.pk
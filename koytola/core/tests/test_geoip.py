@@ -0,0 +1,51 @@
+import os
+from unittest.mock import patch
+
+import maxminddb
+import pytest
+
+from ..geoip import GeoIPService
+
+
+@pytest.fixture
+def geoip_service(settings):
+    settings.GEOIP_PATH = None
+    settings.GEOIP_RELOAD_INTERVAL = 0
+    return GeoIPService()
+
+
+def test_lookup(geoip_service):
+    geo_data = geoip_service.lookup("8.8.8.8")
+
+    assert geo_data.country == "US"
+
+
+def test_lookup_invalid_ip_address(geoip_service):
+    assert geoip_service.lookup("not an ip") is None
+    assert geoip_service.lookup(None) is None
+
+
+def test_lookup_results_are_cached(geoip_service):
+    geoip_service.lookup("8.8.8.8")
+    geoip_service.lookup("8.8.8.8")
+
+    cache_info = geoip_service._get_database().lookup.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 1
+
+
+def test_database_reloaded_after_file_change(geoip_service, settings, tmpdir):
+    database_file = tmpdir.join("GeoLite2-City.mmdb")
+    database_file.write("")
+    settings.GEOIP_PATH = str(database_file)
+    record = {"country": {"iso_code": "PL"}}
+    with patch.object(maxminddb, "open_database") as open_database_mock:
+        open_database_mock.return_value.get.return_value = record
+        database = geoip_service._get_database()
+        assert geoip_service._get_database() is database
+
+        os.utime(str(database_file), (0, 0))
+
+        assert geoip_service._get_database() is not database
+        assert geoip_service.lookup("8.8.8.8").country == "PL"
+        assert open_database_mock.call_count == 2
@@ -0,0 +1,101 @@
+from prometheus_client import REGISTRY
+
+from .. import metrics
+from ..cache import VersionedCache
+from ..profiling import Profile
+from ..views import metrics as metrics_view
+
+
+def get_value(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_observe_operation():
+    profile = Profile()
+    profile.duration = 0.2
+    profile.sql_count = 3
+    profile.batches["MetricsLoader"].extend([4, 2])
+    profile.caches["koytola:metrics"] = [2, 1]
+    operations = get_value(
+        "koytola_graphql_operation_duration_seconds_count", operation="Products"
+    )
+    batches = get_value("koytola_dataloader_batch_size_sum", loader="MetricsLoader")
+    hits = get_value(
+        "koytola_cache_lookups_total",
+        layer="shared",
+        cache="koytola:metrics",
+        result="hit",
+    )
+
+    metrics.observe_operation("Products", profile)
+
+    assert (
+        get_value(
+            "koytola_graphql_operation_duration_seconds_count", operation="Products"
+        )
+        == operations + 1
+    )
+    assert (
+        get_value("koytola_dataloader_batch_size_sum", loader="MetricsLoader")
+        == batches + 6
+    )
+    assert (
+        get_value(
+            "koytola_cache_lookups_total",
+            layer="shared",
+            cache="koytola:metrics",
+            result="hit",
+        )
+        == hits + 2
+    )
+
+
+def test_get_operation_label(settings, monkeypatch):
+    settings.METRICS_MAX_OPERATIONS = 1
+    monkeypatch.setattr(metrics, "_operations", set())
+
+    assert metrics.get_operation_label("Products") == "Products"
+    assert metrics.get_operation_label("Products") == "Products"
+    assert metrics.get_operation_label("Companies") == metrics.OTHER_OPERATIONS
+    assert metrics.get_operation_label("not a name") == metrics.OTHER_OPERATIONS
+    assert metrics.get_operation_label(None) == metrics.UNNAMED_OPERATION
+
+
+def test_versioned_cache_lookups():
+    versioned_cache = VersionedCache("metrics-test", lambda: "value")
+    labels = {"layer": "local", "cache": "metrics-test"}
+
+    versioned_cache.get()
+    versioned_cache.get()
+
+    assert get_value("koytola_cache_lookups_total", result="miss", **labels) == 1
+    assert get_value("koytola_cache_lookups_total", result="hit", **labels) == 1
+
+
+def test_start_worker_server(settings, monkeypatch):
+    servers = []
+    monkeypatch.setattr(
+        metrics,
+        "start_http_server",
+        lambda port, registry: servers.append((port, registry)),
+    )
+    settings.METRICS_ENABLED = True
+    settings.METRICS_WORKER_PORT = None
+
+    metrics.start_worker_server()
+    assert servers == []
+
+    settings.METRICS_WORKER_PORT = 9540
+    metrics.start_worker_server()
+    assert [port for port, _ in servers] == [9540]
+
+
+def test_metrics_view(rf, settings):
+    settings.METRICS_TOKEN = "secret"
+
+    response = metrics_view(rf.get("/metrics/"))
+    assert response.status_code == 401
+
+    response = metrics_view(rf.get("/metrics/", HTTP_AUTHORIZATION="Bearer secret"))
+    assert response.status_code == 200
+    assert b"koytola_graphql_operation_duration_seconds" in response.content
@@ -0,0 +1,26 @@
+import pytest
+
+from .. import microbenchmarks  # noqa: F401
+from ..utils.microbenchmark import BENCHMARKS, measure, run
+
+FAST = {"repeat": 1, "min_time": 0.001, "warmup": 0.001, "memory_loops": 2}
+
+
+def test_measure_reports_allocations():
+    result = measure("allocate", lambda: bytearray(100000), **FAST)
+
+    assert result.ops_per_sec > 0
+    assert result.ns_per_op == pytest.approx(1e9 / result.ops_per_sec)
+    assert result.peak_bytes >= 100000
+    assert result.retained_bytes < 100000
+
+
+def test_run_unknown_benchmark():
+    with pytest.raises(KeyError):
+        run(["unknown"], **FAST)
+
+
+def test_run_all_benchmarks(db):
+    results = run(**FAST)
+
+    assert [result.name for result in results] == sorted(BENCHMARKS)
@@ -0,0 +1,39 @@
+from django.core.cache import cache
+
+from ...account.models import User
+from ..profiling import get_profile, profile_request, record_batch, record_resolver
+
+
+def test_profile_request(db):
+    cache.set("koytola:auth-user:1", "user")
+
+    with profile_request() as profile:
+        assert get_profile() is profile
+        User.objects.count()
+        cache.get("koytola:auth-user:1")
+        cache.get("koytola:auth-user:2")
+        cache.get_many(["koytola:profiling-test:1", "koytola:auth-user:1"])
+        record_resolver("Query.products", 0.002)
+        record_resolver("Query.products", 0.001)
+        record_batch("CompanyByIdLoader", 3)
+
+    assert get_profile() is None
+    data = profile.as_dict()
+    assert data["sql"]["count"] == 1
+    assert data["resolvers"] == [
+        {"field": "Query.products", "calls": 2, "time_ms": 3.0}
+    ]
+    assert data["dataloaders"] == [
+        {"name": "CompanyByIdLoader", "batches": 1, "keys": 3, "max_batch_size": 3}
+    ]
+    assert data["caches"] == [
+        {"name": "koytola:auth-user", "hits": 2, "misses": 1, "hit_rate": 0.667},
+        {"name": "koytola:profiling-test", "hits": 0, "misses": 1, "hit_rate": 0.0},
+    ]
+
+
+def test_nothing_is_recorded_outside_of_profile(db):
+    record_resolver("Query.products", 0.002)
+
+    assert get_profile() is None
+    assert cache.get("koytola:auth-user:3", "default") == "default"
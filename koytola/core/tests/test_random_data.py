@@ -0,0 +1,29 @@
+from ...profile.models import CertificateType, Industry
+from ..utils.random_data import bulk_create_tree, store_files
+
+
+def test_bulk_create_tree_rebuilds_positions(db):
+    parent = Industry(name="Food and Beverage")
+    bulk_create_tree(Industry, [parent])
+    child = Industry(name="Dried Fruit", parent_id=parent.pk)
+    bulk_create_tree(Industry, [child, Industry(name="Tobacco")])
+
+    Industry.objects.rebuild()
+
+    parent.refresh_from_db()
+    child.refresh_from_db()
+    assert child.level == 1
+    assert parent.lft < child.lft < child.rght < parent.rght
+    assert list(parent.get_children()) == [child]
+
+
+def test_store_files_copies_each_file_once(media_root, tmpdir):
+    source = tmpdir.join("A.png")
+    source.write_binary(b"icon")
+    field = CertificateType._meta.get_field("image")
+
+    names = store_files(field, {"A.png": (str(source), "A.png")})
+
+    assert list(names) == ["A.png"]
+    with field.storage.open(names["A.png"]) as stored:
+        assert stored.read() == b"icon"
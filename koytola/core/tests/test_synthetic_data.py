@@ -0,0 +1,64 @@
+from datetime import date
+
+import pytest
+from django.db import transaction
+
+from ...product.models import Category, Product, ProductReviews
+from ..utils.synthetic_data import (
+    CATEGORY_TREE,
+    DatasetGenerator,
+    get_counts,
+    get_zipf_weights,
+)
+
+
+def test_get_counts_scales_down_to_one_row():
+    counts = get_counts(0.0001)
+
+    assert counts["products"] == 1
+    assert counts["companies"] == 1
+
+
+def test_get_zipf_weights_are_cumulative():
+    weights = get_zipf_weights(3, 1)
+
+    assert weights == [1, 1.5, 1.5 + 1 / 3]
+
+
+def _generate(seed):
+    generator = DatasetGenerator(scale=0.01, seed=seed, end_date=date(2021, 1, 1))
+    list(generator.generate())
+    return list(
+        Product.objects.order_by("slug").values_list(
+            "slug", "company__name", "category__slug", "unit_price"
+        )
+    )
+
+
+class Rollback(Exception):
+    pass
+
+
+def test_generate_dataset(db):
+    generator = DatasetGenerator(scale=0.01, seed=1, end_date=date(2021, 1, 1))
+
+    list(generator.generate())
+
+    assert generator.exists()
+    assert Product.objects.count() == 100
+    assert ProductReviews.objects.count() == 50
+    leaves = Category.tree.filter(level=len(CATEGORY_TREE) - 1)
+    assert not leaves.filter(children__isnull=False).exists()
+    assert set(
+        Product.objects.values_list("category_id", flat=True)
+    ) <= set(leaves.values_list("pk", flat=True))
+
+
+def test_generate_dataset_is_deterministic(db):
+    with pytest.raises(Rollback):
+        with transaction.atomic():
+            products = _generate(seed=1)
+            raise Rollback
+
+    assert _generate(seed=1) == products
+    assert products != []
@@ -1,5 +1,4 @@
 import os, sys
-import json
 import logging
 import re
 import socket
@@ -10,18 +9,15 @@ from babel.numbers import get_territory_currencies
 from django.conf import settings
 from django.contrib.sites.models import Site
 from django.db.models import Model
-from django.http import HttpResponse
 from django.utils.encoding import iri_to_uri
 from django.utils.text import slugify
 from django_countries import countries
 from django_countries.fields import Country
-from geolite2 import geolite2
 from versatileimagefield.image_warmer import VersatileImageFieldWarmer
-import csv
-import datetime
+
+from ..geoip import geoip
 
 
-georeader = geolite2.reader()
 logger = logging.getLogger(__name__)
 
 
@@ -80,17 +76,15 @@ def is_valid_ipv6(ip: str) -> bool:
 
 def _get_geo_data_by_ip(ip_address):
     # This function is here to make it easier to mock the GeoIP
-    # as the georeader object below can be a native platform library
+    # as the database reader can be a native platform library
     # that does not support monkeypatching.
-    return georeader.get(ip_address)
+    return geoip.lookup(ip_address)
 
 
 def get_country_by_ip(ip_address):
     geo_data = _get_geo_data_by_ip(ip_address)
-    if geo_data and "country" in geo_data and "iso_code" in geo_data["country"]:
-        country_iso_code = geo_data["country"]["iso_code"]
-        if country_iso_code in countries:
-            return Country(country_iso_code)
+    if geo_data and geo_data.country in countries:
+        return Country(geo_data.country)
     return None
 
 
@@ -167,63 +161,3 @@ def upload_path_handler(instance, filename):
     except:
         return "static/users/other"
 
-
-def download_csv(modeladmin, request, queryset):
-    field_name = []
-    try:
-        opts = modeladmin.model._meta
-        # response = HttpResponse(content_type='text/csv')
-        # response['Content-Disposition'] = 'attachment;' 'filename{}.csv'.format(opts.verbose_name)
-        writer = csv.writer(open('filename{}.csv'.format(opts.verbose_name), 'w'))
-        fields = [field for field in opts.get_fields() if not field.many_to_many and not field.one_to_many and not field.one_to_one]
-        writer.writerow([field.verbose_name for field in fields])
-        for obj in queryset:
-            data_row = []
-            for field in fields:
-                field_name.append((obj.name, field.name))
-                value = getattr(obj, field.name)
-                if isinstance(value, datetime.datetime):
-                    value = value.strftime('%d/%m/%Y')
-                data_row.append(value)
-
-            writer.writerow(data_row)
-        # return response
-    except Exception as e:
-        return HttpResponse(f'{field_name, e}')
-
-
-def download_json(modeladmin, request, queryset):
-    opts = modeladmin.model._meta
-    fields = [field for field in opts.get_fields() if not field.many_to_many and not field.one_to_many]
-    data = {}
-    i = -1
-    for obj in queryset:
-        i += 1
-        json_instance = {}
-        for field in fields:
-            value = getattr(obj, field.name)
-            if isinstance(value, datetime.datetime):
-                value = value.strftime('%d/%m/%Y')
-            json_instance[field.name] = value
-        data[i] = json_instance
-    filename = opts.verbose_name + "-" + datetime.datetime.today().strftime("%Y-%m-%d")
-    filepath = save_data_into_json(
-        data,
-        filename
-    )
-    with open(filepath, 'rb') as file:
-        response = HttpResponse(file.read(), content_type="application/json")
-        response['Content-Disposition'] = 'attachment; filename={}.json'.format(filename)
-    return response
-
-
-def save_data_into_json(data, filename=None):
-    path = os.path.join(settings.BASE_DIR, 'media', 'storage')
-    if not filename:
-        filename = "data.json"
-    else:
-        filename = filename + ".json"
-    filepath = path + '/' + filename
-    with open(filepath, 'w') as outfile:
-        json.dump(data, outfile)
-    return filepath
@@ -0,0 +1,108 @@
+"""Micro-benchmarks of the helpers that run for each field or row.
+
+A benchmark is registered with a setup function which prepares the fixed
+inputs and returns the callable to measure, so that the setup is not timed:
+
+    @register("to_global_cursor")
+    def bench_to_global_cursor():
+        values = ["Fresh Fruit", 42, None]
+        return lambda: to_global_cursor(values)
+
+Each benchmark is warmed up and then timed in several repetitions of enough
+calls to last `min_time` seconds, with the garbage collector disabled like in
+`timeit`. The fastest repetition is reported, as the slower ones only measure
+the noise of the machine. The memory allocated by a single call is measured
+separately with `tracemalloc`, which slows down the calls a lot.
+"""
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple
+
+Setup = Callable[[], Callable[[], Any]]
+
+BENCHMARKS: Dict[str, Setup] = {}
+
+
+class Result(NamedTuple):
+    name: str
+    ops_per_sec: float
+    ns_per_op: float
+    peak_bytes: int
+    retained_bytes: float
+
+
+def register(name: str) -> Callable[[Setup], Setup]:
+    def decorator(setup: Setup) -> Setup:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return decorator
+
+
+def _time(func: Callable[[], Any], loops: int) -> float:
+    calls = range(loops)
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in calls:
+            func()
+        return time.perf_counter() - start
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _get_loops(func: Callable[[], Any], min_time: float) -> int:
+    """Return the number of calls which last at least `min_time` seconds."""
+    loops = 1
+    while True:
+        elapsed = _time(func, loops)
+        if elapsed >= min_time:
+            return loops
+        # Aim a bit above the minimum, so that a single estimate is enough.
+        loops = max(loops * 2, int(loops * min_time * 1.2 / max(elapsed, 1e-9)))
+
+
+def _measure_memory(func: Callable[[], Any], loops: int):
+    """Return the peak memory of a single call and the memory kept by a call."""
+    func()
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        func()
+        current, peak = tracemalloc.get_traced_memory()
+        peak_bytes = peak - start
+        for _ in range(loops - 1):
+            func()
+        current, _ = tracemalloc.get_traced_memory()
+        retained_bytes = (current - start) / loops
+    finally:
+        tracemalloc.stop()
+    return peak_bytes, retained_bytes
+
+
+def measure(
+    name: str,
+    func: Callable[[], Any],
+    *,
+    repeat: int = 5,
+    min_time: float = 0.2,
+    warmup: float = 0.1,
+    memory_loops: int = 100,
+) -> Result:
+    _get_loops(func, warmup)
+    loops = _get_loops(func, min_time)
+    best = min(_time(func, loops) for _ in range(repeat)) / loops
+    peak_bytes, retained_bytes = _measure_memory(func, memory_loops)
+    return Result(name, 1 / best, best * 1e9, peak_bytes, retained_bytes)
+
+
+def run(names: Iterable[str] = (), **options) -> List[Result]:
+    """Run the given benchmarks, all the registered ones by default."""
+    names = list(names) or sorted(BENCHMARKS)
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        raise KeyError("Unknown benchmarks: %s" % ", ".join(sorted(unknown)))
+    return [measure(name, BENCHMARKS[name](), **options) for name in names]
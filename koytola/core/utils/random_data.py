@@ -3,13 +3,17 @@ import random
 import string
 import unicodedata
 import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Hashable, Tuple
 from unittest.mock import patch
-from user_agents import parse
 from django.contrib.auth.hashers import make_password
 from django.conf import settings
 from django.contrib.auth.models import Group, Permission
 from django.contrib.sites.models import Site
 from django.core.files import File
+from django.core.files.base import ContentFile
+from django.db import transaction
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.crypto import get_random_string
@@ -31,11 +35,9 @@ from ...core.permissions import (
 from ...product.models import HSCodeAndProduct
 from ...analytics import TrackingTypes
 from ...analytics.models import Tracking
+from ...analytics.utils import parse_user_agent
 from ...core.utils import build_absolute_uri
-from ...graphql.analytics.utils import (
-    get_device_type,
-    get_geo_details_from_ip
-)
+from ...graphql.analytics.utils import get_geo_details_from_ip
 from ...menu.models import Menu
 from ...news import NewsAudienceType
 from ...news.models import News
@@ -64,8 +66,7 @@ from ...profile.models import (
 import json
 from django.db.models import Q
 import csv
-import urllib
-import io
+import urllib.request
 from django.utils.text import slugify
 from django.core.files.storage import FileSystemStorage
 from xml.etree import ElementTree
@@ -76,6 +77,9 @@ from datetime import datetime
 
 fake = Factory.create()
 DUMMY_STAFF_PASSWORD = "password"
+# Threads copying the images of the site data into the storage.
+SETUP_DATA_WORKERS = 8
+SETUP_DATA_BATCH_SIZE = 1000
 REFERRER_OPTIONS = [
     "https://instagram.com",
     "https://youtube.com",
@@ -293,18 +297,11 @@ def create_fake_company(save=True, user_index=None, user=None):
 
 def create_fake_tracking(save=True):
     ip = fake.ipv4()
-    ua = fake.user_agent()
-    ua_data = parse(ua)
-    device_type = get_device_type(ua_data)
+    user_agent = parse_user_agent(fake.user_agent())
     tracking = Tracking(
         ip=ip,
         referrer=random.choice(REFERRER_OPTIONS),
-        device_type=device_type,
-        device=ua_data.device.family,
-        browser=ua_data.browser.family,
-        browser_version=ua_data.browser.version_string,
-        system=ua_data.os.family,
-        system_version=ua_data.os.version_string,
+        **user_agent._asdict(),
     )
 
     geo_data = get_geo_details_from_ip(ip)
@@ -523,112 +520,235 @@ def create_companies(how_many=30):
         yield "Company: %s" % (company.name,)
 
 
-def company_cell_data(reader, row, column):
-    return reader.cell(row=row, column=column).value
+def _read_file(source: str) -> bytes:
+    if source.startswith(("http://", "https://")):
+        with urllib.request.urlopen(source) as response:
+            return response.read()
+    with open(source, "rb") as source_file:
+        return source_file.read()
 
 
-def company_address_create(**kwargs):
-    return Address.objects.create(**kwargs)
+def _store_file(field, source: str, name: str) -> str:
+    content = ContentFile(_read_file(source))
+    return field.storage.save(field.generate_filename(None, name), content)
 
 
-def company_user_create(address, **kwargs):
-    if User.objects.filter(email=kwargs['email']).exists():
-        user = User.objects.get(email=kwargs['email'])
-    else:
-        user = User.objects.create(**kwargs)
-        user.addresses.add(address)
-    return user
+def store_files(field, files: Dict[Hashable, Tuple[str, str]]) -> Dict[Hashable, str]:
+    """Copy the files into the storage of the field on a pool of threads.
 
+    The files are given by their keys as the pairs of their sources, paths or
+    URLs, and names. Return the names of the stored files by the same keys,
+    the files that couldn't be downloaded are left out.
+    """
+    with ThreadPoolExecutor(max_workers=SETUP_DATA_WORKERS) as executor:
+        futures = {
+            key: executor.submit(_store_file, field, source, name)
+            for key, (source, name) in files.items()
+        }
+    names = {}
+    for key, future in futures.items():
+        try:
+            names[key] = future.result()
+        except urllib.error.URLError:
+            continue
+    return names
+
+
+def bulk_create_tree(model, nodes):
+    """Save the nodes of an MPTT tree without computing their positions.
+
+    The positions are computed by `rebuild` of the tree manager, which has to
+    be called once all the nodes are saved.
+    """
+    opts = model._mptt_meta
+    for node in nodes:
+        for attr in (
+            opts.left_attr,
+            opts.right_attr,
+            opts.tree_id_attr,
+            opts.level_attr,
+        ):
+            setattr(node, attr, 0)
+    return model._default_manager.bulk_create(
+        nodes, batch_size=SETUP_DATA_BATCH_SIZE
+    )
 
-def company_info_data(reader, row):
-    company = {}
-    email = company_cell_data(reader, row, 14)
+
+def company_cell_data(row, column):
+    return row[column - 1] if column <= len(row) else None
+
+
+def company_info_data(row):
+    """Return the unsaved company, its user and address from the sheet row."""
+    email = company_cell_data(row, 14)
     if email is None:
-        email = company_cell_data(reader, row, 1).lower().replace(" ", ".")
+        email = company_cell_data(row, 1).lower().replace(" ", ".")
         email = email + '@' + email.replace(".", "") + '.com'
-    name = company_cell_data(reader, row, 4)
-    name = name if name else company_cell_data(reader, row, 1)
-    phone_number = company_cell_data(reader, row, 13)
+    name = company_cell_data(row, 4)
+    name = name if name else company_cell_data(row, 1)
+    phone_number = company_cell_data(row, 13)
     if type(phone_number) is not str:
         phone_number = None
-    address = company_address_create(
+    address = Address(
         address_name="Office",
-        first_name=company_cell_data(reader, row, 1),
+        first_name=company_cell_data(row, 1),
         company_name=name,
-        street_address_1=company_cell_data(reader, row, 15),
-        street_address_2=company_cell_data(reader, row, 16),
-        city=company_cell_data(reader, row, 18),
-        postal_code=company_cell_data(reader, row, 20),
+        street_address_1=company_cell_data(row, 15),
+        street_address_2=company_cell_data(row, 16),
+        city=company_cell_data(row, 18),
+        postal_code=company_cell_data(row, 20),
         country='TR',
-        country_area=company_cell_data(reader, row, 17),
+        country_area=company_cell_data(row, 17),
         phone=phone_number
     )
-    user = company_user_create(
-        address=address,
-        password=make_password("Company&Password@95164$"),
-        email=email,
+    user = User(email=email, phone=phone_number, is_seller=True)
+    founded_year = company_cell_data(row, 11)
+    company = Company(
+        name=name,
+        slug=slugify(name),
+        website=company_cell_data(row, 5),
+        content_plaintext=company_cell_data(row, 7),
+        founded_year=founded_year if isinstance(founded_year, int) else None,
+        no_of_employees=company_cell_data(row, 12),
         phone=phone_number,
-        is_seller=True
     )
-    founded_year = company_cell_data(reader, row, 11)
-    company['user'] = user
-    company['name'] = name
-    company['slug'] = slugify(name)
-    company['website'] = company_cell_data(reader, row, 5)
-    company['content_plaintext'] = company_cell_data(reader, row, 7)
-    company['founded_year'] = founded_year if isinstance(founded_year, int) else None
-    company['no_of_employees'] = company_cell_data(reader, row, 12)
-    company['phone'] = phone_number
-    company['address'] = address
-    return company
+    return company, user, address
 
 
 def create_sheet_companies():
-    wb = openpyxl.load_workbook("./././Koytola Working Sheet.xlsx")
-    reader = wb['Şirket Bilgileri']
-    # Address.objects.filter(country=None).update(country="TR")
+    workbook = openpyxl.load_workbook("./././Koytola Working Sheet.xlsx", read_only=True)
+    rows = workbook['Şirket Bilgileri'].iter_rows(
+        min_row=14, max_row=39, values_only=True
+    )
+    data = [company_info_data(row) for row in rows]
+    workbook.close()
+
+    emails = [user.email for _, user, _ in data]
+    users = {user.email: user for user in User.objects.filter(email__in=emails)}
+    # Companies are skipped when they exist or their users already have one.
+    taken = set(
+        Company.objects.filter(
+            Q(name__in=[company.name for company, _, _ in data])
+            | Q(user__email__in=emails)
+        ).values_list("name", "user__email")
+    )
+    names = {name for name, _ in taken}
+    emails = {email for _, email in taken}
+    new_data = []
+    for company, user, address in data:
+        if company.name not in names and user.email not in emails:
+            names.add(company.name)
+            emails.add(user.email)
+            new_data.append((company, user, address))
+
+    # Hashing is slow on purpose, every new user gets the same hash.
+    password = make_password("Company&Password@95164$")
+    new_users = [
+        (user, address)
+        for _, user, address in new_data
+        if user.email not in users
+    ]
+    with transaction.atomic():
+        Address.objects.bulk_create([address for _, _, address in new_data])
+        for user, _ in new_users:
+            user.password = password
+            users[user.email] = user
+        User.objects.bulk_create([user for user, _ in new_users])
+        User.addresses.through.objects.bulk_create(
+            [
+                User.addresses.through(user=user, address=address)
+                for user, address in new_users
+            ]
+        )
+        for company, user, address in new_data:
+            company.user = users[user.email]
+            company.address = address
+        Company.objects.bulk_create([company for company, _, _ in new_data])
+    for company, _, _ in new_data:
+        yield "Company: %s" % (company.name,)
 
-    for i in range(14, 40):
-        d = company_info_data(reader, i)
-        if not Company.objects.filter(user=d['user'], name=d['name']).exists():
-            company_obj = Company.objects.create(**d)
-            yield "Company: %s" % (company_obj.name,)
+
+def _get_category_image(path):
+    # The paths in categories.json are absolute paths of the machine they were
+    # written on, the images are kept in the categories directory.
+    if not os.path.exists(path):
+        path = os.path.join("categories", os.path.basename(path))
+    return path, os.path.basename(path)
 
 
 def create_product_categories():
-    cats = json.load(open("./././categories.json"))
+    with open("./././categories.json") as categories_file:
+        cats = json.load(categories_file)
+    names = dict(Category.objects.exclude(name="Other").values_list("name", "pk"))
+    slugs = set(Category.objects.values_list("slug", flat=True))
+    other_parents = set(
+        Category.objects.filter(name="Other").values_list("parent_id", flat=True)
+    )
+    created = []
+
+    def add_other(parent_id):
+        if parent_id not in other_parents:
+            other_parents.add(parent_id)
+            return [Category(name="Other", slug="other", parent_id=parent_id)]
+        return []
+
+    # The tree is saved level by level, the parents need their ids first.
+    images = {
+        key: _get_category_image(value["category_image"])
+        for key, value in cats.items()
+        if key not in names
+    }
+    images = store_files(Category._meta.get_field("background_image"), images)
+    roots = add_other(None)
+    for key in cats:
+        if key not in names:
+            roots.append(
+                Category(name=key, slug=slugify(key), background_image=images.get(key))
+            )
+    bulk_create_tree(Category, roots)
+    created.extend(roots)
+    names.update((category.name, category.pk) for category in roots)
+
+    subcategories = []
     for key, value in cats.items():
-        if not Category.objects.filter(name=key).exists():
-            img_file = open(cats[key]["category_image"], 'rb')
-            image = io.BytesIO(img_file.read())
-            parent = Category(name=key, slug=slugify(key))
-            parent.background_image.save(cats[key]["category_image"].split('/')[1], image)
-            parent.save()
-        cats[key].pop('category_image')
-        if not Category.objects.filter(name="Other", parent=None).exists():
-            Category.objects.create(name="Other", slug='other', parent=None)
-        parent = Category.objects.get(name=key)
-        if not Category.objects.filter(name=f"Other", parent=parent).exists():
-            Category.objects.create(name=f"Other", slug=f'other', parent=parent)
+        subcategories.extend(add_other(names[key]))
+        for k, v in value.items():
+            if k == "category_image" or k in names:
+                continue
+            keys = {i: "" for i in v['keys']}
+            sub = Category(name=k, slug=slugify(k), parent_id=names[key], description=keys)
+            subcategories.append(sub)
+            names[k] = None
+    bulk_create_tree(Category, subcategories)
+    created.extend(subcategories)
+    names.update(
+        (category.name, category.pk)
+        for category in subcategories
+        if category.name != "Other"
+    )
+
+    leaves = []
+    for value in cats.values():
         for k, v in value.items():
-            keys = {}
-            for i in v['keys']:
-                keys[i] = ""
-            if Category.objects.filter(name=k).exists():
-                print("Category: ", k)
-                sub = Category.objects.get(name=k)
-            else:
-                sub = Category.objects.create(name=k, slug=slugify(k), parent=parent, description=keys)
-            if not Category.objects.filter(name=f"Other", parent=sub).exists():
-                Category.objects.create(name=f"Other", slug=f'other', parent=sub)
+            if k == "category_image":
+                continue
+            leaves.extend(add_other(names[k]))
             for cat in v['category']:
-                if Category.objects.filter(slug=slugify(cat)).exists():
+                if cat in names:
+                    continue
+                if slugify(cat) in slugs:
                     slug = slugify(k) + '-' + slugify(cat)
                 else:
                     slug = slugify(cat)
-                if not Category.objects.filter(name=cat).exists():
-                    Category(name=cat, slug=slug, parent=sub).save()
-                    yield "Category: %s" % (cat,)
+                slugs.add(slug)
+                names[cat] = None
+                leaves.append(Category(name=cat, slug=slug, parent_id=names[k]))
+    bulk_create_tree(Category, leaves)
+    created.extend(leaves)
+
+    Category.tree.rebuild()
+    for category in created:
+        yield "Category: %s" % (category.name,)
 
 
 def create_staffs():
@@ -741,15 +861,20 @@ def create_page_types():
 
 
 def create_hscode_and_product():
-    # HSCodeAndProduct.objects.all().delete()
-    reader = openpyxl.load_workbook("./././HS code List.xlsx").active
-    for i in range(2, reader.max_row):
-        if not HSCodeAndProduct.objects.filter(hs_code=reader.cell(row=i, column=1).value).exists():
-            HSCodeAndProduct(
-                hs_code=reader.cell(row=i, column=1).value,
-                product_name=reader.cell(row=i, column=2).value
-            ).save()
-        yield "HS Code And Product Created %s" % reader.cell(row=i, column=1).value
+    workbook = openpyxl.load_workbook("./././HS code List.xlsx", read_only=True)
+    existing = set(HSCodeAndProduct.objects.values_list("hs_code", flat=True))
+    hs_codes = []
+    for row in workbook.active.iter_rows(min_row=2, max_col=2, values_only=True):
+        hs_code, product_name = (tuple(row) + (None, None))[:2]
+        if hs_code is None or str(hs_code) in existing:
+            continue
+        existing.add(str(hs_code))
+        hs_codes.append(
+            HSCodeAndProduct(hs_code=str(hs_code), product_name=product_name or "")
+        )
+    workbook.close()
+    HSCodeAndProduct.objects.bulk_create(hs_codes, batch_size=SETUP_DATA_BATCH_SIZE)
+    yield "HS Code And Product Created: %d" % len(hs_codes)
 
 
 def create_pages():
@@ -1034,49 +1159,66 @@ def get_image(image_dir, image_name):
 
 
 def create_countries():
-    csv_reader = list(csv.reader(open('./././countries.csv')))
-    for i in csv_reader[1:]:
-        if not Countries.objects.filter(code=i[0]).exists():
-            Countries(code=i[0], name=i[3], latitude=i[1], longitude=i[2]).save()
-        yield "country %s" % i[3]
+    with open('./././countries.csv') as csv_file:
+        rows = list(csv.reader(csv_file))[1:]
+    existing = set(Countries.objects.values_list("code", flat=True))
+    countries = []
+    for i in rows:
+        if i[0] not in existing:
+            existing.add(i[0])
+            countries.append(
+                Countries(
+                    code=i[0],
+                    name=i[3],
+                    latitude=i[1] or None,
+                    longitude=i[2] or None,
+                )
+            )
+    Countries.objects.bulk_create(countries, batch_size=SETUP_DATA_BATCH_SIZE)
+    for country in countries:
+        yield "country %s" % country.name
 
 
 def create_countries_flag():
-    csv_reader = list(csv.reader(open('./././Country_Flags.csv')))[1:]
-    for i in csv_reader:
-        if i[2] and Countries.objects.filter(name=i[0], flag=None).exists():
-            try:
-                response = urllib.request.urlopen(i[2])
-                if response.getcode() == 200:
-                    obj = io.BytesIO(response.read())
-                    company = Countries.objects.get(name=i[0])
-                    company.flag.save(i[1], obj)
-                    company.save()
-                yield "country flag %s" % i[0]
-            except urllib.error.HTTPError:
-                continue
-
-
-def rosetter_save(i, type, category):
-    obj = Roetter(type=type, name=i['name'], category=category)
-    img_file = open('./././Rosette/' + i['image'], 'rb')
-    image = io.BytesIO(img_file.read())
-    obj.image.save(i['image'], image)
-    obj.save()
-    return obj
+    with open('./././Country_Flags.csv') as csv_file:
+        rows = list(csv.reader(csv_file))[1:]
+    countries = defaultdict(list)
+    for country in Countries.objects.filter(Q(flag=None) | Q(flag="")):
+        countries[country.name].append(country)
+    flags = {i[0]: (i[2], i[1]) for i in rows if i[2] and i[0] in countries}
+    flags = store_files(Countries._meta.get_field("flag"), flags)
+    updated = []
+    for name, flag in flags.items():
+        for country in countries[name]:
+            country.flag = flag
+            updated.append(country)
+    Countries.objects.bulk_update(updated, ["flag"], batch_size=SETUP_DATA_BATCH_SIZE)
+    for name in flags:
+        yield "country flag %s" % name
 
 
 def create_rosetter():
-    rosetters = json.load(open('./././rosetters.json', 'r'))
-    for i in rosetters['Company']:
-        if not Roetter.objects.filter(name=i['name'], type='Company').exists():
-            company = rosetter_save(i, 'Company', None)
-        yield f"company rosetter {i['name'] if 'name' in i else ''}"
-    for i in rosetters['Product']:
-        for j in rosetters['Product'][i]['rosetter']:
-            if not Roetter.objects.filter(name=j['name'], type='Product').exists():
-                one = rosetter_save(j, 'Product', rosetters['Product'][i]['category'])
-            yield f"Product rosetter {j['name'] if 'name' in j else ''}"
+    with open('./././rosetters.json') as rosetters_file:
+        rosetters = json.load(rosetters_file)
+    entries = [(i, 'Company', None) for i in rosetters['Company']]
+    for i in rosetters['Product'].values():
+        entries.extend((j, 'Product', i['category']) for j in i['rosetter'])
+    existing = set(Roetter.objects.values_list("name", "type"))
+    new = []
+    for i, rosetter_type, category in entries:
+        if (i['name'], rosetter_type) not in existing:
+            existing.add((i['name'], rosetter_type))
+            new.append((i, Roetter(type=rosetter_type, name=i['name'], category=category)))
+    # Rosettes sharing an image share its file as well.
+    images = store_files(
+        Roetter._meta.get_field("image"),
+        {i['image']: ('./././Rosette/' + i['image'], i['image']) for i, _ in new},
+    )
+    for i, obj in new:
+        obj.image = images[i['image']]
+    Roetter.objects.bulk_create([obj for _, obj in new])
+    for _, obj in new:
+        yield f"{obj.type} rosetter {obj.name}"
 
 
 def create_industry():
@@ -1090,10 +1232,42 @@ def create_industry():
                 'Defense and Aerospace', 'Other Industry Products', 'Mining Products', 'Home Appliance', 'Furniture',
                 'Cosmetics', 'Gift', 'Pet Food and Products', 'Fresh Fruit and Vegetable', 'Sport and Hobby Equipment'
                 ]
-    for i in industry:
-        if not Industry.objects.filter(name=i).exists():
-            Industry(name=i).save()
-            yield "Industry %s" % i
+    existing = set(Industry.objects.values_list("name", flat=True))
+    industries = [Industry(name=i) for i in industry if i not in existing]
+    bulk_create_tree(Industry, industries)
+    Industry.objects.rebuild()
+    for obj in industries:
+        yield "Industry %s" % obj.name
+
+
+def _get_certificate_icon(name):
+    return 'I.png' if name[0] == "İ" else name[0].upper() + '.png'
+
+
+def _create_certificate_types(certificate_type, names):
+    """Create the missing certificate types with the icons of their initials."""
+    names = list(dict.fromkeys(names))
+    existing = {
+        obj.name: obj
+        for obj in CertificateType.objects.filter(type=certificate_type, name__in=names)
+    }
+    new = [
+        CertificateType(type=certificate_type, name=name)
+        for name in names
+        if name not in existing
+    ]
+    without_icons = [obj for obj in existing.values() if not obj.image]
+    # Certificates with the same initial share the file of its icon.
+    icons = {_get_certificate_icon(obj.name) for obj in new + without_icons}
+    icons = store_files(
+        CertificateType._meta.get_field("image"),
+        {icon: ('./././certificate_icon/' + icon, icon) for icon in icons},
+    )
+    for obj in new + without_icons:
+        obj.image = icons[_get_certificate_icon(obj.name)]
+    CertificateType.objects.bulk_create(new)
+    CertificateType.objects.bulk_update(without_icons, ["image"])
+    return new
 
 
 def create_product_certificate():
@@ -1115,17 +1289,8 @@ def create_product_certificate():
                    'RAL', 'Recycled Claim Standard', 'RTN', 'SIL', 'S Mark', 'Solar Certificate', 'Standardsmark',
                    'Toxproof', 'TSE', 'TSI', 'UKCA', 'USDA', 'Vehicle Spare Parts', 'Vegetarian Certificate', 'WRAS'
                    ]
-    for i in certificate:
-        if not CertificateType.objects.filter(type="Product", name=i).exists():
-            obj = CertificateType.objects.create(type="Product", name=i)
-        else:
-            obj = CertificateType.objects.get(type="Product", name=i)
-        image_name = obj.name[0].upper()+'.png'
-        img_file = open('./././certificate_icon/' + image_name, 'rb')
-        image = io.BytesIO(img_file.read())
-        obj.image.save(image_name, image)
-        obj.save()
-        yield "Product certificate %s" % i
+    for obj in _create_certificate_types("Product", certificate):
+        yield "Product certificate %s" % obj.name
 
 
 def create_company_certificate():
@@ -1149,17 +1314,8 @@ def create_company_certificate():
                    'RAL', 'Recycled Claim Standard', 'RTN', 'SIL', 'S Mark', 'Solar Certificate', 'Standardsmark',
                    'Toxproof', 'TSE', 'TSI', 'UKCA', 'USDA', 'Vehicle Spare Parts', 'Vegetarian Certificate', 'WRAS'
                    ]
-    for i in certificate:
-        if not CertificateType.objects.filter(type="Company", name=i).exists():
-            obj = CertificateType.objects.create(type="Company", name=i)
-        else:
-            obj = CertificateType.objects.get(type="Company", name=i)
-        image_name = 'I.png' if obj.name[0] == "İ" else obj.name[0].upper() + '.png'
-        img_file = open('./././certificate_icon/' + image_name, 'rb')
-        image = io.BytesIO(img_file.read())
-        obj.image.save(image_name, image)
-        obj.save()
-        yield "Company certificate %s" % i
+    for obj in _create_certificate_types("Company", certificate):
+        yield "Company certificate %s" % obj.name
 
 
 def google_news_create():
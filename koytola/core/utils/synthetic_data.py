@@ -0,0 +1,436 @@
+"""Synthetic dataset of a given scale for the load tests.
+
+One unit of the scale is about ten thousand products, so `scale=100` builds
+a database of a million products along with their companies, categories,
+reviews, offers, port deals, inquiries, chat messages and trackings.
+
+The sizes of the companies and the popularity of the products follow Zipf
+distributions, so a few companies own most of the products and a few products
+get most of the reviews and visits. All the values are drawn from a generator
+seeded with `seed` and the dates are relative to `end_date`, so the same
+arguments always build the same dataset. Rows are inserted with `bulk_create`
+in batches, only the ids of the rows are kept in memory.
+"""
+import random
+from array import array
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from itertools import accumulate
+from typing import Callable, Dict, Iterator, List, Sequence
+
+import pytz
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils.text import slugify
+
+from ...account.models import User
+from ...analytics import TrackingTypes
+from ...analytics.models import Tracking
+from ...analytics.partitions import create_partitions, get_month_start, is_partitioned
+from ...product import ProductUnits
+from ...product.models import (
+    Category,
+    Offers,
+    PortDeals,
+    Product,
+    ProductQuery,
+    ProductQueryUsers,
+    ProductReviews,
+    QueryChat,
+)
+from ...profile import CompanySize, CompanyType, EmployeeNumber
+from ...profile.models import Company
+from .random_data import bulk_create_tree
+
+EMAIL_DOMAIN = "dataset.example.com"
+
+# Numbers of the rows per unit of the scale.
+SCALE_UNIT = {
+    "companies": 50,
+    "buyers": 500,
+    "products": 10000,
+    "reviews": 5000,
+    "offers": 200,
+    "port_deals": 200,
+    "inquiries": 1000,
+    "chat_messages": 5000,
+    "trackings": 20000,
+}
+# Children of the categories at each level of the tree, independent of the scale.
+CATEGORY_TREE = (6, 5, 4, 3, 2)
+COMPANY_SIZE_EXPONENT = 1.2
+PRODUCT_POPULARITY_EXPONENT = 1.0
+TRACKING_DAYS = 90
+
+WORDS = (
+    "organic fresh dried frozen premium natural golden red green white black "
+    "sweet roasted raw pure classic royal wild smart eco cotton leather steel "
+    "wooden olive hazelnut apricot fig raisin pistachio tea coffee honey oil "
+    "soap towel carpet shirt dress shoe bag glass ceramic marble cable pump "
+    "valve motor panel lamp chair table tile brick paint yarn fabric"
+).split()
+COUNTRIES = ["TR", "DE", "US", "GB", "NL", "FR", "IT", "AE", "SA", "RU", "CN", "PL"]
+REFERRERS = ["", "https://www.google.com/", "https://www.linkedin.com/", "direct"]
+DEVICES = [
+    ("desktop", "Other", "Chrome", "Windows"),
+    ("mobile", "iPhone", "Mobile Safari", "iOS"),
+    ("mobile", "Samsung SM-G991B", "Chrome Mobile", "Android"),
+    ("desktop", "Mac", "Safari", "Mac OS X"),
+    ("tablet", "iPad", "Mobile Safari", "iOS"),
+]
+DEVICE_WEIGHTS = [45, 25, 18, 8, 4]
+TRACKING_TYPES = [
+    TrackingTypes.PRODUCT,
+    TrackingTypes.COMPANY,
+    TrackingTypes.CATEGORY,
+    TrackingTypes.OTHER,
+]
+TRACKING_TYPE_WEIGHTS = [60, 25, 10, 5]
+UNITS = [unit for unit, _ in ProductUnits.CHOICES]
+
+
+def get_counts(scale: float) -> Dict[str, int]:
+    return {name: max(1, int(count * scale)) for name, count in SCALE_UNIT.items()}
+
+
+def get_zipf_weights(size: int, exponent: float) -> List[float]:
+    """Return the cumulative weights of the ranks of a Zipf distribution."""
+    return list(accumulate(1 / rank ** exponent for rank in range(1, size + 1)))
+
+
+def _batches(total: int, batch_size: int) -> Iterator[range]:
+    for start in range(0, total, batch_size):
+        yield range(start, min(start + batch_size, total))
+
+
+class DatasetGenerator:
+    def __init__(
+        self,
+        scale: float = 1,
+        seed: int = 0,
+        batch_size: int = 5000,
+        end_date: date = None,
+    ):
+        self.counts = get_counts(scale)
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        end_date = end_date or date.today()
+        self.end = datetime.combine(end_date, time.min, tzinfo=pytz.utc)
+        self.seller_ids = array("q")
+        self.buyer_ids = array("q")
+        self.company_ids = array("q")
+        self.category_ids = array("q")
+        self.product_ids = array("q")
+        self.products_by_company: Dict[int, array] = {}
+
+    def exists(self) -> bool:
+        return User.objects.filter(email__endswith="@" + EMAIL_DOMAIN).exists()
+
+    def _words(self, count: int) -> str:
+        return " ".join(self.rng.choice(WORDS) for _ in range(count))
+
+    def _date(self, max_days: int) -> datetime:
+        return self.end - timedelta(seconds=self.rng.randrange(max_days * 86400))
+
+    def _price(self, maximum: int = 9999) -> Decimal:
+        return Decimal(self.rng.randrange(100, maximum * 100)) / 100
+
+    def _key(self, prefix: str, index: int) -> str:
+        # Deterministic values of the unique fields filled with random strings.
+        return "%s%0*d" % (prefix, 12 - len(prefix), index)
+
+    def _bulk_create(self, model, objects: Sequence) -> List:
+        with transaction.atomic():
+            return model.objects.bulk_create(objects, batch_size=self.batch_size)
+
+    def _create_users(self, role: str, count: int, ids: array) -> Iterator[str]:
+        # Hashing is slow on purpose, all the users share the same hash.
+        password = make_password("password")
+        for batch in _batches(count, self.batch_size):
+            users = [
+                User(
+                    email="%s-%d@%s" % (role, index, EMAIL_DOMAIN),
+                    user_id=self._key(role[0], index),
+                    jwt_token_key=self._key(role[0], index),
+                    password=password,
+                    first_name=self.rng.choice(WORDS).capitalize(),
+                    last_name=self.rng.choice(WORDS).capitalize(),
+                    is_seller=role == "seller",
+                    is_buyer=role == "buyer",
+                    date_joined=self._date(365),
+                )
+                for index in batch
+            ]
+            ids.extend(user.pk for user in self._bulk_create(User, users))
+        yield "Users (%s): %d" % (role, count)
+
+    def create_users(self) -> Iterator[str]:
+        yield from self._create_users("seller", self.counts["companies"], self.seller_ids)
+        yield from self._create_users("buyer", self.counts["buyers"], self.buyer_ids)
+
+    def create_companies(self) -> Iterator[str]:
+        companies = []
+        for index, user_id in enumerate(self.seller_ids):
+            name = "%s %d" % (self._words(2).title(), index)
+            companies.append(
+                Company(
+                    user_id=user_id,
+                    name=name,
+                    slug=slugify(name),
+                    website="https://%s.example.com" % slugify(name),
+                    founded_year=self.rng.randint(1950, 2021),
+                    no_of_employees=self.rng.choice(EmployeeNumber.CHOICES)[0].upper(),
+                    content_plaintext=self._words(30),
+                    export_countries=self.rng.sample(COUNTRIES, 3),
+                    size=self.rng.choice(CompanySize.CHOICES)[0],
+                    type=self.rng.choice(CompanyType.CHOICES)[0],
+                    is_published=self.rng.random() < 0.9,
+                    is_verified=self.rng.random() < 0.5,
+                )
+            )
+        for batch in _batches(len(companies), self.batch_size):
+            self._bulk_create(Company, companies[batch.start : batch.stop])
+        self.company_ids.extend(company.pk for company in companies)
+        yield "Companies: %d" % len(companies)
+
+    def create_categories(self) -> Iterator[str]:
+        parents = [None]
+        total = 0
+        for level, children in enumerate(CATEGORY_TREE):
+            categories = []
+            for parent_index, parent in enumerate(parents):
+                for index in range(children):
+                    path = "%d-%d-%d" % (level, parent_index, index)
+                    name = "%s %s" % (self.rng.choice(WORDS).capitalize(), path)
+                    categories.append(
+                        Category(
+                            name=name,
+                            slug="dataset-%s" % path,
+                            parent_id=parent,
+                            description_plaintext=self._words(12),
+                        )
+                    )
+            with transaction.atomic():
+                bulk_create_tree(Category, categories)
+            parents = [category.pk for category in categories]
+            total += len(categories)
+        Category.tree.rebuild()
+        # Products are assigned to the leaves of the tree.
+        self.category_ids.extend(parents)
+        yield "Categories: %d" % total
+
+    def create_products(self) -> Iterator[str]:
+        companies = list(self.company_ids)
+        self.rng.shuffle(companies)
+        weights = get_zipf_weights(len(companies), COMPANY_SIZE_EXPONENT)
+        for company_id in companies:
+            self.products_by_company[company_id] = array("q")
+        for batch in _batches(self.counts["products"], self.batch_size):
+            owners = self.rng.choices(companies, cum_weights=weights, k=len(batch))
+            products = []
+            for index, company_id in zip(batch, owners):
+                name = self._words(3).capitalize()
+                products.append(
+                    Product(
+                        company_id=company_id,
+                        name=name,
+                        slug="%s-%d" % (slugify(name), index),
+                        description_plaintext=self._words(40),
+                        hs_code="%06d" % self.rng.randrange(10000, 970000),
+                        category_id=self.rng.choice(self.category_ids),
+                        unit_number=self.rng.randint(1, 100),
+                        unit=self.rng.choice(UNITS),
+                        unit_price=self._price(),
+                        minimum_order_quantity=self.rng.choice([1, 10, 100, 1000]),
+                        quantity_unit=self.rng.choice(UNITS),
+                        organic=self.rng.random() < 0.2,
+                        private_label=self.rng.random() < 0.5,
+                        is_published=self.rng.random() < 0.9,
+                        tags='["%s"]' % self.rng.choice(WORDS),
+                    )
+                )
+            for product in self._bulk_create(Product, products):
+                self.product_ids.append(product.pk)
+                self.products_by_company[product.company_id].append(product.pk)
+        yield "Products: %d" % len(self.product_ids)
+
+    def _popular_products(self) -> Callable[[int], List[int]]:
+        """Return a sampler of the products skewed towards the popular ones."""
+        products = list(self.product_ids)
+        self.rng.shuffle(products)
+        weights = get_zipf_weights(len(products), PRODUCT_POPULARITY_EXPONENT)
+        return lambda k: self.rng.choices(products, cum_weights=weights, k=k)
+
+    def create_reviews(self) -> Iterator[str]:
+        sample = self._popular_products()
+        for batch in _batches(self.counts["reviews"], self.batch_size):
+            reviews = [
+                ProductReviews(
+                    user_id=self.rng.choice(self.buyer_ids),
+                    product_id=product_id,
+                    name=self._words(2).title(),
+                    rating=self.rng.choices([1, 2, 3, 4, 5], [5, 5, 10, 30, 50])[0],
+                    review=self._words(25),
+                    location=self.rng.choice(COUNTRIES),
+                    like=self.rng.randrange(50),
+                    unlike=self.rng.randrange(10),
+                )
+                for product_id in sample(len(batch))
+            ]
+            self._bulk_create(ProductReviews, reviews)
+        yield "Product reviews: %d" % self.counts["reviews"]
+
+    def create_offers(self) -> Iterator[str]:
+        offers = []
+        for index in range(self.counts["offers"]):
+            company_index = self.rng.randrange(len(self.company_ids))
+            start = self._date(180)
+            offers.append(
+                Offers(
+                    company_id=self.company_ids[company_index],
+                    user_id=self.seller_ids[company_index],
+                    title=self._words(3).capitalize(),
+                    slug="dataset-offer-%d" % index,
+                    value=self.rng.randint(5, 50),
+                    unit="%",
+                    start_date=start,
+                    end_date=start + timedelta(days=self.rng.randint(7, 90)),
+                )
+            )
+        self._bulk_create(Offers, offers)
+        through = Offers.products.through
+        links = []
+        for offer in offers:
+            products = self.products_by_company[offer.company_id]
+            for product_id in set(self.rng.choices(products, k=3) if products else []):
+                links.append(through(offers_id=offer.pk, product_id=product_id))
+        self._bulk_create(through, links)
+        yield "Offers: %d" % len(offers)
+
+    def create_port_deals(self) -> Iterator[str]:
+        deals = []
+        for index in range(self.counts["port_deals"]):
+            start = self._date(180)
+            deals.append(
+                PortDeals(
+                    company_id=self.rng.choice(self.company_ids),
+                    name=self._words(3).capitalize(),
+                    slug="dataset-port-deal-%d" % index,
+                    lat=self.rng.uniform(36, 42),
+                    lng=self.rng.uniform(26, 45),
+                    product_name=self._words(2),
+                    hs_code="%06d" % self.rng.randrange(10000, 970000),
+                    quantity=self.rng.randint(1, 40),
+                    container_number="C%09d" % index,
+                    unit=self.rng.choice(UNITS),
+                    quantity_unit=self.rng.choice(UNITS),
+                    price=float(self._price()),
+                    discount_percentage=self.rng.randint(0, 30),
+                    description=self._words(30),
+                    start_date=start,
+                    end_date=start + timedelta(days=self.rng.randint(7, 60)),
+                )
+            )
+        self._bulk_create(PortDeals, deals)
+        yield "Port deals: %d" % len(deals)
+
+    def create_inquiries(self) -> Iterator[str]:
+        """Create the chat rooms of the buyers and sellers with their inquiries."""
+        sample = self._popular_products()
+        rooms = []
+        queries = []
+        for index, product_id in enumerate(sample(self.counts["inquiries"])):
+            rooms.append(
+                ProductQueryUsers(
+                    user_id=self.rng.choice(self.buyer_ids),
+                    room_id=self._key("r", index),
+                )
+            )
+            queries.append(
+                ProductQuery(
+                    product_id=product_id,
+                    name=self._words(2).title(),
+                    quantity=self.rng.choice([10, 100, 500, 1000]),
+                    message=self._words(20),
+                    country=self.rng.choice(COUNTRIES),
+                )
+            )
+        companies = dict(
+            Product.objects.filter(
+                pk__in={query.product_id for query in queries}
+            ).values_list("pk", "company_id")
+        )
+        for room, query in zip(rooms, queries):
+            room.seller_id = companies[query.product_id]
+        self._bulk_create(ProductQueryUsers, rooms)
+        for room, query in zip(rooms, queries):
+            query.product_query_user = room
+        self._bulk_create(ProductQuery, queries)
+        yield "Inquiries: %d" % len(queries)
+
+        sellers = dict(zip(self.company_ids, self.seller_ids))
+        for batch in _batches(self.counts["chat_messages"], self.batch_size):
+            messages = []
+            for _ in batch:
+                room = self.rng.choice(rooms)
+                participants = [room.user_id, sellers[room.seller_id]]
+                if self.rng.random() < 0.5:
+                    participants.reverse()
+                messages.append(
+                    QueryChat(
+                        by_id=participants[0],
+                        to_id=participants[1],
+                        query=room,
+                        message=self._words(12),
+                    )
+                )
+            self._bulk_create(QueryChat, messages)
+        yield "Chat messages: %d" % self.counts["chat_messages"]
+
+    def create_trackings(self) -> Iterator[str]:
+        start = self.end - timedelta(days=TRACKING_DAYS)
+        if is_partitioned():
+            create_partitions(first_month=get_month_start(start))
+        sample = self._popular_products()
+        for batch in _batches(self.counts["trackings"], self.batch_size):
+            types = self.rng.choices(TRACKING_TYPES, TRACKING_TYPE_WEIGHTS, k=len(batch))
+            products = iter(sample(len(batch)))
+            trackings = []
+            for tracking_type in types:
+                device_type, device, browser, system = self.rng.choices(
+                    DEVICES, DEVICE_WEIGHTS
+                )[0]
+                tracking = Tracking(
+                    date=self._date(TRACKING_DAYS),
+                    type=tracking_type,
+                    ip="%d.%d.%d.%d" % tuple(self.rng.randrange(1, 255) for _ in range(4)),
+                    country=self.rng.choice(COUNTRIES),
+                    referrer=self.rng.choice(REFERRERS),
+                    device_type=device_type,
+                    device=device,
+                    browser=browser,
+                    system=system,
+                )
+                product_id = next(products)
+                if tracking_type == TrackingTypes.PRODUCT:
+                    tracking.product_id = product_id
+                elif tracking_type == TrackingTypes.COMPANY:
+                    tracking.company_id = self.rng.choice(self.company_ids)
+                elif tracking_type == TrackingTypes.CATEGORY:
+                    tracking.category_id = self.rng.choice(self.category_ids)
+                if self.rng.random() < 0.3:
+                    tracking.user_id = self.rng.choice(self.buyer_ids)
+                trackings.append(tracking)
+            self._bulk_create(Tracking, trackings)
+        yield "Trackings: %d" % self.counts["trackings"]
+
+    def generate(self) -> Iterator[str]:
+        yield from self.create_users()
+        yield from self.create_companies()
+        yield from self.create_categories()
+        yield from self.create_products()
+        yield from self.create_reviews()
+        yield from self.create_offers()
+        yield from self.create_port_deals()
+        yield from self.create_inquiries()
+        yield from self.create_trackings()
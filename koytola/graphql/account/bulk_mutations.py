@@ -5,6 +5,7 @@ from django.core.exceptions import ValidationError
 
 from ...account import models
 from ...account.error_codes import AccountErrorCode
+from ...account.utils import invalidate_auth_users
 from ...core.permissions import AccountPermissions
 from ..core.mutations import BaseBulkMutation, ModelBulkDeleteMutation
 from ..core.types.common import AccountError, StaffError
@@ -114,6 +115,8 @@ class UserBulkSetActive(BaseBulkMutation):
 
     @classmethod
     def bulk_action(cls, queryset, is_active):
+        # Updates of the queryset don't send signals.
+        invalidate_auth_users(queryset.values_list("user_id", flat=True))
         queryset.update(is_active=is_active)
 
 
@@ -1,5 +1,16 @@
-from ...analytics import TrackingTypes
+import graphene
+
+from ...analytics import TrackingStatsGranularity, TrackingTypes
 from ...graphql.core.enums import to_enum
 
 
 TrackingTypeEnum = to_enum(TrackingTypes, type_name="TrackingTypeEnum")
+TrackingStatsGranularityEnum = to_enum(
+    TrackingStatsGranularity, type_name="TrackingStatsGranularityEnum"
+)
+
+
+class TrackingStatsGroupByEnum(graphene.Enum):
+    COUNTRY = "country"
+    DEVICE_TYPE = "device_type"
+    REFERRER_HOST = "referrer_host"
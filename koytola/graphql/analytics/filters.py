@@ -1,4 +1,7 @@
+from datetime import datetime, time, timedelta
+
 import django_filters
+from django.utils.timezone import make_aware
 from graphene_django.filter import GlobalIDMultipleChoiceFilter
 
 from ...analytics.models import Tracking
@@ -8,12 +11,20 @@ from ..core.filters import ListObjectTypeFilter, ObjectTypeFilter
 from ..core.types import FilterInputObjectType
 from ..core.types.common import DateRangeInput
 from ..utils import get_nodes
-from ..utils.filters import filter_by_query_param, filter_range_field
+from ..utils.filters import filter_by_query_param
 from .enums import TrackingTypeEnum
 
 
 def filter_date(qs, _, value):
-    return filter_range_field(qs, "date__date", value)
+    # Compared with the bounds of the days instead of casting the dates, so that
+    # only the matching partitions of the trackings are scanned.
+    gte, lte = value.get("gte"), value.get("lte")
+    if gte:
+        qs = qs.filter(date__gte=make_aware(datetime.combine(gte, time.min)))
+    if lte:
+        next_day = lte + timedelta(days=1)
+        qs = qs.filter(date__lt=make_aware(datetime.combine(next_day, time.min)))
+    return qs
 
 
 def filter_search(qs, _, value):
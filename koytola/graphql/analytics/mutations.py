@@ -1,14 +1,17 @@
+from django.conf import settings
 from django.core.exceptions import ValidationError
 import graphene
 
 from ...account import models as account_models
 from ...analytics import models
-from ...analytics.error_codes import TrackingErrorCode
+from ...analytics.error_codes import AnalyticsErrorCode, TrackingErrorCode
+from ...analytics.ingestion import track_events
 from ...core.permissions import AnalyticsPermissions
 from ...product import models as product_models
 from ...profile import models as profile_models
-from ..core.mutations import ModelDeleteMutation, ModelMutation
+from ..core.mutations import BaseMutation, ModelDeleteMutation, ModelMutation
 from ..core.types.common import AnalyticsError
+from ..core.utils import from_global_id_strict_type
 from .types import Tracking
 from .utils import validate_tracking_instance
 from .enums import TrackingTypeEnum
@@ -54,6 +57,116 @@ class TrackingInput(graphene.InputObjectType):
     )
 
 
+class TrackingEventInput(graphene.InputObjectType):
+    type = TrackingTypeEnum(
+        description=(
+            "Tracking type. Determined by the item the event is on if not provided."
+        ),
+        required=False,
+    )
+    category = graphene.ID(description="Category which event is on.")
+    company = graphene.ID(description="Company which event is on.")
+    product = graphene.ID(description="Product which event is on.")
+    referrer = graphene.String(
+        description="Referrer of the event, the referrer of the request by default."
+    )
+    parameters = graphene.JSONString(
+        description="Other tracking parameters in JSON format."
+    )
+
+
+class TrackingEventsCreate(BaseMutation):
+    accepted = graphene.Int(
+        required=True, description="Number of the events accepted for recording."
+    )
+    dropped = graphene.Int(
+        required=True,
+        description=(
+            "Number of the events dropped as the server is overloaded. "
+            "Clients should send them again later."
+        ),
+    )
+
+    class Arguments:
+        events = graphene.List(
+            graphene.NonNull(TrackingEventInput),
+            required=True,
+            description="List of the events to record.",
+        )
+
+    class Meta:
+        description = (
+            "Records a batch of tracking events. Events are enriched with the "
+            "location and the device of the client and written asynchronously."
+        )
+        error_type_class = AnalyticsError
+        error_type_field = "analytics_errors"
+
+    @classmethod
+    def clean_item_id(cls, event, field, only_type):
+        global_id = event.get(field)
+        if not global_id:
+            return None
+        pk = from_global_id_strict_type(global_id, only_type, field=field)
+        if not pk.isdigit():
+            raise ValidationError(
+                {
+                    field: ValidationError(
+                        "Couldn't resolve to a node: %s" % global_id,
+                        code=AnalyticsErrorCode.NOT_FOUND.value,
+                    )
+                }
+            )
+        return int(pk)
+
+    @classmethod
+    def clean_events(cls, events):
+        if len(events) > settings.TRACKING_EVENTS_MAX:
+            raise ValidationError(
+                {
+                    "events": ValidationError(
+                        "Cannot record more than %s events at once."
+                        % settings.TRACKING_EVENTS_MAX,
+                        code=AnalyticsErrorCode.INVALID.value,
+                    )
+                }
+            )
+        # Item ids are only decoded here, not checked against the database, to
+        # keep the events cheap to receive.
+        cleaned_events = []
+        for event in events:
+            cleaned_event = {
+                "type": event.get("type"),
+                "category_id": cls.clean_item_id(event, "category", "Category"),
+                "company_id": cls.clean_item_id(event, "company", "Company"),
+                "product_id": cls.clean_item_id(event, "product", "Product"),
+                "referrer": event.get("referrer"),
+                "parameters": event.get("parameters"),
+            }
+            items = [
+                cleaned_event["category_id"],
+                cleaned_event["company_id"],
+                cleaned_event["product_id"],
+            ]
+            if len([item for item in items if item is not None]) > 1:
+                raise ValidationError(
+                    {
+                        "events": ValidationError(
+                            "More than one item provided.",
+                            code=AnalyticsErrorCode.INVALID.value,
+                        )
+                    }
+                )
+            cleaned_events.append(cleaned_event)
+        return cleaned_events
+
+    @classmethod
+    def perform_mutation(cls, _root, info, **data):
+        events = cls.clean_events(data["events"])
+        accepted = track_events(info.context, events)
+        return TrackingEventsCreate(accepted=accepted, dropped=len(events) - accepted)
+
+
 class TrackingUpdate(ModelMutation):
     class Arguments:
         id = graphene.ID(required=True, description="ID of a tracking to update.")
@@ -1,11 +1,30 @@
+import binascii
+
 import graphene
-from django.db.models import Q
+from django.db.models import Q, Sum
+from graphql.error import GraphQLError
 
+from ...analytics import TrackingStatsGranularity, TrackingTypes
 from ...analytics.models import (
+    DailyTrackingStats,
+    HourlyTrackingStats,
     Tracking
 )
 from ...core.exceptions import PermissionDenied
 from ...core.permissions import AnalyticsPermissions
+from ...product.models import Product
+from ...profile.models import Company
+from .types import TrackingStats
+
+STATS_MODELS = {
+    TrackingStatsGranularity.HOUR: HourlyTrackingStats,
+    TrackingStatsGranularity.DAY: DailyTrackingStats,
+}
+STATS_ITEM_TYPES = {
+    "Category": TrackingTypes.CATEGORY,
+    "Company": TrackingTypes.COMPANY,
+    "Product": TrackingTypes.PRODUCT,
+}
 
 
 def resolve_tracking(info, id=None):
@@ -33,6 +52,60 @@ def resolve_trackings(info, **_kwargs):
     raise PermissionDenied()
 
 
+def _get_stats_item(item_id):
+    try:
+        item_type, pk = graphene.Node.from_global_id(item_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        item_type, pk = None, ""
+    if item_type not in STATS_ITEM_TYPES or not pk.isdigit():
+        raise GraphQLError("Must receive a Category, Company or Product id.")
+    return STATS_ITEM_TYPES[item_type], int(pk)
+
+
+def _can_view_tracking_stats(user, tracking_type, pk):
+    if user.has_perms([AnalyticsPermissions.MANAGE_TRACKING]):
+        return True
+    # Sellers can see the stats of their company and its products.
+    if tracking_type == TrackingTypes.COMPANY:
+        return Company.objects.filter(pk=pk, user=user).exists()
+    if tracking_type == TrackingTypes.PRODUCT:
+        return Product.objects.filter(pk=pk, company__user=user).exists()
+    return False
+
+
+def resolve_tracking_stats(
+    info, item_id, granularity=TrackingStatsGranularity.DAY, period=None, group_by=None
+):
+    """Return the views of the item read only from the rolled up stats."""
+    user = info.context.user
+    if not user or user.is_anonymous:
+        raise PermissionDenied()
+    tracking_type, pk = _get_stats_item(item_id)
+    if not _can_view_tracking_stats(user, tracking_type, pk):
+        raise PermissionDenied()
+
+    stats = STATS_MODELS[granularity].objects.filter(type=tracking_type, item_id=pk)
+    if period:
+        if period.get("gte"):
+            stats = stats.filter(period_start__gte=period["gte"])
+        if period.get("lte"):
+            stats = stats.filter(period_start__lte=period["lte"])
+    group_by = list(dict.fromkeys(group_by or []))
+    rows = (
+        stats.values("period_start", *group_by)
+        .annotate(total=Sum("views"))
+        .order_by("period_start", *group_by)
+    )
+    return [
+        TrackingStats(
+            period=row["period_start"],
+            views=row["total"],
+            **{field: row[field] for field in group_by},
+        )
+        for row in rows
+    ]
+
+
 def resolve_user_trackings(info, **_kwargs):
     user = info.context.user
     if user and not user.is_anonymous:
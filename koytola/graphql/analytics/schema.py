@@ -2,15 +2,18 @@ import graphene
 
 from ...core.permissions import AnalyticsPermissions
 from ..core.fields import FilterInputConnectionField
+from ..core.types.common import DateTimeRangeInput
 from ..decorators import permission_required
 from .bulk_mutations import TrackingBulkDelete
+from .enums import TrackingStatsGranularityEnum, TrackingStatsGroupByEnum
 from .filters import (
     TrackingFilterInput,
     UserTrackingFilterInput
 )
-from .mutations import TrackingDelete, TrackingUpdate
+from .mutations import TrackingDelete, TrackingEventsCreate, TrackingUpdate
 from .resolvers import (
     resolve_tracking,
+    resolve_tracking_stats,
     resolve_trackings,
     resolve_user_trackings,
 )
@@ -20,6 +23,7 @@ from .sorters import (
 )
 from .types import (
     Tracking,
+    TrackingStats,
     UserTracking,
 )
 
@@ -40,6 +44,28 @@ class AnalyticsQueries(graphene.ObjectType):
         sort_by=TrackingSortingInput(description="Sort tracking analytics."),
         description="List of tracking analytics.",
     )
+    tracking_stats = graphene.List(
+        graphene.NonNull(TrackingStats),
+        item_id=graphene.Argument(
+            graphene.ID,
+            required=True,
+            description="ID of the category, company or product.",
+        ),
+        granularity=graphene.Argument(
+            TrackingStatsGranularityEnum,
+            default_value="day",
+            description="Length of the periods the views are counted in.",
+        ),
+        period=DateTimeRangeInput(description="Range of the periods to return."),
+        group_by=graphene.List(
+            graphene.NonNull(TrackingStatsGroupByEnum),
+            description="Dimensions the views are broken down by.",
+        ),
+        description=(
+            "Number of the views of the item in the periods, counted from the "
+            "trackings rolled up after each hour."
+        ),
+    )
     user_trackings = FilterInputConnectionField(
         UserTracking,
         filter=UserTrackingFilterInput(
@@ -57,6 +83,9 @@ class AnalyticsQueries(graphene.ObjectType):
     def resolve_trackings(self, info, **kwargs):
         return resolve_trackings(info, **kwargs)
 
+    def resolve_tracking_stats(self, info, **kwargs):
+        return resolve_tracking_stats(info, **kwargs)
+
     def resolve_user_trackings(self, info, **kwargs):
         return resolve_user_trackings(info, **kwargs)
 
@@ -64,4 +93,5 @@ class AnalyticsQueries(graphene.ObjectType):
 class AnalyticsMutations(graphene.ObjectType):
     tracking_bulk_delete = TrackingBulkDelete.Field()
     tracking_delete = TrackingDelete.Field()
+    tracking_events_create = TrackingEventsCreate.Field()
     tracking_update = TrackingUpdate.Field()
@@ -90,6 +90,17 @@ class Tracking(CountableDjangoObjectType):
         return None
 
 
+class TrackingStats(graphene.ObjectType):
+    period = graphene.DateTime(required=True, description="Start of the period.")
+    country = graphene.String(description="Country of the visitors.")
+    device_type = graphene.String(description="Device type of the visitors.")
+    referrer_host = graphene.String(description="Host the visitors came from.")
+    views = graphene.Int(required=True, description="Number of the views.")
+
+    class Meta:
+        description = "Number of the views of an item in a period."
+
+
 class UserTracking(CountableDjangoObjectType):
     type = TrackingTypeEnum(description="Tracking analytics type.")
 
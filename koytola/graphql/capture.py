@@ -0,0 +1,106 @@
+"""Sampled capture of the GraphQL traffic for the load tests.
+
+A sample of the requests is logged to the `koytola.graphql.capture` logger as
+JSON Lines, written to `GRAPHQL_CAPTURE_PATH`. Each line holds the operation
+name, the hash and the text of the query, the variables, the status and the
+latency, which is what the replay_traffic command needs to send the same
+traffic to another build.
+
+Variables and inline arguments whose names contain any of the words of
+`GRAPHQL_CAPTURE_REDACTED_FIELDS` are redacted, and nothing is logged about
+the user who sent the request. Mutations are not captured unless
+`GRAPHQL_CAPTURE_MUTATIONS` is set, since replaying them would change data.
+"""
+import hashlib
+import json
+import logging
+import random
+import re
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+from graphql.error import GraphQLSyntaxError
+from graphql.language.parser import parse
+from graphql.utils.get_operation_ast import get_operation_ast
+
+capture_logger = logging.getLogger("koytola.graphql.capture")
+
+REDACTED = "[REDACTED]"
+# A string literal of an argument, e.g. `password: "secret"`.
+ARGUMENT_PATTERN = re.compile(r'(\b(\w+)\s*:\s*)"(?:[^"\\]|\\.)*"')
+
+
+def is_redacted(name: str) -> bool:
+    name = name.lower().replace("_", "")
+    return any(word in name for word in settings.GRAPHQL_CAPTURE_REDACTED_FIELDS)
+
+
+def redact_variables(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if is_redacted(key) else redact_variables(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [redact_variables(item) for item in value]
+    return value
+
+
+def redact_query(query: str) -> str:
+    def _redact(match):
+        if is_redacted(match.group(2)):
+            return '%s"%s"' % (match.group(1), REDACTED)
+        return match.group(0)
+
+    return ARGUMENT_PATTERN.sub(_redact, query)
+
+
+def get_query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def get_operation_type(
+    query: str, operation_name: Optional[str] = None
+) -> Optional[str]:
+    """Return the type of the operation that the document would execute."""
+    try:
+        document = parse(query)
+    except GraphQLSyntaxError:
+        return None
+    operation = get_operation_ast(document, operation_name)
+    return operation.operation if operation else None
+
+
+def should_capture(query: Optional[str], operation_name: Optional[str] = None) -> bool:
+    if not settings.GRAPHQL_CAPTURE_PATH or not isinstance(query, str):
+        return False
+    if random.random() >= settings.GRAPHQL_CAPTURE_SAMPLE_RATE:
+        return False
+    # Invalid documents are not captured, they can't be replayed.
+    operation_type = get_operation_type(query, operation_name)
+    if operation_type == "query":
+        return True
+    return bool(operation_type and settings.GRAPHQL_CAPTURE_MUTATIONS)
+
+
+def capture(
+    query: str,
+    variables: Optional[dict],
+    operation_name: Optional[str],
+    status: int,
+    errors: int,
+    duration: float,
+):
+    entry = {
+        "timestamp": timezone.now(),
+        "operation_name": operation_name,
+        "query_hash": get_query_hash(query),
+        "query": redact_query(query),
+        "variables": redact_variables(variables or {}),
+        "status": status,
+        "errors": errors,
+        "duration_ms": round(duration * 1000, 3),
+    }
+    capture_logger.info(json.dumps(entry, cls=DjangoJSONEncoder))
@@ -6,6 +6,8 @@ from django.http import HttpRequest
 from promise import Promise
 from promise.dataloader import DataLoader as BaseLoader
 
+from ...core.profiling import record_batch
+
 K = TypeVar("K")
 R = TypeVar("R")
 
@@ -38,6 +40,7 @@ class DataLoader(BaseLoader, Generic[K, R]):
         ) as scope:
             span = scope.span
             span.set_tag(opentracing.tags.COMPONENT, "dataloaders")
+            record_batch(self.__class__.__name__, len(keys))
             results = self.batch_load(keys)
             if not isinstance(results, Promise):
                 return Promise.resolve(results)
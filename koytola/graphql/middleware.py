@@ -1,3 +1,4 @@
+import time
 from typing import Optional
 
 import opentracing
@@ -9,8 +10,11 @@ from django.utils.functional import SimpleLazyObject
 from graphql import ResolveInfo
 
 from ..app.models import App
+from ..app.utils import get_app_by_token
 from ..core.exceptions import ReadOnlyException
+from ..core.profiling import is_timing_resolvers, record_resolver
 from ..core.tracing import should_trace
+from .nplusone import is_detecting, resolving
 from .views import API_PATH, GraphQLView
 
 
@@ -45,9 +49,41 @@ class OpentracingGrapheneMiddleware:
             return next_(root, info, **kwargs)
 
 
+class ProfilingMiddleware:
+    """Record the time spent in each resolver of the profiled requests.
+
+    Only the resolver itself is timed, the values it returns are completed
+    after it returns. Resolvers returning promises of data loaders are timed
+    until the promise is created, the loaders record their batches themselves.
+    """
+
+    @staticmethod
+    def resolve(next_, root, info: ResolveInfo, **kwargs):
+        if not is_timing_resolvers() or not should_trace(info):
+            return next_(root, info, **kwargs)
+        start = time.perf_counter()
+        try:
+            return next_(root, info, **kwargs)
+        finally:
+            record_resolver(
+                f"{info.parent_type.name}.{info.field_name}",
+                time.perf_counter() - start,
+            )
+
+
+class NPlusOneMiddleware:
+    """Attribute the queries to the fields whose resolvers ran them."""
+
+    @staticmethod
+    def resolve(next_, root, info: ResolveInfo, **kwargs):
+        if not is_detecting():
+            return next_(root, info, **kwargs)
+        with resolving(info.path):
+            return next_(root, info, **kwargs)
+
+
 def get_app(auth_token) -> Optional[App]:
-    qs = App.objects.filter(tokens__auth_token=auth_token, is_active=True)
-    return qs.first()
+    return get_app_by_token(auth_token)
 
 
 def app_middleware(next, root, info, **kwargs):
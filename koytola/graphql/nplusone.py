@@ -0,0 +1,142 @@
+"""Detection of the N+1 queries of the GraphQL operations, for dev and CI.
+
+During an operation, each SQL query is reduced to its shape, i.e. the query
+without its parameters, and the shapes are counted along with the paths of
+the fields whose resolvers ran them, e.g. `products.edges.node.totalRatting`.
+A shape run more than `GRAPHQL_NPLUSONE_THRESHOLD` times is reported once the
+operation completes, depending on `GRAPHQL_NPLUSONE_DETECTION`:
+
+* `"off"` - queries are not inspected at all;
+* `"log"` - the shapes are logged as warnings;
+* `"raise"` - an error is added to the response as well, so that tests of the
+  operation fail.
+"""
+import logging
+import re
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+DETECTION_OFF = "off"
+DETECTION_LOG = "log"
+DETECTION_RAISE = "raise"
+
+STRING_PATTERN = re.compile(r"'(?:[^']|'')*'")
+NUMBER_PATTERN = re.compile(r"\b\d+(?:\.\d+)?\b")
+PLACEHOLDER_PATTERN = re.compile(r"%s|\?")
+IN_PATTERN = re.compile(r"\bIN \((?:\?, )*\?\)", re.IGNORECASE)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+_detector: ContextVar[Optional["Detector"]] = ContextVar("nplusone", default=None)
+_path: ContextVar[str] = ContextVar("nplusone_path", default="")
+
+
+class NPlusOneError(Exception):
+    pass
+
+
+class RepeatedQuery(NamedTuple):
+    shape: str
+    count: int
+    paths: List[str]
+
+    def __str__(self):
+        return "%d queries of the same shape from %s: %s" % (
+            self.count,
+            ", ".join(self.paths) or "the operation",
+            self.shape,
+        )
+
+
+def get_sql_shape(sql: str) -> str:
+    """Return the query with its parameters and literals replaced with `?`."""
+    shape = STRING_PATTERN.sub("?", sql)
+    shape = NUMBER_PATTERN.sub("?", shape)
+    shape = PLACEHOLDER_PATTERN.sub("?", shape)
+    shape = WHITESPACE_PATTERN.sub(" ", shape).strip()
+    # Lists of the IDs of different lengths have the same shape.
+    return IN_PATTERN.sub("IN (...)", shape)
+
+
+def get_field_path(path: Optional[List]) -> str:
+    """Return the path of the field without the indexes of the list items."""
+    return ".".join(str(part) for part in path or [] if not isinstance(part, int))
+
+
+class Detector:
+    def __init__(self, threshold: int):
+        self.threshold = threshold
+        self.counts: Counter = Counter()
+        self.paths: Dict[str, Set[str]] = defaultdict(set)
+
+    def record(self, sql: str):
+        shape = get_sql_shape(sql)
+        self.counts[shape] += 1
+        path = _path.get()
+        if path:
+            self.paths[shape].add(path)
+
+    def get_repeated_queries(self) -> List[RepeatedQuery]:
+        return [
+            RepeatedQuery(shape, count, sorted(self.paths[shape]))
+            for shape, count in self.counts.most_common()
+            if count > self.threshold
+        ]
+
+
+def _detector_wrapper(execute, sql, params, many, context):
+    detector = _detector.get()
+    if detector is not None:
+        detector.record(sql)
+    return execute(sql, params, many, context)
+
+
+@contextmanager
+def detect_n_plus_one(operation_name: Optional[str]) -> Iterator[Optional[Detector]]:
+    """Count the query shapes of the block when the detection is enabled.
+
+    Repeated shapes are logged on exit, the caller raises them if configured to.
+    """
+    mode = settings.GRAPHQL_NPLUSONE_DETECTION
+    if mode == DETECTION_OFF:
+        yield None
+        return
+    detector = Detector(settings.GRAPHQL_NPLUSONE_THRESHOLD)
+    token = _detector.set(detector)
+    try:
+        with connection.execute_wrapper(_detector_wrapper):
+            yield detector
+    finally:
+        _detector.reset(token)
+    for repeated in detector.get_repeated_queries():
+        logger.warning(
+            "N+1 queries in the %s operation: %s", operation_name or "unnamed", repeated
+        )
+
+
+def get_n_plus_one_error(detector: Optional[Detector]) -> Optional[NPlusOneError]:
+    if detector is None or settings.GRAPHQL_NPLUSONE_DETECTION != DETECTION_RAISE:
+        return None
+    repeated = detector.get_repeated_queries()
+    if not repeated:
+        return None
+    return NPlusOneError("; ".join(str(query) for query in repeated))
+
+
+def is_detecting() -> bool:
+    return _detector.get() is not None
+
+
+@contextmanager
+def resolving(path: Optional[List]) -> Iterator[None]:
+    token = _path.set(get_field_path(path))
+    try:
+        yield
+    finally:
+        _path.reset(token)
@@ -1,5 +1,6 @@
 import graphene
 from django.core.exceptions import ValidationError
+from django.db import transaction
 
 from ...core.permissions import PluginsPermissions
 from ...plugins.error_codes import PluginErrorCode
@@ -44,6 +45,7 @@ class PluginUpdate(BaseMutation):
         error_type_field = "plugins_errors"
 
     @classmethod
+    @transaction.atomic
     def perform_mutation(cls, root, info, **data):
         plugin_id = data.get("id")
         data = data.get("input")
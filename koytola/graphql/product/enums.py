@@ -1,11 +1,12 @@
 import graphene
 
-from ...product import ProductUnits, DeliveryTimeOption
+from ...product import CatalogueImportType, ProductUnits, DeliveryTimeOption
 from ...graphql.core.enums import to_enum
 
 
 ProductUnitsEnum = to_enum(ProductUnits, type_name="ProductUnitsEnum")
 DeliveryTimeOptionEnum = to_enum(DeliveryTimeOption, type_name="DeliveryTimeOptionEnum")
+CatalogueImportTypeEnum = to_enum(CatalogueImportType, type_name="CatalogueImportTypeEnum")
 
 
 class ProductStatus(graphene.Enum):
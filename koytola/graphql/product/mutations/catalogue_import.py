@@ -0,0 +1,54 @@
+import graphene
+from django.core.exceptions import ValidationError
+
+from ....core.permissions import ProductPermissions
+from ....product import models
+from ....product.error_codes import ProductErrorCode
+from ....product.tasks import import_catalogue_task
+from ...core.mutations import ModelMutation
+from ...core.types import Upload
+from ...core.types.common import ProductError
+from ..enums import CatalogueImportTypeEnum
+
+
+class CatalogueImportInput(graphene.InputObjectType):
+    type = CatalogueImportTypeEnum(
+        required=True, description="Type of the imported rows."
+    )
+    file = Upload(
+        required=True, description="CSV file in the format of the admin exports."
+    )
+
+
+class CatalogueImportCreate(ModelMutation):
+    class Arguments:
+        input = CatalogueImportInput(
+            required=True, description="Fields required to import a catalogue file."
+        )
+
+    class Meta:
+        description = (
+            "Imports companies, products or product images from a CSV file in the "
+            "background. Rows imported before are skipped."
+        )
+        model = models.CatalogueImport
+        permissions = (ProductPermissions.MANAGE_PRODUCTS,)
+        error_type_class = ProductError
+        error_type_field = "product_errors"
+
+    @classmethod
+    def clean_input(cls, info, instance, data, input_cls=None):
+        cleaned_input = super().clean_input(info, instance, data, input_cls)
+        if not cleaned_input.get("file"):
+            raise ValidationError(
+                {
+                    "file": ValidationError(
+                        "The file is required.", code=ProductErrorCode.REQUIRED
+                    )
+                }
+            )
+        return cleaned_input
+
+    @classmethod
+    def post_save_action(cls, info, instance, cleaned_input):
+        import_catalogue_task.delay(instance.pk)
@@ -21,7 +21,7 @@ from ...core.exceptions import PermissionDenied
 from ...core.permissions import ProductPermissions
 from ..core.validators import validate_one_of_args_is_in_query
 from ..utils.filters import filter_by_query_param
-from ...profile.models import Roetter, CertificateType
+from ...profile.models import Company, Roetter, CertificateType
 
 CATEGORY_SEARCH_FIELDS = ("name",)
 
@@ -243,7 +243,12 @@ def resolve_product_queries(info, company_id=None, **_kwargs):
     if user and not user.is_anonymous:
         if company_id is not None:
             _model, company_pk = graphene.Node.from_global_id(company_id)
-            return ProductQueryUsers.objects.filter(company__id=company_pk)
+            # Inquiries of a company are only shown to its owner.
+            if not Company.objects.filter(pk=company_pk, user=user).exists():
+                raise PermissionDenied()
+            return ProductQueryUsers.objects.filter(
+                seller__id=company_pk, seller__user=user
+            )
         else:
             return ProductQueryUsers.objects.filter(user=user)
     return PermissionDenied()
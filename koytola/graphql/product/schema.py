@@ -1,6 +1,8 @@
 import graphene
 
+from ...core.permissions import ProductPermissions
 from ..core.fields import FilterInputConnectionField
+from ..decorators import permission_required
 from .bulk_mutations import (
     ProductBulkUpdate,
     ProductBulkDelete,
@@ -8,6 +10,7 @@ from .bulk_mutations import (
     ProductBulkUnpublish
 )
 from .filters import ProductFilterInput, PortDealsFilterInput
+from .mutations.catalogue_import import CatalogueImportCreate
 from .mutations.category import (
     CategoryCreate,
     CategoryUpdate,
@@ -81,6 +84,7 @@ from .resolvers import (
 )
 from .sorters import ProductSortingInput, OfferSortingInput, ProductQuerySortingInput, PortDealsSortingInput
 from .types import (
+    CatalogueImport,
     Category,
     Product,
     ProductImage,
@@ -98,6 +102,13 @@ from ..profile.types import Roetter, CertificateType
 
 
 class ProductQueries(graphene.ObjectType):
+    catalogue_import = graphene.Field(
+        CatalogueImport,
+        id=graphene.Argument(
+            graphene.ID, description="ID of the catalogue import.", required=True
+        ),
+        description="Look up a catalogue import by ID.",
+    )
     product_certificate_type = graphene.List(
         CertificateType,
         description="product certificate type."
@@ -235,6 +246,10 @@ class ProductQueries(graphene.ObjectType):
         port_deal_id=graphene.Argument(graphene.ID, description="ID of the Offer."),
     )
 
+    @permission_required(ProductPermissions.MANAGE_PRODUCTS)
+    def resolve_catalogue_import(self, info, id):
+        return graphene.Node.get_node_from_global_id(info, id, CatalogueImport)
+
     def resolve_port_product_gallery(self, info, port_deal_id, **kwargs):
         return resolve_port_product_gallery(info, port_deal_id, **kwargs)
 
@@ -309,6 +324,7 @@ class ProductMutations(graphene.ObjectType):
     # category_create = CategoryCreate.Field()
     # category_update = CategoryUpdate.Field()
     # category_delete = CategoryDelete.Field()
+    catalogue_import_create = CatalogueImportCreate.Field()
     product_create = ProductCreate.Field()
     product_activate = ProductActivate.Field()
     product_publish = ProductPublish.Field()
@@ -3,10 +3,12 @@ from graphene import relay
 from graphene_federation import key
 from ..core.scalars import Array, Json
 from ...graphql.utils import get_user_or_app_from_context
+from ...core.permissions import ProductPermissions
 from ...product import models
 from ..core.connection import CountableDjangoObjectType
 from ..core.types import Image, CountryDisplay
-from .enums import ProductUnitsEnum
+from ..core.types.common import Job
+from .enums import CatalogueImportTypeEnum, ProductUnitsEnum
 from ..core.fields import FilterInputConnectionField
 from .filters import ProductFilterInput
 from .sorters import ProductSortingInput
@@ -184,10 +186,11 @@ class Product(CountableDjangoObjectType):
 
     @staticmethod
     def resolve_thumbnail(root: models.Product, info, size=None, **_kwargs):
-        if root.images:
+        image = root.get_first_image()
+        if image:
             return Image.get_adjusted(
-                image=root.images[0],
-                alt=root.images[0].alt_text,
+                image=image,
+                alt=image.alt_text,
                 size=size,
                 rendition_key_set="products",
                 info=info,
@@ -520,3 +523,28 @@ class OpenExchange(CountableDjangoObjectType):
     @staticmethod
     def resolve_country(root: models.OpenExchange, _info):
         return json.loads(root.rates)
+
+
+class CatalogueImport(CountableDjangoObjectType):
+    type = CatalogueImportTypeEnum(description="Type of the imported rows.")
+    report_url = graphene.String(
+        description="URL of the CSV report with the errors of the failed rows."
+    )
+
+    class Meta:
+        description = "Represents a bulk import of a catalogue file."
+        only_fields = [
+            "id",
+            "created_count",
+            "skipped_count",
+            "failed_count",
+        ]
+        interfaces = [relay.Node, Job]
+        permissions = (ProductPermissions.MANAGE_PRODUCTS,)
+        model = models.CatalogueImport
+
+    @staticmethod
+    def resolve_report_url(root: models.CatalogueImport, info):
+        if root.report:
+            return info.context.build_absolute_uri(root.report.url)
+        return None
@@ -0,0 +1,136 @@
+"""Replay of the captured GraphQL traffic, see `graphql.capture`.
+
+The captured requests are sent in their original order to the target API by
+a pool of workers, optionally limited to a number of requests per second, and
+the latency percentiles are reported for each operation. Requests are sent
+anonymously unless a token is given, which is sent with all of them.
+"""
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+import requests
+
+PERCENTILES = (50, 90, 99)
+
+
+class Entry(NamedTuple):
+    operation_name: str
+    payload: dict
+
+
+class OperationStats(NamedTuple):
+    operation_name: str
+    requests: int
+    errors: int
+    percentiles: Dict[int, float]
+    max_ms: float
+
+
+def load_entries(lines: Iterable[str], operations: Iterable[str] = ()) -> List[Entry]:
+    operations = set(operations)
+    entries = []
+    for line in lines:
+        if not line.strip():
+            continue
+        data = json.loads(line)
+        operation_name = data.get("operation_name") or data["query_hash"][:12]
+        if operations and operation_name not in operations:
+            continue
+        payload = {"query": data["query"], "variables": data.get("variables") or {}}
+        if data.get("operation_name"):
+            payload["operationName"] = data["operation_name"]
+        entries.append(Entry(operation_name, payload))
+    return entries
+
+
+def get_percentile(values: List[float], percentile: int) -> float:
+    """Return the nearest-rank percentile of the sorted values."""
+    index = max(0, -(-len(values) * percentile // 100) - 1)
+    return values[index]
+
+
+class Replay:
+    def __init__(
+        self,
+        url: str,
+        concurrency: int = 8,
+        rate: Optional[float] = None,
+        token: Optional[str] = None,
+        timeout: float = 30,
+    ):
+        self.url = url
+        self.concurrency = concurrency
+        self.rate = rate
+        self.timeout = timeout
+        self.headers = {"Authorization": "JWT %s" % token} if token else {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._durations: Dict[str, List[float]] = {}
+        self._errors: Dict[str, int] = {}
+
+    def _get_session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.headers.update(self.headers)
+        return session
+
+    def _send(self, entry: Entry, start_at: float):
+        delay = start_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        start = time.perf_counter()
+        try:
+            response = self._get_session().post(
+                self.url, json=entry.payload, timeout=self.timeout
+            )
+            failed = response.status_code != 200 or "errors" in response.json()
+        except (requests.RequestException, ValueError):
+            failed = True
+        duration = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self._durations.setdefault(entry.operation_name, []).append(duration)
+            if failed:
+                self._errors[entry.operation_name] = (
+                    self._errors.get(entry.operation_name, 0) + 1
+                )
+
+    def run(self, entries: Iterable[Entry]) -> List[OperationStats]:
+        started = time.monotonic()
+        interval = 1 / self.rate if self.rate else 0
+        # Requests are submitted as the workers free up, so that a large capture
+        # is not queued all at once.
+        pending = threading.BoundedSemaphore(self.concurrency * 2)
+
+        def send(entry: Entry, start_at: float):
+            try:
+                self._send(entry, start_at)
+            finally:
+                pending.release()
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for index, entry in enumerate(entries):
+                pending.acquire()
+                executor.submit(send, entry, started + index * interval)
+        return self.get_stats()
+
+    def get_stats(self) -> List[OperationStats]:
+        stats = []
+        for operation_name, durations in sorted(self._durations.items()):
+            durations = sorted(durations)
+            stats.append(
+                OperationStats(
+                    operation_name=operation_name,
+                    requests=len(durations),
+                    errors=self._errors.get(operation_name, 0),
+                    percentiles={
+                        percentile: get_percentile(durations, percentile)
+                        for percentile in PERCENTILES
+                    },
+                    max_ms=durations[-1],
+                )
+            )
+        return stats
@@ -14,6 +14,7 @@ from ..account.i18n import I18nMixin
 from ..account.types import AddressInput
 from ..core.mutations import BaseMutation, ModelDeleteMutation, ModelMutation
 from ..core.types.common import SiteError
+from ..translations.enums import LanguageCodeEnum
 from .enums import ContactMessageStatusEnum
 from .types import (
     AuthorizationKey,
@@ -71,6 +72,9 @@ class SiteSubscriberInput(graphene.InputObjectType):
     email = graphene.String(
         description="Email of the subscriber.", required=True
     )
+    language_code = LanguageCodeEnum(
+        description="Language in which the subscriber receives newsletters."
+    )
 
 
 class SiteSubscriberUpdateInput(SiteSubscriberInput):
@@ -308,6 +308,7 @@ class SiteSubscriber(CountableDjangoObjectType):
             "id",
             "email",
             "is_active",
+            "language_code",
             "creation_date",
         ]
         model = site_models.SiteSubscriber
@@ -0,0 +1,57 @@
+from datetime import date, timedelta
+
+import pytest
+from django.db.models import Count
+
+from ....core.utils.synthetic_data import DatasetGenerator
+from ....profile.models import Company
+from ..fixtures import ApiClient
+from .utils import Benchmark
+
+
+@pytest.fixture
+def benchmark_dataset(db):
+    # Dates of the dataset are in the future, so that all the port deals are active.
+    generator = DatasetGenerator(
+        scale=0.1, seed=0, end_date=date.today() + timedelta(days=180)
+    )
+    generator.counts["port_deals"] = 25
+    for create in [
+        generator.create_users,
+        generator.create_companies,
+        generator.create_categories,
+        generator.create_products,
+        generator.create_reviews,
+        generator.create_port_deals,
+        generator.create_inquiries,
+    ]:
+        list(create())
+    return generator
+
+
+@pytest.fixture
+def benchmark_company(benchmark_dataset):
+    """Return the company with the most products."""
+    return (
+        Company.objects.annotate(product_count=Count("products"))
+        .order_by("-product_count")
+        .first()
+    )
+
+
+@pytest.fixture
+def benchmark_seller(benchmark_dataset):
+    """Return the company with the most inquiries."""
+    return (
+        Company.objects.annotate(room_count=Count("seller_query"))
+        .order_by("-room_count")
+        .first()
+    )
+
+
+@pytest.fixture
+def benchmark(request):
+    def _benchmark(client: ApiClient) -> Benchmark:
+        return Benchmark(request.node.name, client)
+
+    return _benchmark
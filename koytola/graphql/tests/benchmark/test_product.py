@@ -0,0 +1,160 @@
+import graphene
+import pytest
+
+from ..fixtures import ApiClient
+from .utils import QueryCountGrowth
+
+QUERY_PRODUCTS = """
+    query Products($first: Int) {
+        products(first: $first) {
+            edges {
+                node {
+                    id
+                    name
+                    slug
+                    unitPrice
+                    currency
+                    thumbnail(size: 255) {
+                        url
+                        alt
+                    }
+                    company {
+                        id
+                        name
+                        slug
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.mark.xfail(
+    raises=QueryCountGrowth,
+    strict=True,
+    reason="company and thumbnail are fetched for each product",
+)
+def test_product_list(benchmark_dataset, benchmark):
+    bench = benchmark(ApiClient())
+
+    bench.measure_pages(QUERY_PRODUCTS, lambda size: {"first": size})
+
+
+QUERY_CATEGORIES = """
+    query Categories($first: Int) {
+        categories(first: $first) {
+            edges {
+                node {
+                    id
+                    name
+                    slug
+                    productCount
+                    children {
+                        id
+                        name
+                        slug
+                        productCount
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.mark.xfail(
+    raises=QueryCountGrowth,
+    strict=True,
+    reason="children and product counts are fetched for each category",
+)
+def test_category_tree(benchmark_dataset, benchmark):
+    bench = benchmark(ApiClient())
+
+    bench.measure_pages(QUERY_CATEGORIES, lambda size: {"first": size})
+
+
+QUERY_PORT_DEALS = """
+    query PortDeals($first: Int) {
+        portDeals(first: $first) {
+            edges {
+                node {
+                    id
+                    name
+                    slug
+                    lat
+                    lng
+                    price
+                    currency
+                    startDate
+                    endDate
+                    company {
+                        name
+                        slug
+                    }
+                    portProductGallery {
+                        image {
+                            url
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.mark.xfail(
+    raises=QueryCountGrowth,
+    strict=True,
+    reason="company and gallery are fetched for each port deal",
+)
+def test_port_deals_map(benchmark_dataset, benchmark):
+    bench = benchmark(ApiClient())
+
+    bench.measure_pages(QUERY_PORT_DEALS, lambda size: {"first": size})
+
+
+QUERY_SELLER_INBOX = """
+    query ProductQueries($companyId: ID, $first: Int) {
+        productQueries(companyId: $companyId, first: $first) {
+            edges {
+                node {
+                    id
+                    createdAt
+                    user {
+                        email
+                        firstName
+                        lastName
+                    }
+                    productQuery {
+                        name
+                        quantity
+                        message
+                        country {
+                            code
+                        }
+                        product {
+                            name
+                            slug
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.mark.xfail(
+    raises=QueryCountGrowth,
+    strict=True,
+    reason="buyers and inquiries are fetched for each chat room",
+)
+def test_seller_inbox(benchmark_seller, benchmark):
+    company_id = graphene.Node.to_global_id("Company", benchmark_seller.pk)
+    bench = benchmark(ApiClient(user=benchmark_seller.user))
+
+    bench.measure_pages(
+        QUERY_SELLER_INBOX, lambda size: {"companyId": company_id, "first": size}
+    )
@@ -0,0 +1,64 @@
+import pytest
+
+from ..fixtures import ApiClient
+from .utils import QueryCountGrowth
+
+QUERY_COMPANY = """
+    query Company($slug: String, $first: Int) {
+        company(slug: $slug) {
+            id
+            name
+            slug
+            website
+            foundedYear
+            noOfEmployees
+            contentPlaintext
+            isVerified
+            logo(size: 120) {
+                url
+            }
+            industry {
+                name
+            }
+            exportCountries {
+                code
+            }
+            certificates {
+                name
+            }
+            rosetter {
+                name
+            }
+            products(first: $first) {
+                edges {
+                    node {
+                        id
+                        name
+                        slug
+                        unitPrice
+                        thumbnail(size: 255) {
+                            url
+                        }
+                        category {
+                            name
+                            slug
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.mark.xfail(
+    raises=QueryCountGrowth,
+    strict=True,
+    reason="thumbnail and category are fetched for each product",
+)
+def test_company_profile(benchmark_company, benchmark):
+    bench = benchmark(ApiClient())
+
+    bench.measure_pages(
+        QUERY_COMPANY, lambda size: {"slug": benchmark_company.slug, "first": size}
+    )
@@ -0,0 +1,76 @@
+from ....account.models import User
+from ..fixtures import ApiClient
+
+QUERY_SITE = """
+    query Site {
+        site {
+            name
+            description
+            headerText
+            domain {
+                host
+                url
+            }
+            defaultCountry {
+                code
+                country
+            }
+            countries {
+                code
+            }
+            languages {
+                code
+            }
+            companyAddress {
+                city
+                country {
+                    code
+                }
+            }
+        }
+    }
+"""
+
+QUERY_SITE_SETTINGS = """
+    query SiteSettings {
+        site {
+            name
+            domain {
+                host
+                sslEnabled
+            }
+            defaultMailSenderName
+            defaultMailSenderAddress
+            accountSetPasswordUrl
+            authorizationKeys {
+                name
+                key
+            }
+            staffNotificationRecipients {
+                email
+                active
+            }
+            permissions {
+                code
+                name
+            }
+        }
+    }
+"""
+
+
+def test_site(db, benchmark):
+    bench = benchmark(ApiClient())
+
+    bench.measure(QUERY_SITE)
+
+    bench.check_baseline()
+
+
+def test_site_settings(db, benchmark):
+    superuser = User.objects.create_superuser("admin@example.com", "password")
+    bench = benchmark(ApiClient(user=superuser))
+
+    bench.measure(QUERY_SITE_SETTINGS)
+
+    bench.check_baseline()
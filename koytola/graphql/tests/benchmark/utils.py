@@ -0,0 +1,154 @@
+"""Query count and latency benchmarks of the GraphQL operations.
+
+Each benchmark runs an operation at several page sizes and records the number
+of SQL queries and the median wall time of a few runs. It fails when:
+
+* the number of queries or the median time exceeds the stored baseline, at
+  any page size;
+* the number of queries depends on the page size, i.e. a resolver runs
+  queries for each of the returned objects. This raises `QueryCountGrowth`,
+  so that the operations with a known N+1 can be marked as expected failures
+  while their query counts are still checked against the baseline.
+
+The baseline is kept in `baseline.json` next to this module and updated with:
+
+    BENCHMARK_UPDATE_BASELINE=1 pytest koytola/graphql/tests/benchmark
+
+The numbers of queries don't depend on the machine, the timings do and leave
+room for the differences with `BENCHMARK_LATENCY_THRESHOLD` and
+`BENCHMARK_LATENCY_SLACK_MS`. A CI whose machines are much slower or faster
+can record its own baseline and point `BENCHMARK_BASELINE` at it.
+"""
+import json
+import os
+import statistics
+import time
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+import pytest
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ..utils import get_graphql_content
+
+BASELINE_PATH = os.environ.get(
+    "BENCHMARK_BASELINE", os.path.join(os.path.dirname(__file__), "baseline.json")
+)
+PAGE_SIZES = (1, 5, 20)
+RUNS = int(os.environ.get("BENCHMARK_RUNS", 5))
+# Ratio of the median time to its baseline above which a benchmark fails.
+LATENCY_THRESHOLD = float(os.environ.get("BENCHMARK_LATENCY_THRESHOLD", 2))
+# Regressions of a few milliseconds are noise rather than regressions.
+LATENCY_SLACK_MS = float(os.environ.get("BENCHMARK_LATENCY_SLACK_MS", 10))
+UPDATE_BASELINE = bool(os.environ.get("BENCHMARK_UPDATE_BASELINE"))
+
+
+class QueryCountGrowth(Exception):
+    """The number of queries of an operation grows with the page size."""
+
+
+class Measurement(NamedTuple):
+    queries: int
+    median_ms: float
+
+
+def _count_queries(context: CaptureQueriesContext) -> int:
+    patterns = settings.PATTERNS_IGNORED_IN_QUERY_CAPTURES
+    return sum(
+        not any(pattern.match(query["sql"]) for pattern in patterns)
+        for query in context.captured_queries
+    )
+
+
+def load_baseline() -> Dict[str, Dict[str, dict]]:
+    try:
+        with open(BASELINE_PATH) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(name: str, measurements: Dict[str, Measurement]):
+    baseline = load_baseline()
+    baseline[name] = {
+        key: {"queries": value.queries, "median_ms": round(value.median_ms, 1)}
+        for key, value in measurements.items()
+    }
+    with open(BASELINE_PATH, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+class Benchmark:
+    def __init__(self, name: str, client):
+        self.name = name
+        self.client = client
+        self.measurements: Dict[str, Measurement] = {}
+
+    def measure(
+        self, query: str, variables: Optional[dict] = None, key: str = "default"
+    ) -> dict:
+        """Run the operation and record its number of queries and median time.
+
+        The first run warms up the caches and is not recorded.
+        """
+        content = get_graphql_content(self.client.post_graphql(query, variables))
+        timings: List[float] = []
+        for _ in range(RUNS):
+            with CaptureQueriesContext(connection) as context:
+                start = time.perf_counter()
+                response = self.client.post_graphql(query, variables)
+                timings.append((time.perf_counter() - start) * 1000)
+            get_graphql_content(response)
+        self.measurements[key] = Measurement(
+            _count_queries(context), statistics.median(timings)
+        )
+        return content
+
+    def measure_pages(
+        self,
+        query: str,
+        get_variables: Callable[[int], dict],
+        page_sizes: Iterable[int] = PAGE_SIZES,
+    ):
+        """Measure the operation at each page size and check it against the baseline.
+
+        The number of queries mustn't grow with the page size either.
+        """
+        for size in page_sizes:
+            self.measure(query, get_variables(size), key=str(size))
+        self.check_baseline()
+        queries = {key: value.queries for key, value in self.measurements.items()}
+        if len(set(queries.values())) > 1:
+            raise QueryCountGrowth(
+                "%s: the number of queries grows with the page size: %s"
+                % (self.name, queries)
+            )
+
+    def check_baseline(self):
+        if UPDATE_BASELINE:
+            save_baseline(self.name, self.measurements)
+            return
+        baseline = load_baseline().get(self.name, {})
+        errors = []
+        for key, measurement in self.measurements.items():
+            if key not in baseline:
+                continue
+            expected = Measurement(**baseline[key])
+            if measurement.queries > expected.queries:
+                errors.append(
+                    "%s queries instead of %s at %s"
+                    % (measurement.queries, expected.queries, key)
+                )
+            limit = max(
+                expected.median_ms * LATENCY_THRESHOLD,
+                expected.median_ms + LATENCY_SLACK_MS,
+            )
+            if measurement.median_ms > limit:
+                errors.append(
+                    "%.1fms instead of %.1fms at %s"
+                    % (measurement.median_ms, expected.median_ms, key)
+                )
+        if errors:
+            pytest.fail("%s regressed: %s" % (self.name, "; ".join(errors)))
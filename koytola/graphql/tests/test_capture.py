@@ -0,0 +1,116 @@
+import json
+import logging
+
+from ..capture import REDACTED, redact_query, redact_variables, should_capture
+from ..replay import get_percentile, load_entries
+
+QUERY_PRODUCTS = """
+    query Products($first: Int) {
+        products(first: $first) {
+            edges {
+                node {
+                    name
+                }
+            }
+        }
+    }
+"""
+
+
+def test_redact_variables():
+    variables = {
+        "email": "buyer@example.com",
+        "input": {"newPassword": "secret", "name": "Apricots"},
+        "addresses": [{"city": "Izmir"}],
+        "items": [{"phone_number": "+905551112233", "quantity": 10}],
+    }
+
+    assert redact_variables(variables) == {
+        "email": REDACTED,
+        "input": {"newPassword": REDACTED, "name": "Apricots"},
+        "addresses": REDACTED,
+        "items": [{"phone_number": REDACTED, "quantity": 10}],
+    }
+
+
+def test_redact_query():
+    query = 'mutation { tokenCreate(email: "a@example.com", password: "p\\"w") { token } }'
+
+    assert redact_query(query) == (
+        'mutation { tokenCreate(email: "%s", password: "%s") { token } }'
+        % (REDACTED, REDACTED)
+    )
+    assert redact_query('{ product(slug: "apricots") { name } }') == (
+        '{ product(slug: "apricots") { name } }'
+    )
+
+
+def test_should_capture(settings):
+    settings.GRAPHQL_CAPTURE_PATH = "capture.jsonl"
+    settings.GRAPHQL_CAPTURE_SAMPLE_RATE = 1
+    settings.GRAPHQL_CAPTURE_MUTATIONS = False
+
+    assert should_capture(QUERY_PRODUCTS)
+    assert not should_capture("mutation { tokenRefresh { token } }")
+    assert not should_capture(None)
+    assert not should_capture("{ products")
+
+    settings.GRAPHQL_CAPTURE_SAMPLE_RATE = 0
+    assert not should_capture(QUERY_PRODUCTS)
+
+
+def test_should_capture_mutations(settings):
+    settings.GRAPHQL_CAPTURE_PATH = "capture.jsonl"
+    settings.GRAPHQL_CAPTURE_SAMPLE_RATE = 1
+    settings.GRAPHQL_CAPTURE_MUTATIONS = False
+    fragment_first = """
+        fragment Token on TokenRefresh { token }
+        mutation { tokenRefresh { ...Token } }
+    """
+    commented = """
+        # Refreshes the token.
+        mutation { tokenRefresh { token } }
+    """
+    operations = """
+        query Products { products(first: 1) { edges { node { name } } } }
+        mutation Refresh { tokenRefresh { token } }
+    """
+
+    assert not should_capture(fragment_first)
+    assert not should_capture(commented)
+    assert not should_capture(operations, "Refresh")
+    assert should_capture(operations, "Products")
+    # Without a name, a document with several operations can't be executed.
+    assert not should_capture(operations)
+
+    settings.GRAPHQL_CAPTURE_MUTATIONS = True
+    assert should_capture(fragment_first)
+    assert should_capture(operations, "Refresh")
+
+
+def test_query_is_captured(settings, api_client, caplog):
+    settings.GRAPHQL_CAPTURE_PATH = "capture.jsonl"
+    settings.GRAPHQL_CAPTURE_SAMPLE_RATE = 1
+    caplog.set_level(logging.INFO, logger="koytola.graphql.capture")
+
+    api_client.post_graphql(QUERY_PRODUCTS, {"first": 10})
+
+    [record] = caplog.records
+    entry = json.loads(record.getMessage())
+    assert entry["operation_name"] is None
+    assert entry["query"] == QUERY_PRODUCTS
+    assert entry["variables"] == {"first": 10}
+    assert entry["status"] == 200
+    assert entry["errors"] == 0
+
+    [replayed] = load_entries([record.getMessage()])
+    assert replayed.operation_name == entry["query_hash"][:12]
+    assert replayed.payload == {"query": QUERY_PRODUCTS, "variables": {"first": 10}}
+
+
+def test_get_percentile():
+    values = list(range(1, 101))
+
+    assert get_percentile(values, 50) == 50
+    assert get_percentile(values, 99) == 99
+    assert get_percentile([7], 90) == 7
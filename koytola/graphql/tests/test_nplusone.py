@@ -0,0 +1,75 @@
+import logging
+
+from ...account.models import User
+from ..nplusone import (
+    detect_n_plus_one,
+    get_field_path,
+    get_n_plus_one_error,
+    get_sql_shape,
+    resolving,
+)
+
+
+def test_get_sql_shape():
+    sql = (
+        'SELECT "product_product"."id" FROM "product_product" '
+        "WHERE (\"product_product\".\"id\" IN (%s, %s, %s) AND name = 'it''s')\n"
+        "LIMIT 21"
+    )
+
+    assert get_sql_shape(sql) == (
+        'SELECT "product_product"."id" FROM "product_product" '
+        'WHERE ("product_product"."id" IN (...) AND name = ?) LIMIT ?'
+    )
+    assert get_sql_shape("SELECT 1 FROM t WHERE id IN (%s)") == get_sql_shape(
+        "SELECT 2 FROM t WHERE id IN (%s, %s)"
+    )
+
+
+def test_get_field_path():
+    assert get_field_path(["products", "edges", 3, "node", "totalRatting"]) == (
+        "products.edges.node.totalRatting"
+    )
+    assert get_field_path(None) == ""
+
+
+def _run_queries(count):
+    for index in range(count):
+        with resolving(["products", "edges", index, "node", "totalRatting"]):
+            User.objects.filter(pk=index).exists()
+
+
+def test_detect_n_plus_one(db, settings, caplog):
+    settings.GRAPHQL_NPLUSONE_DETECTION = "raise"
+    settings.GRAPHQL_NPLUSONE_THRESHOLD = 2
+
+    with detect_n_plus_one("Products") as detector:
+        _run_queries(3)
+
+    error = get_n_plus_one_error(detector)
+    assert "3 queries of the same shape from products.edges.node.totalRatting" in str(
+        error
+    )
+    [record] = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert "Products operation" in record.getMessage()
+
+
+def test_detect_n_plus_one_below_threshold(db, settings, caplog):
+    settings.GRAPHQL_NPLUSONE_DETECTION = "raise"
+    settings.GRAPHQL_NPLUSONE_THRESHOLD = 2
+
+    with detect_n_plus_one("Products") as detector:
+        _run_queries(2)
+
+    assert get_n_plus_one_error(detector) is None
+    assert not caplog.records
+
+
+def test_detection_off(db, settings):
+    settings.GRAPHQL_NPLUSONE_DETECTION = "off"
+
+    with detect_n_plus_one("Products") as detector:
+        _run_queries(10)
+
+    assert detector is None
+    assert get_n_plus_one_error(detector) is None
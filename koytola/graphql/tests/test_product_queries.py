@@ -0,0 +1,42 @@
+from types import SimpleNamespace
+
+import graphene
+import pytest
+
+from ...account.models import User
+from ...core.exceptions import PermissionDenied
+from ...product.models import ProductQueryUsers
+from ...profile.models import Company
+from ..product.resolvers import resolve_product_queries
+
+
+@pytest.fixture
+def seller(db):
+    user = User.objects.create_user("seller@example.com", "password")
+    return Company.objects.create(user=user, name="Seller", slug="seller")
+
+
+@pytest.fixture
+def seller_room(seller):
+    buyer = User.objects.create_user("buyer@example.com", "password")
+    return ProductQueryUsers.objects.create(seller=seller, user=buyer)
+
+
+def _info(user):
+    return SimpleNamespace(context=SimpleNamespace(user=user))
+
+
+def test_resolve_product_queries_of_own_company(seller, seller_room):
+    company_id = graphene.Node.to_global_id("Company", seller.pk)
+
+    rooms = resolve_product_queries(_info(seller.user), company_id)
+
+    assert list(rooms) == [seller_room]
+
+
+def test_resolve_product_queries_of_other_company(seller, seller_room):
+    other = User.objects.create_user("other@example.com", "password")
+    company_id = graphene.Node.to_global_id("Company", seller.pk)
+
+    with pytest.raises(PermissionDenied):
+        resolve_product_queries(_info(other), company_id)
@@ -0,0 +1,37 @@
+from .utils import get_graphql_content
+
+QUERY_SITE = """
+    query {
+        site {
+            name
+        }
+    }
+"""
+
+
+def test_profile_for_staff(staff_api_client, settings):
+    settings.GRAPHQL_PROFILING_ENABLED = False
+
+    response = staff_api_client.post_graphql(QUERY_SITE, HTTP_X_GRAPHQL_PROFILE="1")
+
+    profile = get_graphql_content(response)["extensions"]["profile"]
+    assert profile["sql"]["count"] >= 0
+    assert "Site.name" in [resolver["field"] for resolver in profile["resolvers"]]
+
+
+def test_no_profile_for_customers(user_api_client, settings):
+    settings.GRAPHQL_PROFILING_ENABLED = False
+
+    response = user_api_client.post_graphql(QUERY_SITE, HTTP_X_GRAPHQL_PROFILE="1")
+
+    assert "extensions" not in get_graphql_content(response)
+
+
+def test_profile_when_enabled(api_client, settings):
+    settings.GRAPHQL_PROFILING_ENABLED = True
+
+    response = api_client.post_graphql(QUERY_SITE)
+    assert "extensions" not in get_graphql_content(response)
+
+    response = api_client.post_graphql(QUERY_SITE, HTTP_X_GRAPHQL_PROFILE="1")
+    assert "profile" in get_graphql_content(response)["extensions"]
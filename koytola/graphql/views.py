@@ -1,6 +1,7 @@
 import fnmatch
 import json
 import logging
+import time
 import traceback
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -26,9 +27,14 @@ from graphql.execution import ExecutionResult
 from jwt.exceptions import PyJWTError
 
 from ..core.exceptions import PermissionDenied, ReadOnlyException
+from ..core.metrics import observe_operation
+from ..core.profiling import profile_request
 from ..core.utils import is_valid_ipv4, is_valid_ipv6
+from . import capture
+from .nplusone import NPlusOneError, detect_n_plus_one, get_n_plus_one_error
 
 API_PATH = SimpleLazyObject(lambda: reverse("api"))
+PROFILE_HEADER = "HTTP_X_GRAPHQL_PROFILE"
 
 unhandled_errors_logger = logging.getLogger("koytola.graphql.errors.unhandled")
 handled_errors_logger = logging.getLogger("koytola.graphql.errors.handled")
@@ -60,7 +66,13 @@ class GraphQLView(View):
     middleware = None
     root_value = None
 
-    HANDLED_EXCEPTIONS = (GraphQLError, PyJWTError, ReadOnlyException, PermissionDenied)
+    HANDLED_EXCEPTIONS = (
+        GraphQLError,
+        PyJWTError,
+        ReadOnlyException,
+        PermissionDenied,
+        NPlusOneError,
+    )
 
     def __init__(
         self, schema=None, executor=None, middleware=None, root_value=None, backend=None
@@ -102,7 +114,7 @@ class GraphQLView(View):
                     response["Access-Control-Allow-Methods"] = "POST, OPTIONS"
                     response[
                         "Access-Control-Allow-Headers"
-                    ] = "Origin, Content-Type, Accept, Authorization"
+                    ] = "Origin, Content-Type, Accept, Authorization, X-GraphQL-Profile"
                     response["Access-Control-Allow-Credentials"] = "true"
                     break
         return response
@@ -164,7 +176,25 @@ class GraphQLView(View):
     def get_response(
         self, request: HttpRequest, data: dict
     ) -> Tuple[Optional[Dict[str, List[Any]]], int]:
-        execution_result = self.execute_graphql_request(request, data)
+        # Uploaded files cannot be replayed.
+        captured = False
+        if (
+            settings.GRAPHQL_CAPTURE_PATH
+            and request.content_type != "multipart/form-data"
+        ):
+            query, variables, operation_name = self.get_graphql_params(request, data)
+            captured = capture.should_capture(query, operation_name)
+        start = time.perf_counter()
+        profiled = self.should_profile(request)
+        if profiled or settings.METRICS_ENABLED:
+            # Resolvers are only timed for the profiles returned to the client.
+            with profile_request(time_resolvers=profiled) as profile:
+                execution_result = self.execute_graphql_request(request, data)
+            if settings.METRICS_ENABLED:
+                observe_operation(self.get_operation_name(data), profile)
+        else:
+            profile = None
+            execution_result = self.execute_graphql_request(request, data)
         status_code = 200
         if execution_result:
             response = {}
@@ -176,12 +206,37 @@ class GraphQLView(View):
                 status_code = 400
             else:
                 response["data"] = execution_result.data
+            if profiled:
+                response["extensions"] = {
+                    "profile": profile.as_dict(settings.GRAPHQL_PROFILE_TOP_RESOLVERS)
+                }
             result: Optional[Dict[str, List[Any]]] = response
         else:
             result = None
 
+        if captured:
+            capture.capture(
+                query,
+                variables,
+                operation_name,
+                status_code,
+                len(execution_result.errors or []) if execution_result else 0,
+                time.perf_counter() - start,
+            )
         return result, status_code
 
+    @staticmethod
+    def should_profile(request: HttpRequest) -> bool:
+        if not request.META.get(PROFILE_HEADER):
+            return False
+        if settings.GRAPHQL_PROFILING_ENABLED:
+            return True
+        # The middleware module imports this one.
+        from .middleware import get_user
+
+        user = get_user(request)
+        return bool(user and user.is_staff)
+
     def get_root_value(self):
         return self.root_value
 
@@ -237,8 +292,10 @@ class GraphQLView(View):
                 # executor is not a valid argument in all backends
                 extra_options["executor"] = self.executor
             try:
-                with connection.execute_wrapper(tracing_wrapper):
-                    return document.execute(  # type: ignore
+                with connection.execute_wrapper(tracing_wrapper), detect_n_plus_one(
+                    operation_name
+                ) as detector:
+                    result = document.execute(  # type: ignore
                         root=self.get_root_value(),
                         variables=variables,
                         operation_name=operation_name,
@@ -246,6 +303,10 @@ class GraphQLView(View):
                         middleware=self.middleware,
                         **extra_options,
                     )
+                n_plus_one_error = get_n_plus_one_error(detector)
+                if n_plus_one_error:
+                    result.errors = list(result.errors or []) + [n_plus_one_error]
+                return result
             except Exception as e:
                 span.set_tag(opentracing.tags.ERROR, True)
                 return ExecutionResult(errors=[e], invalid=True)
@@ -263,12 +324,17 @@ class GraphQLView(View):
         return {}
 
     @staticmethod
-    def get_graphql_params(request: HttpRequest, data: dict):
-        query = data.get("query")
-        variables = data.get("variables")
+    def get_operation_name(data: dict) -> Optional[str]:
         operation_name = data.get("operationName")
         if operation_name == "null":
-            operation_name = None
+            return None
+        return operation_name
+
+    @classmethod
+    def get_graphql_params(cls, request: HttpRequest, data: dict):
+        query = data.get("query")
+        variables = data.get("variables")
+        operation_name = cls.get_operation_name(data)
 
         if request.content_type == "multipart/form-data":
             operations = json.loads(data.get("operations", "{}"))
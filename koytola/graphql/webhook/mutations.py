@@ -1,5 +1,6 @@
 import graphene
 from django.core.exceptions import ValidationError
+from django.db import transaction
 
 from ...core.permissions import AppPermission
 from ...webhook import models
@@ -81,6 +82,7 @@ class WebhookCreate(ModelMutation):
         return has_perm
 
     @classmethod
+    @transaction.atomic
     def save(cls, info, instance, cleaned_input):
         instance.save()
         events = set(cleaned_input.get("events", []))
@@ -138,6 +140,7 @@ class WebhookUpdate(ModelMutation):
         return cleaned_input
 
     @classmethod
+    @transaction.atomic
     def save(cls, info, instance, cleaned_input):
         instance.save()
         events = set(cleaned_input.get("events", []))
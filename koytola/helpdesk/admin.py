@@ -1,13 +1,13 @@
 from django.contrib import admin
 from .models import Ticket
-from ..core.utils import download_csv
+from ..core.utils.export import download_csv, download_jsonl, download_xlsx
 
 
 class HelpdeskAdmin(admin.ModelAdmin):
     list_display = ["id", "status", "type", "user", "subject", "creation_date", "update_date"]
     search_fields = ["status", "type", "user"]
     list_filter = ["status", "type", "creation_date", "update_date"]
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-creation_date"]
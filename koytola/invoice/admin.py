@@ -1,13 +1,13 @@
 from django.contrib import admin
 from .models import Invoice, InvoiceEvent
-from ..core.utils import download_csv
+from ..core.utils.export import download_csv, download_jsonl, download_xlsx
 
 
 class InvoiceAdmin(admin.ModelAdmin):
     list_display = ["id", "order", "number", "created", "external_url"]
     search_fields = ["order", "external_url"]
     list_filter = ["created"]
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-created"]
@@ -17,7 +17,7 @@ class InvoiceEventAdmin(admin.ModelAdmin):
     list_display = ["id", "date", "type", "order", "user", "parameters"]
     search_fields = ["type", "order", "user", "parameters"]
     list_filter = ["date", "type"]
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-date"]
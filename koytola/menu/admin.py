@@ -1,6 +1,6 @@
 from django.contrib import admin
 from .models import Menu, MenuItem
-from ..core.utils import download_csv
+from ..core.utils.export import download_csv, download_jsonl, download_xlsx
 
 
 class MenuAdmin(admin.ModelAdmin):
@@ -8,7 +8,7 @@ class MenuAdmin(admin.ModelAdmin):
     search_fields = ["name"]
     list_filter = []
     list_per_page = 50
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["name"]
@@ -19,7 +19,7 @@ class MenuItemAdmin(admin.ModelAdmin):
     search_fields = ["menu", "name", "url"]
     list_filter = []
     list_per_page = 50
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["id"]
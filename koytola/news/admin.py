@@ -1,6 +1,6 @@
 from django.contrib import admin
 from .models import News, NewsTranslation
-from ..core.utils import download_csv, download_json
+from ..core.utils.export import download_csv, download_jsonl, download_xlsx
 
 
 class NewsAdmin(admin.ModelAdmin):
@@ -13,7 +13,7 @@ class NewsAdmin(admin.ModelAdmin):
         "is_published", "creation_date", "publication_date",
         "update_date"
     ]
-    actions = [download_csv, download_json]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-creation_date"]
@@ -25,7 +25,7 @@ class NewsTranslationAdmin(admin.ModelAdmin):
     ]
     search_fields = ["title", "summary", "content"]
     list_filter = ["language_code"]
-    actions = [download_csv, download_json]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-id"]
@@ -1,6 +1,6 @@
 from django.contrib import admin
 from .models import Order, OrderEvent
-from ..core.utils import download_csv
+from ..core.utils.export import download_csv, download_jsonl, download_xlsx
 
 
 class OrderAdmin(admin.ModelAdmin):
@@ -9,7 +9,7 @@ class OrderAdmin(admin.ModelAdmin):
     list_filter = ["created", "status"]
     list_per_page = 50
     ordering = ["-created"]
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
 
 class OrderEventAdmin(admin.ModelAdmin):
@@ -18,7 +18,7 @@ class OrderEventAdmin(admin.ModelAdmin):
     list_filter = ["date", "type"]
     list_per_page = 50
     ordering = ["-date"]
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
 
 admin.site.register(Order, OrderAdmin)
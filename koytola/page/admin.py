@@ -1,6 +1,6 @@
 from django.contrib import admin
 from .models import Page, PageType
-from ..core.utils import download_csv, download_json
+from ..core.utils.export import download_csv, download_jsonl, download_xlsx
 
 
 class PageAdmin(admin.ModelAdmin):
@@ -9,7 +9,7 @@ class PageAdmin(admin.ModelAdmin):
     ]
     search_fields = ["slug", "title", "summary", "content"]
     list_filter = ["is_published", "creation_date", "publication_date", "update_date"]
-    actions = [download_csv, download_json]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-creation_date"]
@@ -19,7 +19,7 @@ class PageTypeAdmin(admin.ModelAdmin):
     list_display = ["id", "slug", "name"]
     search_fields = ["slug", "name"]
     list_filter = []
-    actions = [download_csv, download_json]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["slug"]
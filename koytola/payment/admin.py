@@ -1,6 +1,6 @@
 from django.contrib import admin
 from .models import Payment, Transaction
-from ..core.utils import download_csv
+from ..core.utils.export import download_csv, download_jsonl, download_xlsx
 
 
 class PaymentAdmin(admin.ModelAdmin):
@@ -9,7 +9,7 @@ class PaymentAdmin(admin.ModelAdmin):
     ]
     search_fields = []
     list_filter = ["gateway", "is_active", "created", "charge_status"]
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-created"]
@@ -21,7 +21,7 @@ class TransactionAdmin(admin.ModelAdmin):
     ]
     search_fields = ["account_id", "gateway_response"]
     list_filter = ["kind", "created", "is_success"]
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-created"]
@@ -3,6 +3,8 @@ from typing import List
 
 from .checks import check_plugins  # NOQA: F401
 
+default_app_config = "koytola.plugins.apps.PluginsAppConfig"
+
 
 def discover_plugins_modules(plugins: List[str]):
     plugins_modules = []
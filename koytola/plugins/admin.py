@@ -1,13 +1,13 @@
 from django.contrib import admin
 from .models import PluginConfiguration
-from ..core.utils import download_csv
+from ..core.utils.export import download_csv, download_jsonl, download_xlsx
 
 
 class PluginConfigurationAdmin(admin.ModelAdmin):
     list_display = ["id", "identifier", "name", "description", "active", "configuration"]
     search_fields = ["identifier", "name", "description", "configuration"]
     list_filter = ["active", "identifier"]
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["identifier"]
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class PluginsAppConfig(AppConfig):
+    name = "koytola.plugins"
+
+    def ready(self):
+        from .signals import connect_signals
+
+        connect_signals()
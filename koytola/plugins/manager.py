@@ -1,4 +1,7 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import threading
+from copy import deepcopy
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import opentracing
 from django.conf import settings
@@ -6,6 +9,7 @@ from django.core.handlers.wsgi import WSGIRequest
 from django.http import HttpResponse, HttpResponseNotFound
 from django.utils.module_loading import import_string
 
+from ..core.cache import VersionedCache, bump_version
 from ..core.payments import PaymentInterface
 from .models import PluginConfiguration
 
@@ -23,6 +27,8 @@ if TYPE_CHECKING:
         PaymentGateway,
     )
 
+PLUGINS_CACHE_NAME = "plugins"
+
 
 class PluginsManager(PaymentInterface):
     """Base manager for handling plugins logic."""
@@ -42,6 +48,26 @@ class PluginsManager(PaymentInterface):
                 plugin_config = PluginClass.DEFAULT_CONFIGURATION
                 active = PluginClass.get_default_active()
             self.plugins.append(PluginClass(configuration=plugin_config, active=active))
+        self._hook_plugins: Dict[str, List["BasePlugin"]] = {}
+
+    def _get_hook_plugins(self, method_name: str) -> List["BasePlugin"]:
+        """Return the plugins which override the given method of the base plugin.
+
+        The list is computed on the first call of each hook and kept for the
+        lifetime of the manager.
+        """
+        hook_plugins = self._hook_plugins.get(method_name)
+        if hook_plugins is None:
+            from .base_plugin import BasePlugin
+
+            base_method = getattr(BasePlugin, method_name, None)
+            hook_plugins = [
+                plugin
+                for plugin in self.plugins
+                if getattr(type(plugin), method_name, base_method) is not base_method
+            ]
+            self._hook_plugins[method_name] = hook_plugins
+        return hook_plugins
 
     def __run_method_on_plugins(
         self, method_name: str, default_value: Any, *args, **kwargs
@@ -51,10 +77,12 @@ class PluginsManager(PaymentInterface):
             f"ExtensionsManager.{method_name}"
         ):
             value = default_value
-            for plugin in self.plugins:
-                value = self.__run_method_on_single_plugin(
-                    plugin, method_name, value, *args, **kwargs
+            for plugin in self._get_hook_plugins(method_name):
+                returned_value = getattr(plugin, method_name)(
+                    *args, **kwargs, previous_value=value
                 )
+                if returned_value != NotImplemented:
+                    value = returned_value
             return value
 
     def __run_method_on_single_plugin(
@@ -246,9 +274,11 @@ class PluginsManager(PaymentInterface):
     def save_plugin_configuration(self, plugin_id, cleaned_data: dict):
         for plugin in self.plugins:
             if plugin.PLUGIN_ID == plugin_id:
+                # Managers are shared by the whole process, so the configuration
+                # of the plugin must not be updated in place.
                 plugin_configuration, _ = PluginConfiguration.objects.get_or_create(
                     identifier=plugin_id,
-                    defaults={"configuration": plugin.configuration},
+                    defaults={"configuration": deepcopy(plugin.configuration)},
                 )
                 return plugin.save_plugin_configuration(
                     plugin_configuration, cleaned_data
@@ -279,6 +309,17 @@ class PluginsManager(PaymentInterface):
         )
 
 
+def _build_plugins_manager(manager_path: str, plugins: Tuple[str, ...]):
+    manager = import_string(manager_path)
+    return manager(list(plugins))
+
+
+# Plugin configurations rarely change, so each process keeps a single manager
+# and rebuilds it only after the configurations version is bumped.
+_managers: Dict[Tuple[str, Tuple[str, ...]], VersionedCache[PluginsManager]] = {}
+_managers_lock = threading.Lock()
+
+
 def get_plugins_manager(
     manager_path: str = None, plugins: List[str] = None
 ) -> PluginsManager:
@@ -286,5 +327,30 @@ def get_plugins_manager(
         manager_path = settings.PLUGINS_MANAGER
     if plugins is None:
         plugins = settings.PLUGINS
-    manager = import_string(manager_path)
-    return manager(plugins)
+    key = (manager_path, tuple(plugins))
+    manager_cache = _managers.get(key)
+    if manager_cache is None:
+        with _managers_lock:
+            manager_cache = _managers.setdefault(
+                key,
+                VersionedCache(
+                    PLUGINS_CACHE_NAME, partial(_build_plugins_manager, *key)
+                ),
+            )
+    return manager_cache.get()
+
+
+def invalidate_plugins_managers():
+    """Rebuild the plugins managers after the plugin configurations change.
+
+    Managers of the current process are dropped right away, so that it sees its
+    own changes before they are committed.
+    """
+    clear_plugins_managers()
+    bump_version(PLUGINS_CACHE_NAME)
+
+
+def clear_plugins_managers():
+    """Drop the managers of the current process."""
+    for manager_cache in list(_managers.values()):
+        manager_cache.clear()
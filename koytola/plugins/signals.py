@@ -0,0 +1,21 @@
+from django.db.models.signals import post_delete, post_save
+
+from .manager import invalidate_plugins_managers
+from .models import PluginConfiguration
+
+
+def _invalidate_plugins_managers(**_kwargs):
+    invalidate_plugins_managers()
+
+
+def connect_signals():
+    post_save.connect(
+        _invalidate_plugins_managers,
+        sender=PluginConfiguration,
+        dispatch_uid="invalidate_plugins_managers",
+    )
+    post_delete.connect(
+        _invalidate_plugins_managers,
+        sender=PluginConfiguration,
+        dispatch_uid="invalidate_plugins_managers",
+    )
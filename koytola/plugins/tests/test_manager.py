@@ -221,3 +221,37 @@ def test_manager_inncorrect_plugin(rf):
     response = manager.webhook(request, "incorrect.plugin.id")
     assert isinstance(response, HttpResponseNotFound)
     assert response.status_code == 404
+
+
+def test_get_plugins_manager_reuses_manager():
+    plugins = ["koytola.plugins.tests.sample_plugins.PluginSample"]
+
+    manager = get_plugins_manager(plugins=plugins)
+
+    assert get_plugins_manager(plugins=plugins) is manager
+
+
+def test_get_plugins_manager_rebuilt_after_configuration_change(
+    plugin_configuration,
+):
+    plugins = ["koytola.plugins.tests.sample_plugins.PluginSample"]
+    manager = get_plugins_manager(plugins=plugins)
+
+    plugin_configuration.active = False
+    plugin_configuration.save()
+
+    new_manager = get_plugins_manager(plugins=plugins)
+    assert new_manager is not manager
+    assert not new_manager.get_plugin(PluginSample.PLUGIN_ID).active
+
+
+def test_manager_hook_plugins_skip_plugins_without_hook():
+    plugins = [
+        "koytola.plugins.tests.sample_plugins.PluginSample",
+        "koytola.plugins.tests.sample_plugins.PluginInactive",
+    ]
+    manager = PluginsManager(plugins=plugins)
+
+    hook_plugins = manager._get_hook_plugins("webhook")
+
+    assert [type(plugin) for plugin in hook_plugins] == [PluginSample]
@@ -7,7 +7,7 @@ from ...webhook.payloads import (
     generate_order_payload,
 )
 from ..base_plugin import BasePlugin
-from .tasks import trigger_webhooks_for_event
+from .tasks import trigger_webhooks
 
 if TYPE_CHECKING:
     from ...order.models import Order
@@ -28,19 +28,19 @@ class WebhookPlugin(BasePlugin):
         if not self.active:
             return previous_value
         order_data = generate_order_payload(order)
-        trigger_webhooks_for_event.delay(WebhookEventType.ORDER_CREATED, order_data)
+        trigger_webhooks(WebhookEventType.ORDER_CREATED, order_data)
 
     def order_fully_paid(self, order: "Order", previous_value: Any) -> Any:
         if not self.active:
             return previous_value
         order_data = generate_order_payload(order)
-        trigger_webhooks_for_event.delay(WebhookEventType.ORDER_FULLY_PAID, order_data)
+        trigger_webhooks(WebhookEventType.ORDER_FULLY_PAID, order_data)
 
     def order_updated(self, order: "Order", previous_value: Any) -> Any:
         if not self.active:
             return previous_value
         order_data = generate_order_payload(order)
-        trigger_webhooks_for_event.delay(WebhookEventType.ORDER_UPDATED, order_data)
+        trigger_webhooks(WebhookEventType.ORDER_UPDATED, order_data)
 
     def invoice_request(
         self,
@@ -52,7 +52,7 @@ class WebhookPlugin(BasePlugin):
         if not self.active:
             return previous_value
         invoice_data = generate_invoice_payload(invoice)
-        trigger_webhooks_for_event.delay(
+        trigger_webhooks(
             WebhookEventType.INVOICE_REQUESTED, invoice_data
         )
 
@@ -60,30 +60,30 @@ class WebhookPlugin(BasePlugin):
         if not self.active:
             return previous_value
         invoice_data = generate_invoice_payload(invoice)
-        trigger_webhooks_for_event.delay(WebhookEventType.INVOICE_DELETED, invoice_data)
+        trigger_webhooks(WebhookEventType.INVOICE_DELETED, invoice_data)
 
     def invoice_sent(self, invoice: "Invoice", email: str, previous_value: Any) -> Any:
         if not self.active:
             return previous_value
         invoice_data = generate_invoice_payload(invoice)
-        trigger_webhooks_for_event.delay(WebhookEventType.INVOICE_SENT, invoice_data)
+        trigger_webhooks(WebhookEventType.INVOICE_SENT, invoice_data)
 
     def order_cancelled(self, order: "Order", previous_value: Any) -> Any:
         if not self.active:
             return previous_value
         order_data = generate_order_payload(order)
-        trigger_webhooks_for_event.delay(WebhookEventType.ORDER_CANCELLED, order_data)
+        trigger_webhooks(WebhookEventType.ORDER_CANCELLED, order_data)
 
     def order_fulfilled(self, order: "Order", previous_value: Any) -> Any:
         if not self.active:
             return previous_value
         order_data = generate_order_payload(order)
-        trigger_webhooks_for_event.delay(WebhookEventType.ORDER_FULFILLED, order_data)
+        trigger_webhooks(WebhookEventType.ORDER_FULFILLED, order_data)
 
     def account_created(self, account: "User", previous_value: Any) -> Any:
         if not self.active:
             return previous_value
         account_data = generate_customer_payload(account)
-        trigger_webhooks_for_event.delay(
+        trigger_webhooks(
             WebhookEventType.ACCOUNT_CREATED, account_data
         )
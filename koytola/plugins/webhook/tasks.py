@@ -1,21 +1,37 @@
+import json
 import logging
+import threading
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
 from enum import Enum
-from urllib.parse import urlparse, urlunparse
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse, urlunparse
 
-import boto3
-import requests
-from google.cloud import pubsub_v1
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
 from requests.exceptions import RequestException
 
 from ...celeryconf import app
-from ...site.models import Site
-from ...webhook.event_types import WebhookEventType
-from ...webhook.models import Webhook
+from ...site.utils import get_site_domain
+from ...webhook.utils import WebhookTarget, get_webhooks_for_event
 from . import signature_for_payload
+from .transports import get_http_session, get_pubsub_publisher, get_sqs_client
 
 logger = logging.getLogger(__name__)
 
 WEBHOOK_TIMEOUT = 10
+WEBHOOK_PAYLOAD_KEY_PREFIX = "koytola:webhook-payload:"
+WEBHOOK_BATCH_EVENT = "batch"
+SQS_MAX_BATCH_SIZE = 10
+
+_batch = threading.local()
+
+
+class WebhookPayloadMissing(Exception):
+    """The payload stored for the deliveries of an event is gone."""
 
 
 class WebhookSchemes(str, Enum):
@@ -25,28 +41,78 @@ class WebhookSchemes(str, Enum):
     GOOGLE_CLOUD_PUBSUB = "gcpubsub"
 
 
+def is_cache_shared() -> bool:
+    """Return whether the workers can read what this process stores in the cache."""
+    return not isinstance(caches["default"], (LocMemCache, DummyCache))
+
+
+def store_webhook_payload(data: str) -> str:
+    """Store the payload once so that all deliveries of an event can share it."""
+    payload_key = WEBHOOK_PAYLOAD_KEY_PREFIX + uuid.uuid4().hex
+    cache.set(payload_key, data, timeout=settings.WEBHOOK_PAYLOAD_TTL)
+    return payload_key
+
+
+def load_webhook_payload(payload_key: str) -> Optional[str]:
+    return cache.get(payload_key)
+
+
+@contextmanager
+def webhook_batch():
+    """Group the events triggered within the block by their targets.
+
+    Each target then receives all its events at once: HTTP targets get a single
+    post with the list of events and SQS queues get `send_message_batch` calls.
+    """
+    if getattr(_batch, "events", None) is not None:
+        # Already batching, the outermost block sends the events.
+        yield
+        return
+    _batch.events = []
+    try:
+        yield
+    finally:
+        events, _batch.events = _batch.events, None
+        if events:
+            trigger_webhooks_for_events.delay(events)
+
+
+def trigger_webhooks(event_type: str, data: str):
+    """Trigger webhooks for the event, or defer it until the batch is sent."""
+    events = getattr(_batch, "events", None)
+    if events is not None:
+        events.append((event_type, data))
+    else:
+        trigger_webhooks_for_event.delay(event_type, data)
+
+
 @app.task
 def trigger_webhooks_for_event(event_type, data):
-    permissions = {}
-    required_permission = WebhookEventType.PERMISSIONS[event_type].value
-    if required_permission:
-        app_label, codename = required_permission.split(".")
-        permissions["app__permissions__content_type__app_label"] = app_label
-        permissions["app__permissions__codename"] = codename
-
-    webhooks = Webhook.objects.filter(
-        is_active=True,
-        app__is_active=True,
-        events__event_type__in=[event_type, WebhookEventType.ANY],
-        **permissions,
-    )
-    webhooks = webhooks.select_related("app").prefetch_related(
-        "app__permissions__content_type"
-    )
+    webhooks = get_webhooks_for_event(event_type)
+    if not webhooks:
+        return
+
+    # Celery serializes the arguments of every task it sends, so with more than
+    # one target the payload is passed by reference instead of being copied
+    # into each message. Eager tasks already share the same string, and a cache
+    # local to this process can't be read by the workers.
+    payload_key = None
+    if (
+        len(webhooks) > 1
+        and not settings.CELERY_TASK_ALWAYS_EAGER
+        and is_cache_shared()
+    ):
+        payload_key = store_webhook_payload(data)
+        data = None
 
     for webhook in webhooks:
         send_webhook_request.delay(
-            webhook.pk, webhook.target_url, webhook.secret_key, event_type, data
+            webhook.pk,
+            webhook.target_url,
+            webhook.secret_key,
+            event_type,
+            data,
+            payload_key=payload_key,
         )
 
 
@@ -58,37 +124,51 @@ def send_webhook_using_http(target_url, message, domain, signature, event_type):
         "X-Project-Signature": signature,
     }
 
-    response = requests.post(
+    response = get_http_session().post(
         target_url, data=message, headers=headers, timeout=WEBHOOK_TIMEOUT
     )
     response.raise_for_status()
 
 
-def send_webhook_using_aws_sqs(target_url, message, domain, signature, event_type):
+def _get_sqs_client_and_queue_url(target_url):
     parts = urlparse(target_url)
     region = "us-east-1"
     hostname_parts = parts.hostname.split(".")
     if len(hostname_parts) == 4 and hostname_parts[0] == "sqs":
         region = hostname_parts[1]
-    client = boto3.client(
-        "sqs",
-        region_name=region,
-        aws_access_key_id=parts.username,
-        aws_secret_access_key=parts.password,
-    )
-    queue_url = urlunparse(
-        ("https", parts.hostname, parts.path, parts.params, parts.query, parts.fragment)
-    )
+    client = get_sqs_client(region, parts.username, parts.password)
+    if settings.WEBHOOK_SQS_ENDPOINT_URL:
+        # Local SQS stand-ins serve the queues from their own endpoint.
+        queue_url = urljoin(settings.WEBHOOK_SQS_ENDPOINT_URL, parts.path)
+    else:
+        queue_url = urlunparse(
+            (
+                "https",
+                parts.hostname,
+                parts.path,
+                parts.params,
+                parts.query,
+                parts.fragment,
+            )
+        )
+    return client, queue_url
+
 
+def _get_sqs_message_attributes(domain, signature, event_type):
     msg_attributes = {
         "ProjectDomain": {"DataType": "String", "StringValue": domain},
         "EventType": {"DataType": "String", "StringValue": event_type},
     }
     if signature:
         msg_attributes["Signature"] = {"DataType": "String", "StringValue": signature}
+    return msg_attributes
+
+
+def send_webhook_using_aws_sqs(target_url, message, domain, signature, event_type):
+    client, queue_url = _get_sqs_client_and_queue_url(target_url)
     client.send_message(
         QueueUrl=queue_url,
-        MessageAttributes=msg_attributes,
+        MessageAttributes=_get_sqs_message_attributes(domain, signature, event_type),
         MessageBody=message.decode("utf-8"),
     )
 
@@ -97,7 +177,7 @@ def send_webhook_using_google_cloud_pubsub(
     target_url, message, domain, signature, event_type
 ):
     parts = urlparse(target_url)
-    client = pubsub_v1.PublisherClient()
+    client = get_pubsub_publisher()
     topic_name = parts.path[1:]  # drop the leading slash
     client.publish(
         topic_name,
@@ -113,9 +193,19 @@ def send_webhook_using_google_cloud_pubsub(
     retry_backoff=60,
     retry_kwargs={"max_retries": 15},
 )
-def send_webhook_request(webhook_id, target_url, secret, event_type, data):
+def send_webhook_request(
+    webhook_id, target_url, secret, event_type, data, payload_key=None
+):
+    if payload_key:
+        data = load_webhook_payload(payload_key)
+        if data is None:
+            # Nothing can be sent anymore, the task fails so that it is noticed.
+            raise WebhookPayloadMissing(
+                "[Webhook ID:%r] Payload for event %r expired or was evicted "
+                "before it was sent" % (webhook_id, event_type)
+            )
     parts = urlparse(target_url)
-    domain = Site.objects.get_current().domain
+    domain = get_site_domain()
     message = data.encode("utf-8")
     signature = signature_for_payload(message, secret)
     if parts.scheme.lower() in [WebhookSchemes.HTTP, WebhookSchemes.HTTPS]:
@@ -134,3 +224,109 @@ def send_webhook_request(webhook_id, target_url, secret, event_type, data):
         target_url,
         event_type,
     )
+
+
+@app.task
+def trigger_webhooks_for_events(events):
+    batches: Dict[WebhookTarget, List[Tuple[str, str]]] = defaultdict(list)
+    for event_type, data in events:
+        for webhook in get_webhooks_for_event(event_type):
+            batches[webhook].append((event_type, data))
+
+    for webhook, webhook_events in batches.items():
+        if len(webhook_events) == 1:
+            event_type, data = webhook_events[0]
+            send_webhook_request.delay(
+                webhook.pk, webhook.target_url, webhook.secret_key, event_type, data
+            )
+        else:
+            send_webhook_batch_request.delay(
+                webhook.pk, webhook.target_url, webhook.secret_key, webhook_events
+            )
+
+
+def _build_batch_message(events) -> bytes:
+    # Payloads are JSON documents already, so they are embedded as they are
+    # instead of being decoded and encoded again.
+    items = [
+        '{"event": %s, "payload": %s}' % (json.dumps(event_type), data)
+        for event_type, data in events
+    ]
+    return ("[%s]" % ", ".join(items)).encode("utf-8")
+
+
+def send_webhook_batch_using_http(target_url, events, domain, secret):
+    message = _build_batch_message(events)
+    send_webhook_using_http(
+        target_url,
+        message,
+        domain,
+        signature_for_payload(message, secret),
+        WEBHOOK_BATCH_EVENT,
+    )
+
+
+def send_webhook_batch_using_aws_sqs(target_url, events, domain, secret):
+    client, queue_url = _get_sqs_client_and_queue_url(target_url)
+    for start in range(0, len(events), SQS_MAX_BATCH_SIZE):
+        entries = []
+        for index, (event_type, data) in enumerate(
+            events[start : start + SQS_MAX_BATCH_SIZE], start=start
+        ):
+            message = data.encode("utf-8")
+            signature = signature_for_payload(message, secret)
+            entries.append(
+                {
+                    "Id": str(index),
+                    "MessageBody": data,
+                    "MessageAttributes": _get_sqs_message_attributes(
+                        domain, signature, event_type
+                    ),
+                }
+            )
+        response = client.send_message_batch(QueueUrl=queue_url, Entries=entries)
+        for failure in response.get("Failed", []):
+            logger.error(
+                "SQS rejected batched webhook message %r: %r",
+                failure.get("Id"),
+                failure.get("Message"),
+            )
+
+
+def send_webhook_batch_using_google_cloud_pubsub(target_url, events, domain, secret):
+    # The publisher batches the messages on its own.
+    for event_type, data in events:
+        message = data.encode("utf-8")
+        send_webhook_using_google_cloud_pubsub(
+            target_url,
+            message,
+            domain,
+            signature_for_payload(message, secret),
+            event_type,
+        )
+
+
+@app.task(
+    autoretry_for=(RequestException,),
+    retry_backoff=60,
+    retry_kwargs={"max_retries": 15},
+)
+def send_webhook_batch_request(webhook_id, target_url, secret, events):
+    parts = urlparse(target_url)
+    domain = get_site_domain()
+    if parts.scheme.lower() in [WebhookSchemes.HTTP, WebhookSchemes.HTTPS]:
+        send_webhook_batch_using_http(target_url, events, domain, secret)
+    elif parts.scheme.lower() == WebhookSchemes.AWS_SQS:
+        send_webhook_batch_using_aws_sqs(target_url, events, domain, secret)
+    elif parts.scheme.lower() == WebhookSchemes.GOOGLE_CLOUD_PUBSUB:
+        send_webhook_batch_using_google_cloud_pubsub(
+            target_url, events, domain, secret
+        )
+    else:
+        raise ValueError("Unknown webhook scheme: %r" % (parts.scheme,))
+    logger.debug(
+        "[Webhook ID:%r] Batch of %d events sent to %r",
+        webhook_id,
+        len(events),
+        target_url,
+    )
@@ -11,6 +11,7 @@ from ....webhook.payloads import (
     generate_order_payload,
     generate_product_payload,
 )
+from ....webhook.utils import webhooks_cache
 from ...manager import get_plugins_manager
 from ...webhook.tasks import trigger_webhooks_for_event
 
@@ -74,7 +75,7 @@ def test_trigger_webhooks_for_event_calls_expected_events(
     assert target_url_calls == expected_target_urls
 
 
-@mock.patch("koytola.plugins.webhook.plugin.trigger_webhooks_for_event.delay")
+@mock.patch("koytola.plugins.webhook.tasks.trigger_webhooks_for_event.delay")
 def test_order_created(mocked_webhook_trigger, settings, order_with_lines):
     settings.PLUGINS = ["koytola.plugins.webhook.plugin.WebhookPlugin"]
     manager = get_plugins_manager()
@@ -86,7 +87,7 @@ def test_order_created(mocked_webhook_trigger, settings, order_with_lines):
     )
 
 
-@mock.patch("koytola.plugins.webhook.plugin.trigger_webhooks_for_event.delay")
+@mock.patch("koytola.plugins.webhook.tasks.trigger_webhooks_for_event.delay")
 def test_customer_created(mocked_webhook_trigger, settings, customer_user):
     settings.PLUGINS = ["koytola.plugins.webhook.plugin.WebhookPlugin"]
     manager = get_plugins_manager()
@@ -98,7 +99,7 @@ def test_customer_created(mocked_webhook_trigger, settings, customer_user):
     )
 
 
-@mock.patch("koytola.plugins.webhook.plugin.trigger_webhooks_for_event.delay")
+@mock.patch("koytola.plugins.webhook.tasks.trigger_webhooks_for_event.delay")
 def test_order_fully_paid(mocked_webhook_trigger, settings, order_with_lines):
     settings.PLUGINS = ["koytola.plugins.webhook.plugin.WebhookPlugin"]
     manager = get_plugins_manager()
@@ -110,7 +111,7 @@ def test_order_fully_paid(mocked_webhook_trigger, settings, order_with_lines):
     )
 
 
-@mock.patch("koytola.plugins.webhook.plugin.trigger_webhooks_for_event.delay")
+@mock.patch("koytola.plugins.webhook.tasks.trigger_webhooks_for_event.delay")
 def test_product_created(mocked_webhook_trigger, settings, product):
     settings.PLUGINS = ["koytola.plugins.webhook.plugin.WebhookPlugin"]
     manager = get_plugins_manager()
@@ -122,7 +123,7 @@ def test_product_created(mocked_webhook_trigger, settings, product):
     )
 
 
-@mock.patch("koytola.plugins.webhook.plugin.trigger_webhooks_for_event.delay")
+@mock.patch("koytola.plugins.webhook.tasks.trigger_webhooks_for_event.delay")
 def test_order_updated(mocked_webhook_trigger, settings, order_with_lines):
     settings.PLUGINS = ["koytola.plugins.webhook.plugin.WebhookPlugin"]
     manager = get_plugins_manager()
@@ -134,7 +135,7 @@ def test_order_updated(mocked_webhook_trigger, settings, order_with_lines):
     )
 
 
-@mock.patch("koytola.plugins.webhook.plugin.trigger_webhooks_for_event.delay")
+@mock.patch("koytola.plugins.webhook.tasks.trigger_webhooks_for_event.delay")
 def test_order_cancelled(mocked_webhook_trigger, settings, order_with_lines):
     settings.PLUGINS = ["koytola.plugins.webhook.plugin.WebhookPlugin"]
     manager = get_plugins_manager()
@@ -146,7 +147,7 @@ def test_order_cancelled(mocked_webhook_trigger, settings, order_with_lines):
     )
 
 
-@mock.patch("koytola.plugins.webhook.plugin.trigger_webhooks_for_event.delay")
+@mock.patch("koytola.plugins.webhook.tasks.trigger_webhooks_for_event.delay")
 def test_checkout_quantity_changed(
     mocked_webhook_trigger, settings, checkout_with_items
 ):
@@ -160,7 +161,7 @@ def test_checkout_quantity_changed(
     )
 
 
-@mock.patch("koytola.plugins.webhook.plugin.trigger_webhooks_for_event.delay")
+@mock.patch("koytola.plugins.webhook.tasks.trigger_webhooks_for_event.delay")
 def test_checkout_created(mocked_webhook_trigger, settings, checkout_with_items):
     settings.PLUGINS = ["koytola.plugins.webhook.plugin.WebhookPlugin"]
     manager = get_plugins_manager()
@@ -172,7 +173,7 @@ def test_checkout_created(mocked_webhook_trigger, settings, checkout_with_items)
     )
 
 
-@mock.patch("koytola.plugins.webhook.plugin.trigger_webhooks_for_event.delay")
+@mock.patch("koytola.plugins.webhook.tasks.trigger_webhooks_for_event.delay")
 def test_checkout_updated(mocked_webhook_trigger, settings, checkout_with_items):
     settings.PLUGINS = ["koytola.plugins.webhook.plugin.WebhookPlugin"]
     manager = get_plugins_manager()
@@ -184,7 +185,7 @@ def test_checkout_updated(mocked_webhook_trigger, settings, checkout_with_items)
     )
 
 
-@mock.patch("koytola.plugins.webhook.plugin.trigger_webhooks_for_event.delay")
+@mock.patch("koytola.plugins.webhook.tasks.trigger_webhooks_for_event.delay")
 def test_invoice_request(mocked_webhook_trigger, settings, fulfilled_order):
     settings.PLUGINS = ["koytola.plugins.webhook.plugin.WebhookPlugin"]
     manager = get_plugins_manager()
@@ -196,7 +197,7 @@ def test_invoice_request(mocked_webhook_trigger, settings, fulfilled_order):
     )
 
 
-@mock.patch("koytola.plugins.webhook.plugin.trigger_webhooks_for_event.delay")
+@mock.patch("koytola.plugins.webhook.tasks.trigger_webhooks_for_event.delay")
 def test_invoice_delete(mocked_webhook_trigger, settings, fulfilled_order):
     settings.PLUGINS = ["koytola.plugins.webhook.plugin.WebhookPlugin"]
     manager = get_plugins_manager()
@@ -208,7 +209,7 @@ def test_invoice_delete(mocked_webhook_trigger, settings, fulfilled_order):
     )
 
 
-@mock.patch("koytola.plugins.webhook.plugin.trigger_webhooks_for_event.delay")
+@mock.patch("koytola.plugins.webhook.tasks.trigger_webhooks_for_event.delay")
 def test_invoice_sent(mocked_webhook_trigger, settings, fulfilled_order):
     settings.PLUGINS = ["koytola.plugins.webhook.plugin.WebhookPlugin"]
     manager = get_plugins_manager()
@@ -218,3 +219,18 @@ def test_invoice_sent(mocked_webhook_trigger, settings, fulfilled_order):
     mocked_webhook_trigger.assert_called_once_with(
         WebhookEventType.INVOICE_SENT, expected_data
     )
+
+
+@mock.patch("koytola.plugins.webhook.tasks.send_webhook_request.delay")
+def test_trigger_webhooks_for_event_uses_cached_index(
+    mock_request, app, permission_manage_orders, django_assert_num_queries
+):
+    app.permissions.add(permission_manage_orders)
+    webhook = app.webhooks.create(target_url=first_url)
+    webhook.events.create(event_type=WebhookEventType.ORDER_CREATED)
+    webhooks_cache.clear()
+
+    trigger_webhooks_for_event(WebhookEventType.ORDER_CREATED, data="")
+    with django_assert_num_queries(0):
+        trigger_webhooks_for_event(WebhookEventType.ORDER_CREATED, data="")
+    assert mock_request.call_count == 2
@@ -2,7 +2,6 @@ from unittest.mock import MagicMock, patch
 
 import boto3
 import pytest
-import requests
 from django.core.serializers import serialize
 from google.cloud.pubsub_v1 import PublisherClient
 from kombu.asynchronous.aws.sqs.connection import AsyncSQSConnection
@@ -10,6 +9,14 @@ from kombu.asynchronous.aws.sqs.connection import AsyncSQSConnection
 from ....webhook.event_types import WebhookEventType
 from ...webhook import signature_for_payload
 from ...webhook.tasks import trigger_webhooks_for_event
+from ...webhook.transports import reset_transports
+
+
+@pytest.fixture(autouse=True)
+def clear_pooled_transports():
+    reset_transports()
+    yield
+    reset_transports()
 
 
 def test_trigger_webhooks_with_aws_sqs(
@@ -24,7 +31,7 @@ def test_trigger_webhooks_with_aws_sqs(
     mocked_client_constructor = MagicMock(spec=boto3.client, return_value=mocked_client)
 
     monkeypatch.setattr(
-        "koytola.plugins.webhook.tasks.boto3.client", mocked_client_constructor,
+        "koytola.plugins.webhook.transports.boto3.client", mocked_client_constructor,
     )
 
     webhook.app.permissions.add(permission_manage_orders)
@@ -70,7 +77,7 @@ def test_trigger_webhooks_with_aws_sqs_and_secret_key(
     mocked_client_constructor = MagicMock(spec=boto3.client, return_value=mocked_client)
 
     monkeypatch.setattr(
-        "koytola.plugins.webhook.tasks.boto3.client", mocked_client_constructor,
+        "koytola.plugins.webhook.transports.boto3.client", mocked_client_constructor,
     )
 
     webhook.app.permissions.add(permission_manage_orders)
@@ -119,7 +126,7 @@ def test_trigger_webhooks_with_google_pub_sub(
 ):
     mocked_publisher = MagicMock(spec=PublisherClient)
     monkeypatch.setattr(
-        "koytola.plugins.webhook.tasks.pubsub_v1.PublisherClient",
+        "koytola.plugins.webhook.transports.pubsub_v1.PublisherClient",
         lambda: mocked_publisher,
     )
     webhook.app.permissions.add(permission_manage_orders)
@@ -148,7 +155,7 @@ def test_trigger_webhooks_with_google_pub_sub_and_secret_key(
 ):
     mocked_publisher = MagicMock(spec=PublisherClient)
     monkeypatch.setattr(
-        "koytola.plugins.webhook.tasks.pubsub_v1.PublisherClient",
+        "koytola.plugins.webhook.transports.pubsub_v1.PublisherClient",
         lambda: mocked_publisher,
     )
     webhook.app.permissions.add(permission_manage_orders)
@@ -170,10 +177,9 @@ def test_trigger_webhooks_with_google_pub_sub_and_secret_key(
     )
 
 
-@pytest.mark.vcr
-@patch("koytola.plugins.webhook.tasks.requests.post", wraps=requests.post)
+@patch("koytola.plugins.webhook.tasks.get_http_session")
 def test_trigger_webhooks_with_http(
-    mock_request,
+    mock_get_http_session,
     webhook,
     order_with_lines,
     permission_manage_orders,
@@ -195,7 +201,7 @@ def test_trigger_webhooks_with_http(
         "X-Koytola-Signature": "",
     }
 
-    mock_request.assert_called_once_with(
+    mock_get_http_session.return_value.post.assert_called_once_with(
         webhook.target_url,
         data=bytes(expected_data, "utf-8"),
         headers=expected_headers,
@@ -203,10 +209,9 @@ def test_trigger_webhooks_with_http(
     )
 
 
-@pytest.mark.vcr
-@patch("koytola.plugins.webhook.tasks.requests.post", wraps=requests.post)
+@patch("koytola.plugins.webhook.tasks.get_http_session")
 def test_trigger_webhooks_with_http_and_secret_key(
-    mock_request, webhook, order_with_lines, permission_manage_orders
+    mock_get_http_session, webhook, order_with_lines, permission_manage_orders
 ):
     webhook.app.permissions.add(permission_manage_orders)
     webhook.target_url = "https://webhook.site/48978b64-4efb-43d5-a334-451a1d164009"
@@ -227,7 +232,7 @@ def test_trigger_webhooks_with_http_and_secret_key(
         "X-Koytola-HMAC-SHA256": f"sha1={expected_signature}",
     }
 
-    mock_request.assert_called_once_with(
+    mock_get_http_session.return_value.post.assert_called_once_with(
         webhook.target_url,
         data=bytes(expected_data, "utf-8"),
         headers=expected_headers,
@@ -0,0 +1,82 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ....webhook.event_types import WebhookEventType
+from ...webhook import signature_for_payload
+from ...webhook.tasks import send_webhook_batch_request, send_webhook_request
+from ...webhook.transports import reset_transports
+
+
+class RecordingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        self.server.received.append(
+            {
+                "event": self.headers["X-Project-Event"],
+                "signature": self.headers["X-Project-Signature"],
+                "body": self.rfile.read(length),
+                "client_port": self.client_address[1],
+            }
+        )
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def webhook_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RecordingHandler)
+    server.daemon_threads = True
+    server.received = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    reset_transports()
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def site_domain(monkeypatch):
+    monkeypatch.setattr(
+        "koytola.plugins.webhook.tasks.get_site_domain", lambda: "koytola.com"
+    )
+
+
+def test_send_webhook_request_reuses_http_connection(webhook_server):
+    target_url = "http://127.0.0.1:%d/webhook/" % webhook_server.server_port
+    reset_transports()
+
+    send_webhook_request(1, target_url, "", WebhookEventType.ORDER_CREATED, "{}")
+    send_webhook_request(1, target_url, "", WebhookEventType.ORDER_UPDATED, "{}")
+
+    first, second = webhook_server.received
+    assert first["event"] == WebhookEventType.ORDER_CREATED
+    assert second["event"] == WebhookEventType.ORDER_UPDATED
+    assert first["client_port"] == second["client_port"]
+
+
+def test_send_webhook_batch_request_posts_all_events_at_once(webhook_server):
+    target_url = "http://127.0.0.1:%d/webhook/" % webhook_server.server_port
+    events = [
+        (WebhookEventType.ORDER_CREATED, '{"id": 1}'),
+        (WebhookEventType.ORDER_UPDATED, '{"id": 2}'),
+    ]
+
+    send_webhook_batch_request(1, target_url, "secret", events)
+
+    (request,) = webhook_server.received
+    assert request["event"] == "batch"
+    assert request["signature"] == signature_for_payload(request["body"], "secret")
+    assert json.loads(request["body"]) == [
+        {"event": WebhookEventType.ORDER_CREATED, "payload": {"id": 1}},
+        {"event": WebhookEventType.ORDER_UPDATED, "payload": {"id": 2}},
+    ]
@@ -0,0 +1,92 @@
+"""Per-worker pooled clients used to deliver webhooks.
+
+Every delivery used to open a new TLS connection or build a new SQS or Pub/Sub
+client. The clients kept here are created lazily, once per process, and reused
+by all the deliveries made by that process. Clients are never shared with
+forked children: a process that doesn't own the pool builds its own.
+"""
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import boto3
+import requests
+from django.conf import settings
+from google.cloud import pubsub_v1
+from requests.adapters import HTTPAdapter
+
+_lock = threading.Lock()
+_pool_pid: Optional[int] = None
+_http_session: Optional[requests.Session] = None
+_sqs_clients: Dict[Tuple[Optional[str], Optional[str], str], object] = {}
+_pubsub_publisher: Optional[pubsub_v1.PublisherClient] = None
+
+
+def _ensure_process_pool():
+    """Drop the clients inherited from the parent process after a fork."""
+    global _pool_pid, _http_session, _pubsub_publisher
+    pid = os.getpid()
+    if _pool_pid != pid:
+        _pool_pid = pid
+        _http_session = None
+        _pubsub_publisher = None
+        _sqs_clients.clear()
+
+
+def get_http_session() -> requests.Session:
+    """Return the keep-alive session with a connection pool for each host."""
+    global _http_session
+    with _lock:
+        _ensure_process_pool()
+        if _http_session is None:
+            adapter = HTTPAdapter(
+                pool_connections=settings.WEBHOOK_HTTP_POOL_CONNECTIONS,
+                pool_maxsize=settings.WEBHOOK_HTTP_POOL_MAXSIZE,
+            )
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _http_session = session
+        return _http_session
+
+
+def get_sqs_client(
+    region: str, access_key_id: Optional[str], secret_access_key: Optional[str]
+):
+    """Return the SQS client for the given credentials and region."""
+    key = (access_key_id, secret_access_key, region)
+    with _lock:
+        _ensure_process_pool()
+        if key not in _sqs_clients:
+            client_kwargs = {}
+            if settings.WEBHOOK_SQS_ENDPOINT_URL:
+                client_kwargs["endpoint_url"] = settings.WEBHOOK_SQS_ENDPOINT_URL
+            _sqs_clients[key] = boto3.client(
+                "sqs",
+                region_name=region,
+                aws_access_key_id=access_key_id,
+                aws_secret_access_key=secret_access_key,
+                **client_kwargs,
+            )
+        return _sqs_clients[key]
+
+
+def get_pubsub_publisher() -> pubsub_v1.PublisherClient:
+    """Return the Pub/Sub publisher using the default Google credentials."""
+    global _pubsub_publisher
+    with _lock:
+        _ensure_process_pool()
+        if _pubsub_publisher is None:
+            _pubsub_publisher = pubsub_v1.PublisherClient()
+        return _pubsub_publisher
+
+
+def reset_transports():
+    """Close and forget all the pooled clients of the current process."""
+    global _http_session, _pubsub_publisher
+    with _lock:
+        if _http_session is not None:
+            _http_session.close()
+        _http_session = None
+        _pubsub_publisher = None
+        _sqs_clients.clear()
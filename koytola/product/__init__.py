@@ -76,3 +76,17 @@ class DeliveryTimeOption:
         (RTS, "Ready To Ship"),
         (NTTS, "Needs Time To Ship"),
     ]
+
+
+class CatalogueImportType:
+    """The kinds of the files imported into the catalogue."""
+
+    COMPANIES = "companies"
+    PRODUCTS = "products"
+    PRODUCT_IMAGES = "product_images"
+
+    CHOICES = [
+        (COMPANIES, "Companies"),
+        (PRODUCTS, "Products"),
+        (PRODUCT_IMAGES, "Product images"),
+    ]
@@ -11,7 +11,7 @@ from .models import (
     ProductQuery,
     QueryChat
 )
-from ..core.utils import download_csv
+from ..core.utils.export import download_csv, download_jsonl, download_xlsx
 from django.contrib.admin import SimpleListFilter
 
 
@@ -40,7 +40,7 @@ class CategoryAdmin(admin.ModelAdmin):
     search_fields = ["name", "slug", "description"]
     list_filter = ()
     list_per_page = 100
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["name", "-id"]
@@ -60,7 +60,7 @@ class ProductAdmin(admin.ModelAdmin):
         "creation_date", "publication_date", "update_date"
     ]
     list_per_page = 100
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-creation_date", "id"]
@@ -73,7 +73,7 @@ class ProductPriceAdmin(admin.ModelAdmin):
     search_fields = ["product"]
     list_filter = []
     list_per_page = 100
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-id"]
@@ -86,7 +86,7 @@ class ProductImageAdmin(admin.ModelAdmin):
     search_fields = ["product", "alt_text"]
     list_filter = []
     list_per_page = 100
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-id"]
@@ -99,7 +99,7 @@ class ProductVideoAdmin(admin.ModelAdmin):
     search_fields = ["product", "alt_text"]
     list_filter = []
     list_per_page = 100
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-id"]
@@ -108,7 +108,7 @@ class ProductVideoAdmin(admin.ModelAdmin):
 class HSCodeAndProductAdmin(admin.ModelAdmin):
     list_display = ["id", "hs_code", "product_name"]
     search_fields = ["id", "hs_code", "product_name"]
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-id"]
@@ -117,7 +117,7 @@ class HSCodeAndProductAdmin(admin.ModelAdmin):
 class OffersAmin(admin.ModelAdmin):
     list_display = ["id", "company", "user", 'title', 'get_code', 'value', 'unit', 'start_date', 'end_date']
     search_fields = ["id", "company", "title", "get_code"]
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-id"]
@@ -128,7 +128,7 @@ class PortDealsAdmin(admin.ModelAdmin):
                     'price', 'currency', 'quantity_unit', 'container_number', 'is_active', 'start_date', 'end_date',
                     'is_expire']
     search_fields = ["id", "company__name", "name", "product_name", 'hs_code', 'start_date', 'end_date']
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-id"]
@@ -145,7 +145,7 @@ class ProductQueryAdmin(admin.ModelAdmin):
 
     list_display = ["id", "user", "seller", "product", "name", "quantity", "country"]
     search_fields = ["name", "product_query_user__user", "product_query_user__seller", "country"]
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-id"]
@@ -154,7 +154,7 @@ class ProductQueryAdmin(admin.ModelAdmin):
 class QueryChatAdmin(admin.ModelAdmin):
     list_display = ["id", "to", "by", "query", "message", "created_at"]
     search_fields = ["to", "by", "query", "message"]
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-id"]
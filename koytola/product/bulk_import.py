@@ -0,0 +1,646 @@
+"""Bulk import of companies, products and product images from CSV files.
+
+The files have the shape of the admin CSV exports, the columns are matched by
+the verbose names or the names of the fields. Each file is read in chunks of
+`CATALOGUE_IMPORT_CHUNK_SIZE` rows and every chunk goes through the stages:
+
+1. the values are parsed and validated,
+2. companies, categories, industries etc. are resolved through the maps
+   prefetched for the whole chunk and the HS codes are normalised,
+3. the rows imported before are skipped and the slugs are generated in bulk,
+4. the images given as URLs are fetched on a pool of threads,
+5. the rows and their many-to-many links are saved with `bulk_create`,
+6. the thumbnails of the new images are warmed on the pool.
+
+Products are identified by their slugs, or by their companies and names when
+they have none, companies by their names and images by their products and
+files. Importing a file again creates only the rows that failed before, their
+errors are collected per row, see `write_report`.
+"""
+import ast
+import csv
+import hashlib
+import io
+import ipaddress
+import json
+import logging
+import os
+import socket
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import reduce
+from itertools import islice
+from operator import or_
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+
+import requests
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection, models, transaction
+from django.utils.text import slugify
+from django_countries.fields import CountryField
+from versatileimagefield.fields import PPOIField
+
+from ..core.utils import create_thumbnails
+from ..profile.models import CertificateType, Company, Industry, Roetter
+from . import CatalogueImportType
+from .models import Category, HSCodeAndProduct, Product, ProductImage
+
+logger = logging.getLogger(__name__)
+
+DATE_FORMATS = ["%d/%m/%Y"]
+# Room left in the slugs for the numeric suffixes making them unique.
+MAX_SLUG_SUFFIX_LENGTH = 10
+MAX_IMAGE_REDIRECTS = 3
+IMAGE_CHUNK_SIZE = 64 * 1024
+
+
+class CatalogueImportError(Exception):
+    """The file can't be imported at all, e.g. a required column is missing."""
+
+
+class RowError(NamedTuple):
+    line: int
+    field: str
+    message: str
+
+
+class ImportResult:
+    def __init__(self):
+        self.created = 0
+        self.skipped = 0
+        self.errors: List[RowError] = []
+
+    @property
+    def failed(self) -> int:
+        return len({error.line for error in self.errors})
+
+
+class Row:
+    """Values of a single line of the file on its way through the stages."""
+
+    def __init__(self, line: int, data: Dict[str, str]):
+        self.line = line
+        self.data = data
+        self.values: Dict = {}
+        self.links: Dict[str, List] = {}
+        self.failed = False
+        self.instance = None
+        self.image_url: Optional[str] = None
+
+
+class Relation(NamedTuple):
+    model: type
+    # Fields of the related model matched with the values, in order.
+    lookups: Tuple[str, ...]
+
+
+def _parse_literal(value: str):
+    # The old admin exports wrote Python reprs instead of JSON.
+    try:
+        return json.loads(value)
+    except ValueError:
+        return ast.literal_eval(value)
+
+
+def _parse_date(field, value: str):
+    try:
+        return field.to_python(value)
+    except ValidationError:
+        for date_format in DATE_FORMATS:
+            try:
+                return datetime.strptime(value, date_format).date()
+            except ValueError:
+                pass
+        raise
+
+
+def parse_value(field, value: str):
+    value = value.strip()
+    if not value:
+        if field.null:
+            return None
+        if field.has_default():
+            return field.get_default()
+        return ""
+    if isinstance(field, (models.JSONField, PPOIField)):
+        try:
+            return _parse_literal(value)
+        except (ValueError, SyntaxError):
+            raise ValidationError("Enter a valid JSON value.")
+    if isinstance(field, CountryField) and field.multiple:
+        try:
+            return _parse_literal(value)
+        except (ValueError, SyntaxError):
+            return [code.strip() for code in value.split(",") if code.strip()]
+    if isinstance(field, models.DateField):
+        return _parse_date(field, value)
+    return field.to_python(value)
+
+
+def normalize_hs_code(value: str) -> str:
+    return "".join(char for char in value if char.isdigit())
+
+
+def is_url(value: str) -> bool:
+    return urlparse(value).scheme in ("http", "https")
+
+
+def get_image_name(field, url: str) -> str:
+    """Return the storage name of an image fetched from the URL.
+
+    The name depends only on the URL, so that an image imported again is
+    recognized without fetching it.
+    """
+    digest = hashlib.sha1(url.encode()).hexdigest()[:12]
+    basename = os.path.basename(urlparse(url).path) or "image"
+    return field.generate_filename(None, "import-%s-%s" % (digest, basename))
+
+
+def check_public_url(url: str):
+    """Raise ValueError unless all the addresses of the URL's host are public.
+
+    Imported files are written by the users, their URLs mustn't reach the hosts
+    of the internal network.
+    """
+    parts = urlparse(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise ValueError("The URL isn't an HTTP URL.")
+    for *_, sockaddr in socket.getaddrinfo(parts.hostname, None):
+        address = ipaddress.ip_address(sockaddr[0].split("%")[0])
+        if not address.is_global or address.is_multicast:
+            raise ValueError("The URL doesn't point to a public host.")
+
+
+def _read_image(response: requests.Response) -> bytes:
+    max_size = settings.CATALOGUE_IMPORT_MAX_IMAGE_SIZE
+    too_large = ValueError("The image is larger than %d bytes." % max_size)
+    if int(response.headers.get("Content-Length") or 0) > max_size:
+        raise too_large
+    content = bytearray()
+    for chunk in response.iter_content(IMAGE_CHUNK_SIZE):
+        content += chunk
+        if len(content) > max_size:
+            raise too_large
+    return bytes(content)
+
+
+def fetch_image(url: str) -> bytes:
+    # Redirects are followed by hand, each of their targets is checked.
+    for _ in range(MAX_IMAGE_REDIRECTS + 1):
+        check_public_url(url)
+        with requests.get(
+            url,
+            timeout=settings.CATALOGUE_IMPORT_TIMEOUT,
+            stream=True,
+            allow_redirects=False,
+        ) as response:
+            if response.is_redirect:
+                url = urljoin(url, response.headers["Location"])
+                continue
+            response.raise_for_status()
+            if not response.headers.get("Content-Type", "").startswith("image/"):
+                raise ValueError("The URL doesn't point to an image.")
+            return _read_image(response)
+    raise ValueError("The URL redirects too many times.")
+
+
+def _warm_thumbnails(image_id: int):
+    try:
+        create_thumbnails(pk=image_id, model=ProductImage, size_set="products")
+    except Exception:
+        logger.exception("Cannot create the thumbnails of the image %s", image_id)
+    finally:
+        # Every thread of the pool opens its own connection to the database.
+        connection.close()
+
+
+def get_pks(relation: Relation, values) -> Dict[str, Optional[int]]:
+    """Return the primary keys of the objects matching the values.
+
+    The first lookup matching a value wins. Values matching several objects
+    by the same lookup are mapped to None.
+    """
+    if not values:
+        return {}
+    lookup = reduce(
+        or_, [models.Q(**{"%s__in" % name: values}) for name in relation.lookups]
+    )
+    objects = list(
+        relation.model._default_manager.filter(lookup).values_list(
+            "pk", *relation.lookups
+        )
+    )
+    pks: Dict[str, Optional[int]] = {}
+    for index in reversed(range(1, len(relation.lookups) + 1)):
+        matches = defaultdict(set)
+        for obj in objects:
+            if obj[index] in values:
+                matches[obj[index]].add(obj[0])
+        for value, found in matches.items():
+            pks[value] = found.pop() if len(found) == 1 else None
+    return pks
+
+
+class Importer:
+    model: type
+    # Fields that are never imported, in addition to the non-editable ones.
+    exclude: Tuple[str, ...] = ()
+    required: Tuple[str, ...] = ()
+    relations: Dict[str, Relation] = {}
+
+    def __init__(
+        self,
+        result: ImportResult,
+        executor: ThreadPoolExecutor,
+        warm_thumbnails: bool = True,
+    ):
+        self.result = result
+        self.executor = executor
+        self.warm_thumbnails = warm_thumbnails
+        self.fields = {
+            field.name: field
+            for field in self.model._meta.get_fields()
+            if (field.concrete or field.many_to_many)
+            and not field.auto_created
+            and field.editable
+            and field.name not in self.exclude
+        }
+
+    def get_columns(self, header: List[str]) -> Dict[str, str]:
+        """Map the columns of the file to the names of the fields."""
+        names = {}
+        for field in self.fields.values():
+            names[str(field.verbose_name).lower()] = field.name
+            names[field.name] = field.name
+        columns = {
+            column: names[column.strip().lower()]
+            for column in header
+            if column.strip().lower() in names
+        }
+        missing = set(self.required) - set(columns.values())
+        if missing:
+            raise CatalogueImportError(
+                "Missing columns: %s." % ", ".join(sorted(missing))
+            )
+        return columns
+
+    def add_error(self, row: Row, field: str, message: str):
+        row.failed = True
+        self.result.errors.append(RowError(row.line, field, message))
+
+    def parse(self, row: Row):
+        for name, value in row.data.items():
+            field = self.fields[name]
+            if field.many_to_many:
+                row.links[name] = [item.strip() for item in value.split(",")]
+                row.links[name] = [item for item in row.links[name] if item]
+            elif name in self.relations:
+                row.values[name] = value.strip() or None
+            else:
+                try:
+                    row.values[name] = parse_value(field, value)
+                except ValidationError as error:
+                    for message in error.messages:
+                        self.add_error(row, name, message)
+
+    def _resolve(self, row: Row, name: str, value: str, pks: Dict):
+        pk = pks.get(value)
+        if pk is None:
+            verbose_name = self.relations[name].model._meta.verbose_name
+            message = "%s %r doesn't exist or isn't unique." % (
+                verbose_name.capitalize(),
+                value,
+            )
+            self.add_error(row, name, message)
+        return pk
+
+    def resolve(self, rows: List[Row]):
+        for name, relation in self.relations.items():
+            field = self.fields.get(name)
+            if not field:
+                continue
+            rows_with_values = [row for row in rows if name in row.data]
+            if field.many_to_many:
+                values = {
+                    value for row in rows_with_values for value in row.links[name]
+                }
+            else:
+                values = {row.values[name] for row in rows_with_values}
+            pks = get_pks(relation, values - {None})
+            for row in rows_with_values:
+                if field.many_to_many:
+                    row.links[name] = [
+                        self._resolve(row, name, value, pks)
+                        for value in row.links[name]
+                    ]
+                else:
+                    value = row.values.pop(name)
+                    if value:
+                        row.values[field.attname] = self._resolve(
+                            row, name, value, pks
+                        )
+
+    def get_validation_exclude(self, row: Row) -> List[str]:
+        # The related objects are checked when they are resolved.
+        return [name for name in self.fields if name in self.relations]
+
+    def validate(self, rows: List[Row]):
+        for row in rows:
+            row.instance = self.model(**row.values)
+            try:
+                row.instance.clean_fields(exclude=self.get_validation_exclude(row))
+            except ValidationError as error:
+                for name, messages in error.message_dict.items():
+                    for message in messages:
+                        self.add_error(row, name, message)
+
+    def get_key(self, row: Row):
+        """Return the value identifying the row among the ones imported before."""
+        raise NotImplementedError()
+
+    def get_existing_keys(self, rows: List[Row]) -> set:
+        raise NotImplementedError()
+
+    def skip_existing(self, rows: List[Row]) -> List[Row]:
+        existing = self.get_existing_keys(rows)
+        new = []
+        for row in rows:
+            key = self.get_key(row)
+            if key in existing:
+                self.result.skipped += 1
+            else:
+                # Rows repeated in the file are imported once.
+                existing.add(key)
+                new.append(row)
+        return new
+
+    def prepare(self, rows: List[Row]):
+        pass
+
+    def save(self, rows: List[Row]):
+        with transaction.atomic():
+            self.model._default_manager.bulk_create([row.instance for row in rows])
+            for name, field in self.fields.items():
+                if not field.many_to_many:
+                    continue
+                through = field.remote_field.through
+                source = "%s_id" % field.m2m_field_name()
+                target = "%s_id" % field.m2m_reverse_field_name()
+                through._default_manager.bulk_create(
+                    [
+                        through(**{source: row.instance.pk, target: pk})
+                        for row in rows
+                        for pk in row.links.get(name, [])
+                    ],
+                    ignore_conflicts=True,
+                )
+        self.result.created += len(rows)
+
+    def after_save(self, rows: List[Row]):
+        pass
+
+    def import_chunk(self, rows: List[Row]):
+        for row in rows:
+            self.parse(row)
+        rows = [row for row in rows if not row.failed]
+        self.resolve(rows)
+        rows = [row for row in rows if not row.failed]
+        self.validate(rows)
+        rows = self.skip_existing([row for row in rows if not row.failed])
+        self.prepare(rows)
+        rows = [row for row in rows if not row.failed]
+        if rows:
+            self.save(rows)
+            self.after_save(rows)
+
+
+class SlugImporter(Importer):
+    """Importer of the objects with unique slugs."""
+
+    def get_validation_exclude(self, row: Row) -> List[str]:
+        exclude = super().get_validation_exclude(row)
+        if not row.instance.slug:
+            # Generated once the rows imported before are skipped.
+            exclude.append("slug")
+        return exclude
+
+    def prepare(self, rows: List[Row]):
+        """Check the slugs of the rows and generate the missing ones at once."""
+        slug_field = self.model._meta.get_field("slug")
+        max_length = slug_field.max_length - MAX_SLUG_SUFFIX_LENGTH
+        given = [row.instance.slug for row in rows if row.instance.slug]
+        bases = {
+            row.line: slugify(row.instance.name, allow_unicode=True)[:max_length]
+            or self.model._meta.model_name
+            for row in rows
+            if not row.instance.slug
+        }
+        lookup = models.Q(slug__in=given)
+        for base in set(bases.values()):
+            lookup |= models.Q(slug__startswith=base)
+        taken = set(
+            self.model._default_manager.filter(lookup).values_list("slug", flat=True)
+        )
+        for row in rows:
+            slug = row.instance.slug
+            if slug and slug in taken:
+                self.add_error(row, "slug", "The slug is already used.")
+            elif slug:
+                taken.add(slug)
+        for row in rows:
+            base = bases.get(row.line)
+            if base is None:
+                continue
+            slug, suffix = base, 1
+            while slug in taken:
+                suffix += 1
+                slug = "%s-%d" % (base, suffix)
+            taken.add(slug)
+            row.instance.slug = slug
+
+
+class CompanyImporter(SlugImporter):
+    model = Company
+    exclude = ("user", "address", "logo")
+    required = ("name",)
+    relations = {
+        "industry": Relation(Industry, ("name",)),
+        "rosetter": Relation(Roetter, ("name",)),
+    }
+
+    def validate(self, rows: List[Row]):
+        super().validate(rows)
+        for row in rows:
+            if not row.failed and not row.instance.name:
+                self.add_error(row, "name", "This field cannot be blank.")
+
+    def get_key(self, row: Row):
+        return row.instance.name
+
+    def get_existing_keys(self, rows: List[Row]) -> set:
+        names = [row.instance.name for row in rows]
+        return set(
+            Company.objects.filter(name__in=names).values_list("name", flat=True)
+        )
+
+
+class ProductImporter(SlugImporter):
+    model = Product
+    required = ("name", "hs_code")
+    relations = {
+        "company": Relation(Company, ("slug", "name")),
+        "category": Relation(Category, ("slug", "name")),
+        "certificate_type": Relation(CertificateType, ("name",)),
+        "rosetter": Relation(Roetter, ("name",)),
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._known_hs_codes: Optional[Dict[str, str]] = None
+
+    def get_known_hs_codes(self) -> Dict[str, str]:
+        """Return the known HS codes by their digits, fetched once per import."""
+        if self._known_hs_codes is None:
+            codes = HSCodeAndProduct.objects.values_list("hs_code", flat=True)
+            self._known_hs_codes = {
+                normalize_hs_code(code): code for code in codes.distinct()
+            }
+        return self._known_hs_codes
+
+    def get_key(self, row: Row):
+        if row.instance.slug:
+            return row.instance.slug
+        # Names of the products are unique only within their companies.
+        return (row.instance.company_id, row.instance.name)
+
+    def get_existing_keys(self, rows: List[Row]) -> set:
+        slugs = [row.instance.slug for row in rows if row.instance.slug]
+        names = [row.instance.name for row in rows if not row.instance.slug]
+        keys = set(Product.objects.filter(slug__in=slugs).values_list("slug", flat=True))
+        keys.update(Product.objects.filter(name__in=names).values_list("company_id", "name"))
+        return keys
+
+    def validate(self, rows: List[Row]):
+        for row in rows:
+            row.values["hs_code"] = normalize_hs_code(row.values.get("hs_code", ""))
+        super().validate(rows)
+        # Codes found among the known ones are stored in their format, the
+        # others as the digits.
+        known_codes = self.get_known_hs_codes()
+        for row in rows:
+            hs_code = row.instance.hs_code
+            row.instance.hs_code = known_codes.get(hs_code, hs_code)
+
+
+class ProductImageImporter(Importer):
+    model = ProductImage
+    required = ("product", "image")
+    relations = {"product": Relation(Product, ("slug", "name"))}
+
+    def parse(self, row: Row):
+        url = row.data["image"].strip()
+        if is_url(url):
+            row.image_url = url
+            row.data["image"] = get_image_name(self.fields["image"], url)
+        super().parse(row)
+
+    def get_key(self, row: Row):
+        return (row.instance.product_id, row.instance.image.name)
+
+    def get_existing_keys(self, rows: List[Row]) -> set:
+        return set(
+            ProductImage.objects.filter(
+                product_id__in={row.instance.product_id for row in rows},
+                image__in={row.instance.image.name for row in rows},
+            ).values_list("product_id", "image")
+        )
+
+    def prepare(self, rows: List[Row]):
+        """Fetch the images missing from the storage on the pool."""
+        downloads = {}
+        for row in rows:
+            name = row.instance.image.name
+            if row.image_url and name not in downloads:
+                if not default_storage.exists(name):
+                    downloads[name] = self.executor.submit(fetch_image, row.image_url)
+        for row in rows:
+            name = row.instance.image.name
+            try:
+                if name in downloads:
+                    content = downloads.pop(name).result()
+                    row.instance.image.name = default_storage.save(
+                        name, ContentFile(content)
+                    )
+                elif not default_storage.exists(name):
+                    raise FileNotFoundError("The file doesn't exist.")
+            except (OSError, ValueError, requests.RequestException) as error:
+                self.add_error(row, "image", str(error))
+
+    def after_save(self, rows: List[Row]):
+        if not self.warm_thumbnails:
+            return
+        image_ids = [row.instance.pk for row in rows]
+        # Other connections see the images only once they are committed.
+        transaction.on_commit(
+            lambda: list(self.executor.map(_warm_thumbnails, image_ids))
+        )
+
+
+IMPORTERS = {
+    CatalogueImportType.COMPANIES: CompanyImporter,
+    CatalogueImportType.PRODUCTS: ProductImporter,
+    CatalogueImportType.PRODUCT_IMAGES: ProductImageImporter,
+}
+
+
+def _iter_rows(reader, columns: Dict[str, int]) -> Iterator[Row]:
+    for values in reader:
+        if any(values):
+            data = {
+                name: values[index] if index < len(values) else ""
+                for name, index in columns.items()
+            }
+            yield Row(reader.line_num, data)
+
+
+def import_catalogue(
+    csv_file, import_type: str, warm_thumbnails: bool = True
+) -> ImportResult:
+    """Import the rows of a CSV file opened in the binary mode."""
+    result = ImportResult()
+    text = io.TextIOWrapper(csv_file, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.reader(text)
+        header = next(reader, None)
+        if not header:
+            raise CatalogueImportError("The file is empty.")
+        with ThreadPoolExecutor(settings.CATALOGUE_IMPORT_WORKERS) as executor:
+            importer = IMPORTERS[import_type](result, executor, warm_thumbnails)
+            names = importer.get_columns(header)
+            columns = {
+                names[column]: index
+                for index, column in enumerate(header)
+                if column in names
+            }
+            rows = _iter_rows(reader, columns)
+            while True:
+                chunk = list(islice(rows, settings.CATALOGUE_IMPORT_CHUNK_SIZE))
+                if not chunk:
+                    break
+                importer.import_chunk(chunk)
+    finally:
+        # The file is closed by its owner.
+        text.detach()
+    return result
+
+
+def write_report(errors: List[RowError], report_file):
+    """Write the errors of the rows as CSV into the text file."""
+    writer = csv.writer(report_file)
+    writer.writerow(RowError._fields)
+    writer.writerows(errors)
@@ -6,9 +6,11 @@ from ..product.models import ProductQueryUsers, QueryChat
 from django.contrib.auth.models import AnonymousUser
 import graphene
 from asgiref.sync import async_to_sync
+from ..core.metrics import WEBSOCKET_CONNECTIONS
 
 
 class ChatConsumer(AsyncWebsocketConsumer):
+    counted = False
 
     async def connect(self):
         self.room_name = self.scope['url_route']['kwargs']['room_name']
@@ -21,8 +23,13 @@ class ChatConsumer(AsyncWebsocketConsumer):
         )
 
         await self.accept()
+        WEBSOCKET_CONNECTIONS.labels("chat").inc()
+        self.counted = True
 
     async def disconnect(self, close_code):
+        if self.counted:
+            WEBSOCKET_CONNECTIONS.labels("chat").dec()
+            self.counted = False
         # Leave room group
         await self.channel_layer.group_discard(
             self.room_group_name,
@@ -0,0 +1,52 @@
+from typing import Any
+
+from django.core.management import BaseCommand, CommandError
+from django.core.management.base import CommandParser
+
+from ... import CatalogueImportType
+from ...bulk_import import CatalogueImportError, import_catalogue, write_report
+
+
+class Command(BaseCommand):
+    help = "Import companies, products or product images from a CSV file."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "import_type",
+            choices=[import_type for import_type, _ in CatalogueImportType.CHOICES],
+            help="Type of the imported rows.",
+        )
+        parser.add_argument("path", type=str, help="Path of the CSV file.")
+        parser.add_argument(
+            "--report",
+            type=str,
+            dest="report",
+            help="Write the errors of the failed rows as CSV into the file.",
+        )
+        parser.add_argument(
+            "--skip-thumbnails",
+            action="store_false",
+            dest="warm_thumbnails",
+            help="Don't create the thumbnails of the imported images.",
+        )
+
+    def handle(self, *args: Any, **options: Any):
+        try:
+            with open(options["path"], "rb") as csv_file:
+                result = import_catalogue(
+                    csv_file,
+                    options["import_type"],
+                    warm_thumbnails=options["warm_thumbnails"],
+                )
+        except (OSError, UnicodeDecodeError, CatalogueImportError) as e:
+            raise CommandError(str(e))
+        self.stdout.write(
+            "Created: %d, skipped: %d, failed: %d."
+            % (result.created, result.skipped, result.failed)
+        )
+        if result.errors and options["report"]:
+            with open(options["report"], "w", newline="") as report_file:
+                write_report(result.errors, report_file)
+        elif result.errors:
+            for error in result.errors:
+                self.stderr.write("Line %d, %s: %s" % error)
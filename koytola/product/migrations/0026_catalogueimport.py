@@ -0,0 +1,32 @@
+# Generated by Django 3.1 on 2021-09-24 10:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('product', '0025_auto_20210917_0623'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogueImport',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('success', 'Success'), ('failed', 'Failed'), ('deleted', 'Deleted')], default='pending', max_length=50)),
+                ('message', models.CharField(blank=True, max_length=255, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('type', models.CharField(choices=[('companies', 'Companies'), ('products', 'Products'), ('product_images', 'Product images')], max_length=32)),
+                ('file', models.FileField(upload_to='catalogue-imports')),
+                ('report', models.FileField(blank=True, null=True, upload_to='catalogue-imports')),
+                ('created_count', models.PositiveIntegerField(default=0)),
+                ('skipped_count', models.PositiveIntegerField(default=0)),
+                ('failed_count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['-created_at', 'pk'],
+            },
+        ),
+    ]
@@ -5,6 +5,7 @@ from mptt.models import MPTTModel
 from versatileimagefield.fields import PPOIField, VersatileImageField
 from ..core.db.fields import SanitizedJSONField
 from ..core.models import (
+    Job,
     ModelWithMetadata,
     PublishableModel,
     PublishedQuerySet,
@@ -27,7 +28,7 @@ from ..profile.models import (
     Images
 )
 from ..seo.models import SeoModel
-from . import ProductUnits, DeliveryTimeOption
+from . import CatalogueImportType, ProductUnits, DeliveryTimeOption
 from ..core.utils import upload_path_handler
 from ..profile.models import Roetter, CertificateType
 from django_countries.fields import Country, CountryField
@@ -300,3 +301,17 @@ class OpenExchange(models.Model):
 
     def __str__(self) -> str:
         return self.base
+
+
+class CatalogueImport(Job):
+    """Import of a CSV file into the catalogue, see `bulk_import`."""
+
+    type = models.CharField(max_length=32, choices=CatalogueImportType.CHOICES)
+    file = models.FileField(upload_to="catalogue-imports")
+    report = models.FileField(upload_to="catalogue-imports", blank=True, null=True)
+    created_count = models.PositiveIntegerField(default=0)
+    skipped_count = models.PositiveIntegerField(default=0)
+    failed_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["-created_at", "pk"]
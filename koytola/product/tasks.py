@@ -0,0 +1,44 @@
+import io
+
+from django.core.files.base import ContentFile
+
+from ..celeryconf import app
+from ..core import JobStatus
+from .bulk_import import CatalogueImportError, import_catalogue, write_report
+from .models import CatalogueImport
+
+
+@app.task
+def import_catalogue_task(job_id):
+    job = CatalogueImport.objects.get(pk=job_id)
+    try:
+        with job.file.open("rb") as csv_file:
+            result = import_catalogue(csv_file, job.type)
+    except (CatalogueImportError, UnicodeDecodeError) as e:
+        job.message = str(e)[:255]
+        job.status = JobStatus.FAILED
+        job.save(update_fields=["message", "status", "updated_at"])
+        return
+    except Exception:
+        job.message = "Unknown error."
+        job.status = JobStatus.FAILED
+        job.save(update_fields=["message", "status", "updated_at"])
+        raise
+    if result.errors:
+        report = io.StringIO()
+        write_report(result.errors, report)
+        job.report.save(
+            "import-%s-errors.csv" % job.pk,
+            ContentFile(report.getvalue().encode()),
+            save=False,
+        )
+    job.created_count = result.created
+    job.skipped_count = result.skipped
+    job.failed_count = result.failed
+    job.status = JobStatus.SUCCESS
+    job.message = "Created: %d, skipped: %d, failed: %d." % (
+        result.created,
+        result.skipped,
+        result.failed,
+    )
+    job.save()
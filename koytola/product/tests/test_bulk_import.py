@@ -0,0 +1,207 @@
+import io
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+from ...profile.models import Company, Roetter
+from .. import CatalogueImportType
+from ..bulk_import import (
+    CatalogueImportError,
+    fetch_image,
+    get_image_name,
+    import_catalogue,
+    normalize_hs_code,
+)
+from ..models import Category, HSCodeAndProduct, Product, ProductImage
+
+PRODUCTS_CSV = (
+    "ID,creation date,company,name,slug,description,hs code,category,"
+    "unit price,organic,tags,rosetter\n"
+    "135,25/08/2021,okdemo,apple,apple,\"{'Type': 'fruit'}\",0813.30,"
+    "fruit-juice,120.00,False,\"['apple']\",Vegan\n"
+    "134,22/08/2021,okdemo,Hoodie ,,{},120721,,0.00,False,[],\n"
+    "133,22/08/2021,missing,Pear,pear,{},0808,,0.00,False,[],\n"
+    "132,22/08/2021,okdemo,Plum,plum,{},,,1.00,False,[],\n"
+)
+
+
+def _import(data, import_type=CatalogueImportType.PRODUCTS):
+    return import_catalogue(io.BytesIO(data.encode()), import_type)
+
+
+def _create_catalogue():
+    Company.objects.create(name="okdemo", slug="okdemo")
+    Category.objects.create(name="Fruit juice", slug="fruit-juice")
+    Roetter.objects.create(name="Vegan", type="Product")
+    HSCodeAndProduct.objects.create(hs_code="0813.30", product_name="Apples")
+
+
+def test_normalize_hs_code():
+    assert normalize_hs_code(" 0813.30 ") == "081330"
+
+
+def test_import_products(db):
+    _create_catalogue()
+
+    result = _import(PRODUCTS_CSV)
+
+    assert result.created == 2
+    assert result.skipped == 0
+    assert {(error.line, error.field) for error in result.errors} == {
+        (4, "company"),
+        (5, "hs_code"),
+    }
+    assert result.failed == 2
+    apple = Product.objects.get(slug="apple")
+    assert apple.company.name == "okdemo"
+    assert apple.category.slug == "fruit-juice"
+    assert apple.hs_code == "0813.30"
+    assert apple.description == {"Type": "fruit"}
+    assert list(apple.rosetter.values_list("name", flat=True)) == ["Vegan"]
+    hoodie = Product.objects.get(name="Hoodie")
+    assert hoodie.slug == "hoodie"
+    assert hoodie.hs_code == "120721"
+
+
+def test_import_products_again_skips_imported_rows(db):
+    _create_catalogue()
+    _import(PRODUCTS_CSV)
+
+    result = _import(PRODUCTS_CSV)
+
+    assert result.created == 0
+    assert result.skipped == 2
+    assert result.failed == 2
+    assert Product.objects.count() == 2
+
+
+def test_import_products_generates_unique_slugs(db):
+    _create_catalogue()
+    Product.objects.create(name="Apple", slug="apple", hs_code="0813")
+    data = "name,company,hs code\nApple,okdemo,0813\nApple!,,0813\n"
+
+    result = _import(data)
+
+    assert result.created == 2
+    assert set(Product.objects.values_list("slug", flat=True)) == {
+        "apple",
+        "apple-2",
+        "apple-3",
+    }
+
+
+def test_import_companies(db):
+    Company.objects.create(name="Existing", slug="existing")
+    data = (
+        "slug,name,export countries,founded year,is verified\n"
+        ",UYANIKLAR GROUP,\"['DE', 'NL']\",1995,False\n"
+        "existing,Existing,[],2000,False\n"
+        "existing,Other,[],2000,False\n"
+    )
+
+    result = _import(data, CatalogueImportType.COMPANIES)
+
+    assert result.created == 1
+    assert result.skipped == 1
+    assert [(error.line, error.field) for error in result.errors] == [(4, "slug")]
+    company = Company.objects.get(name="UYANIKLAR GROUP")
+    assert company.slug == "uyaniklar-group"
+    assert [country.code for country in company.export_countries] == ["DE", "NL"]
+
+
+def test_import_missing_columns(db):
+    with pytest.raises(CatalogueImportError, match="hs_code"):
+        _import("name,slug\napple,apple\n")
+
+
+def _image_response(chunks, headers=None, status_code=200):
+    response = MagicMock(status_code=status_code, is_redirect=status_code == 302)
+    response.__enter__.return_value = response
+    response.headers = {"Content-Type": "image/jpeg", **(headers or {})}
+    response.iter_content.return_value = chunks
+    return response
+
+
+def _getaddrinfo(host, port):
+    address = {"example.com": "93.184.216.34"}.get(host, host)
+    return [(None, None, None, "", (address, 0))]
+
+
+@patch("koytola.product.bulk_import.socket.getaddrinfo", _getaddrinfo)
+@patch("koytola.product.bulk_import.requests.get")
+def test_fetch_image(get_mock, settings):
+    settings.CATALOGUE_IMPORT_MAX_IMAGE_SIZE = 10
+    get_mock.return_value = _image_response([b"image"])
+
+    assert fetch_image("https://example.com/apple.jpg") == b"image"
+    assert get_mock.call_args[1]["stream"] is True
+
+    get_mock.return_value = _image_response([b"image", b"image", b"image"])
+    with pytest.raises(ValueError, match="larger than 10 bytes"):
+        fetch_image("https://example.com/apple.jpg")
+
+
+@pytest.mark.parametrize(
+    "url", ["http://127.0.0.1/apple.jpg", "http://10.0.0.1/apple.jpg", "file:///etc"]
+)
+@patch("koytola.product.bulk_import.socket.getaddrinfo", _getaddrinfo)
+@patch("koytola.product.bulk_import.requests.get")
+def test_fetch_image_from_private_host(get_mock, url):
+    with pytest.raises(ValueError):
+        fetch_image(url)
+
+    get_mock.assert_not_called()
+
+
+@patch("koytola.product.bulk_import.socket.getaddrinfo", _getaddrinfo)
+@patch("koytola.product.bulk_import.requests.get")
+def test_fetch_image_redirected_to_private_host(get_mock):
+    get_mock.return_value = _image_response(
+        [], {"Location": "http://169.254.169.254/latest"}, status_code=302
+    )
+
+    with pytest.raises(ValueError, match="public host"):
+        fetch_image("https://example.com/apple.jpg")
+
+    assert get_mock.call_count == 1
+
+
+@patch("koytola.product.bulk_import.fetch_image")
+def test_import_product_images(fetch_image_mock, db, media_root, settings):
+    fetch_image_mock.return_value = b"image"
+    product = Product.objects.create(name="Apple", slug="apple", hs_code="0813")
+    default_storage.save("products/apple.jpg", ContentFile(b"image"))
+    url = "https://example.com/images/apple.jpg"
+    data = (
+        "ID,product,image,ppoi,alt text,index,order\n"
+        '1,apple,products/apple.jpg,"(0.5, 0.5)",,,1\n'
+        '2,apple,%s,"(0.5, 0.5)",Apple,,2\n'
+        '3,apple,products/missing.jpg,"(0.5, 0.5)",,,3\n' % url
+    )
+
+    result = import_catalogue(
+        io.BytesIO(data.encode()),
+        CatalogueImportType.PRODUCT_IMAGES,
+        warm_thumbnails=False,
+    )
+
+    assert result.created == 2
+    assert [(error.line, error.field) for error in result.errors] == [(4, "image")]
+    name = get_image_name(ProductImage._meta.get_field("image"), url)
+    assert set(product.images.values_list("image", flat=True)) == {
+        "products/apple.jpg",
+        name,
+    }
+    fetch_image_mock.assert_called_once_with(url)
+
+    result = import_catalogue(
+        io.BytesIO(data.encode()),
+        CatalogueImportType.PRODUCT_IMAGES,
+        warm_thumbnails=False,
+    )
+
+    assert result.created == 0
+    assert result.skipped == 2
+    fetch_image_mock.assert_called_once_with(url)
@@ -13,7 +13,7 @@ from .models import (
     Roetter,
     SuccessStory
 )
-from ..core.utils import download_csv
+from ..core.utils.export import download_csv, download_jsonl, download_xlsx
 
 
 class CompanyAdmin(admin.ModelAdmin):
@@ -34,7 +34,7 @@ class CompanyAdmin(admin.ModelAdmin):
         "update_date",
     ]
     list_per_page = 300
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-creation_date", "id"]
@@ -47,7 +47,7 @@ class RepresentativeAdmin(admin.ModelAdmin):
     search_fields = ["company", "name", "position"]
     list_filter = ["company", "position"]
     list_per_page = 100
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-id"]
@@ -58,7 +58,7 @@ class CertificateAdmin(admin.ModelAdmin):
     search_fields = ["company", "description"]
     list_filter = ["company"]
     list_per_page = 100
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-id"]
@@ -71,7 +71,7 @@ class BrochureAdmin(admin.ModelAdmin):
     search_fields = ["company", "description"]
     list_filter = ["company"]
     list_per_page = 100
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-id"]
@@ -84,7 +84,7 @@ class ImagesAdmin(admin.ModelAdmin):
     search_fields = ["company", "description"]
     list_filter = ["company"]
     list_per_page = 100
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-id"]
@@ -97,7 +97,7 @@ class VideoAdmin(admin.ModelAdmin):
     search_fields = ["company", "description"]
     list_filter = ["company"]
     list_per_page = 100
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-id"]
@@ -110,7 +110,7 @@ class SocialResponsibilityAdmin(admin.ModelAdmin):
     search_fields = ["company", "description"]
     list_filter = ["company"]
     list_per_page = 100
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-id"]
@@ -124,7 +124,7 @@ class ContactAdmin(admin.ModelAdmin):
     search_fields = ["user", "name", "email", "subject", "contact"]
     list_filter = ["submission_date", "user", "type", "status", "country"]
     list_per_page = 100
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-submission_date", "id"]
@@ -136,7 +136,7 @@ class IndustryAdmin(admin.ModelAdmin):
     search_fields = ["name", ]
     list_filter = ["name", "is_active"]
     list_per_page = 100
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-creation_date", "id"]
@@ -147,7 +147,7 @@ class CertificateTypeAdmin(admin.ModelAdmin):
     search_fields = ["name", ]
     list_filter = ["name", "is_active"]
     list_per_page = 100
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-creation_date", "id"]
@@ -158,7 +158,7 @@ class RoetterAdmin(admin.ModelAdmin):
     search_fields = ["name", "category", "type"]
     list_filter = ["name", "type", "is_active"]
     list_per_page = 100
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["created_at", "id"]
@@ -169,7 +169,7 @@ class SuccessStoryAdmin(admin.ModelAdmin):
     search_fields = ["title", "name", "company_name", "tags", "is_active", "is_active"]
     list_filter = ["title", "name", "company_name", "tags", "is_active", "is_active"]
     list_per_page = 100
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["created_at", "id"]
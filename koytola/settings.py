@@ -404,6 +404,46 @@ DEFAULT_CURRENCY_CODE_LENGTH = 4
 # Following the recommendation of https://tools.ietf.org/html/rfc5322#section-2.1.1
 DEFAULT_MAX_EMAIL_DISPLAY_NAME_LENGTH = 78
 
+# MaxMind database used instead of the bundled GeoLite2 snapshot.
+GEOIP_PATH = os.environ.get("GEOIP_PATH")
+GEOIP_CACHE_SIZE = int(os.environ.get("GEOIP_CACHE_SIZE", 10000))
+# Seconds between the checks whether the database file has changed.
+GEOIP_RELOAD_INTERVAL = int(os.environ.get("GEOIP_RELOAD_INTERVAL", 60))
+
+# Tracking events are buffered by every worker and written in batches.
+TRACKING_BATCH_SIZE = int(os.environ.get("TRACKING_BATCH_SIZE", 500))
+TRACKING_BUFFER_SIZE = int(os.environ.get("TRACKING_BUFFER_SIZE", 10000))
+TRACKING_FLUSH_INTERVAL = int(os.environ.get("TRACKING_FLUSH_INTERVAL", 5))
+# Maximum number of the events sent at once.
+TRACKING_EVENTS_MAX = int(os.environ.get("TRACKING_EVENTS_MAX", 100))
+# Seconds after the end of an hour before its trackings are rolled up into the
+# stats. Has to be longer than the flush interval of the tracking buffers.
+TRACKING_STATS_DELAY = int(os.environ.get("TRACKING_STATS_DELAY", 300))
+# Monthly partitions of the trackings created in advance. Partitions older than
+# the retention are exported to the archive path of the default storage and
+# dropped, 0 keeps all of them.
+TRACKING_PARTITIONS_AHEAD = int(os.environ.get("TRACKING_PARTITIONS_AHEAD", 3))
+TRACKING_RETENTION_MONTHS = int(os.environ.get("TRACKING_RETENTION_MONTHS", 24))
+TRACKING_ARCHIVE_PATH = os.environ.get("TRACKING_ARCHIVE_PATH", "tracking-archive")
+# Number of the trackings fetched at once from the server-side cursor of exports.
+TRACKING_EXPORT_CHUNK_SIZE = int(os.environ.get("TRACKING_EXPORT_CHUNK_SIZE", 2000))
+# Number of the distinct User-Agent headers whose parsed details are cached.
+USER_AGENT_CACHE_SIZE = int(os.environ.get("USER_AGENT_CACHE_SIZE", 10000))
+
+# Number of the rows fetched at once by the export actions of the admin.
+ADMIN_EXPORT_CHUNK_SIZE = int(os.environ.get("ADMIN_EXPORT_CHUNK_SIZE", 2000))
+
+# Number of the rows of catalogue imports validated and saved at once.
+CATALOGUE_IMPORT_CHUNK_SIZE = int(os.environ.get("CATALOGUE_IMPORT_CHUNK_SIZE", 500))
+# Threads fetching the images and creating their thumbnails during imports.
+CATALOGUE_IMPORT_WORKERS = int(os.environ.get("CATALOGUE_IMPORT_WORKERS", 8))
+# Seconds to wait for an image fetched from its URL.
+CATALOGUE_IMPORT_TIMEOUT = int(os.environ.get("CATALOGUE_IMPORT_TIMEOUT", 30))
+# Largest image, in bytes, fetched from its URL during imports.
+CATALOGUE_IMPORT_MAX_IMAGE_SIZE = int(
+    os.environ.get("CATALOGUE_IMPORT_MAX_IMAGE_SIZE", 10 * 1024 * 1024)
+)
+
 # note: having multiple currencies is not supported yet
 AVAILABLE_CURRENCIES = [DEFAULT_CURRENCY]
 
@@ -424,6 +464,57 @@ TEST_RUNNER = "koytola.tests.runner.PytestTestRunner"
 
 PLAYGROUND_ENABLED = get_bool_from_env("PLAYGROUND_ENABLED", True)
 
+# Sampled capture of the GraphQL requests to a JSON Lines file, which can be
+# replayed with the replay_traffic command. Disabled unless a path is given.
+GRAPHQL_CAPTURE_PATH = os.environ.get("GRAPHQL_CAPTURE_PATH")
+GRAPHQL_CAPTURE_SAMPLE_RATE = float(os.environ.get("GRAPHQL_CAPTURE_SAMPLE_RATE", 0.01))
+GRAPHQL_CAPTURE_MUTATIONS = get_bool_from_env("GRAPHQL_CAPTURE_MUTATIONS", False)
+# Variables and arguments whose names contain any of these words are redacted.
+GRAPHQL_CAPTURE_REDACTED_FIELDS = [
+    "password",
+    "token",
+    "secret",
+    "email",
+    "phone",
+    "firstname",
+    "lastname",
+    "address",
+    "card",
+]
+if GRAPHQL_CAPTURE_PATH:
+    LOGGING["formatters"]["raw"] = {"format": "%(message)s"}
+    LOGGING["handlers"]["graphql_capture"] = {
+        "level": "INFO",
+        "class": "logging.handlers.WatchedFileHandler",
+        "filename": GRAPHQL_CAPTURE_PATH,
+        "formatter": "raw",
+    }
+    LOGGING["loggers"]["koytola.graphql.capture"] = {
+        "handlers": ["graphql_capture"],
+        "level": "INFO",
+        "propagate": False,
+    }
+
+# Requests with the X-GraphQL-Profile header get a profile in the extensions of
+# the response. Always allowed to staff users, and to everyone when enabled.
+GRAPHQL_PROFILING_ENABLED = get_bool_from_env("GRAPHQL_PROFILING_ENABLED", DEBUG)
+GRAPHQL_PROFILE_TOP_RESOLVERS = int(os.environ.get("GRAPHQL_PROFILE_TOP_RESOLVERS", 10))
+
+# Report the SQL queries of the same shape run more than the threshold number
+# of times in a GraphQL operation: "off", "log" or "raise".
+GRAPHQL_NPLUSONE_DETECTION = os.environ.get("GRAPHQL_NPLUSONE_DETECTION", "off")
+GRAPHQL_NPLUSONE_THRESHOLD = int(os.environ.get("GRAPHQL_NPLUSONE_THRESHOLD", 5))
+
+# Prometheus metrics served at /metrics/, to the requests with the
+# "Authorization: Bearer <token>" header when a token is given.
+METRICS_ENABLED = get_bool_from_env("METRICS_ENABLED", False)
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN")
+# Operations are labelled with their names up to this many distinct names.
+METRICS_MAX_OPERATIONS = int(os.environ.get("METRICS_MAX_OPERATIONS", 200))
+# Port of the metrics server of the Celery workers, whose task metrics can't
+# be served by the web processes. Not protected by METRICS_TOKEN.
+METRICS_WORKER_PORT = int(os.environ.get("METRICS_WORKER_PORT", 0)) or None
+
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 
 VERSATILEIMAGEFIELD_RENDITION_KEY_SETS = {
@@ -483,6 +574,40 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_RESULT_BACKEND = os.environ.get("CELERY_RESULT_BACKEND", None)
+CELERY_BEAT_SCHEDULE = {
+    "update-tracking-stats": {
+        "task": "koytola.analytics.tasks.update_tracking_stats_task",
+        "schedule": timedelta(minutes=10),
+    },
+    "maintain-tracking-partitions": {
+        "task": "koytola.analytics.tasks.maintain_tracking_partitions_task",
+        "schedule": timedelta(days=1),
+    },
+}
+
+# Newsletter campaigns can be sent from a dedicated queue, so that mailing all
+# the subscribers doesn't block the other tasks. The queue needs its own worker
+# (e.g. `celery -A koytola.celeryconf:app worker -Q newsletter`), by default the
+# chunks go to the default queue. Rate limit is the number of messages per
+# second a single worker hands over to the email provider.
+NEWSLETTER_QUEUE = os.environ.get("NEWSLETTER_QUEUE") or None
+NEWSLETTER_CHUNK_SIZE = int(os.environ.get("NEWSLETTER_CHUNK_SIZE", 500))
+NEWSLETTER_RATE_LIMIT = int(os.environ.get("NEWSLETTER_RATE_LIMIT", 14))
+
+# Payloads shared by the deliveries of a webhook event are kept in the cache for
+# long enough to cover all the delivery retries. They are only shared when the
+# cache is, otherwise each delivery carries its own copy.
+WEBHOOK_PAYLOAD_TTL = int(os.environ.get("WEBHOOK_PAYLOAD_TTL", 60 * 60 * 24))
+
+# Webhook transports are pooled per worker. SQS endpoint can point to a local
+# stand-in (e.g. ElasticMQ) in development.
+WEBHOOK_HTTP_POOL_CONNECTIONS = int(os.environ.get("WEBHOOK_HTTP_POOL_CONNECTIONS", 10))
+WEBHOOK_HTTP_POOL_MAXSIZE = int(os.environ.get("WEBHOOK_HTTP_POOL_MAXSIZE", 10))
+WEBHOOK_SQS_ENDPOINT_URL = os.environ.get("WEBHOOK_SQS_ENDPOINT_URL")
+
+# Group the events triggered during a request into one delivery per target.
+# Receivers have to accept a list of events posted with the "batch" event type.
+WEBHOOK_BATCH_ENABLED = get_bool_from_env("WEBHOOK_BATCH_ENABLED", False)
 
 # Change this value if your application is running behind a proxy,
 # e.g. HTTP_CF_Connecting_IP for Cloudflare or X_FORWARDED_FOR
@@ -506,6 +631,8 @@ GRAPHENE = {
     "RELAY_CONNECTION_MAX_LIMIT": 100,
     "MIDDLEWARE": [
         "koytola.graphql.middleware.OpentracingGrapheneMiddleware",
+        "koytola.graphql.middleware.ProfilingMiddleware",
+        "koytola.graphql.middleware.NPlusOneMiddleware",
         "koytola.graphql.middleware.JWTMiddleware",
         "koytola.graphql.middleware.app_middleware",
     ],
@@ -578,6 +705,13 @@ JWT_TTL_APP_ACCESS = timedelta(
     seconds=parse(os.environ.get("JWT_TTL_APP_ACCESS", "5 minutes"))
 )
 JWT_TTL_REFRESH = timedelta(seconds=parse(os.environ.get("JWT_TTL_REFRESH", "30 days")))
+JWT_TTL_USER_CACHE = timedelta(
+    seconds=parse(os.environ.get("JWT_TTL_USER_CACHE", "5 minutes"))
+)
+# Permission sets are versioned, the TTL only bounds the time that stale sets
+# remain in the cache.
+PERMISSIONS_CACHE_TTL = int(os.environ.get("PERMISSIONS_CACHE_TTL", 60 * 60 * 24))
+APP_TOKEN_CACHE_TTL = int(os.environ.get("APP_TOKEN_CACHE_TTL", 60 * 5))
 
 
 JWT_TTL_REQUEST_EMAIL_CHANGE = timedelta(
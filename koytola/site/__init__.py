@@ -1,3 +1,6 @@
+default_app_config = "koytola.site.apps.SiteAppConfig"
+
+
 class AuthenticationBackends:
     GOOGLE = "google-oauth2"
     FACEBOOK = "facebook"
@@ -19,3 +22,17 @@ class ContactMessageStatus:
         (SPAM, "Message status is spam"),
         (OTHER, "Message status is other"),
     ]
+
+
+class NewsletterCampaignStatus:
+    DRAFT = "draft"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+    CHOICES = [
+        (DRAFT, "Campaign is a draft"),
+        (SENDING, "Campaign is being sent"),
+        (SENT, "Campaign has been sent"),
+        (FAILED, "Campaign sending failed"),
+    ]
@@ -4,10 +4,13 @@ from .models import (
     SiteSettingsTranslation,
     AuthorizationKey,
     SiteSubscriber,
+    NewsletterCampaign,
     Image,
     ContactMessage
 )
-from ..core.utils import download_csv, download_json
+from . import NewsletterCampaignStatus
+from ..core.utils.export import download_csv, download_jsonl, download_xlsx
+from .emails import send_newsletter_campaign
 
 
 class SiteSettingsAdmin(admin.ModelAdmin):
@@ -17,7 +20,7 @@ class SiteSettingsAdmin(admin.ModelAdmin):
     ]
     search_fields = []
     list_filter = []
-    actions = [download_csv, download_json]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["id"]
@@ -27,7 +30,7 @@ class SiteSettingsTranslationAdmin(admin.ModelAdmin):
     list_display = ["id", "language_code", "site_settings", "header_text", "description"]
     search_fields = []
     list_filter = []
-    actions = [download_csv, download_json]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["id"]
@@ -37,17 +40,47 @@ class AuthorizationKeyAdmin(admin.ModelAdmin):
     list_display = ["id", "site_settings", "name"]
     search_fields = []
     list_filter = []
-    actions = [download_csv, download_json]
+    actions = [download_csv, download_jsonl, download_xlsx]
+    export_exclude = ["key", "password"]
 
     def get_ordering(self, request):
         return ["id"]
 
 
 class SiteSubscriberAdmin(admin.ModelAdmin):
-    list_display = ["id", "email", "is_active", "creation_date"]
+    list_display = ["id", "email", "is_active", "language_code", "creation_date"]
     search_fields = ["email"]
-    list_filter = ["creation_date", "is_active"]
-    actions = [download_csv, download_json]
+    list_filter = ["creation_date", "is_active", "language_code"]
+    actions = [download_csv, download_jsonl, download_xlsx]
+
+    def get_ordering(self, request):
+        return ["-creation_date"]
+
+
+def send_newsletter(modeladmin, request, queryset):
+    campaigns = queryset.filter(status=NewsletterCampaignStatus.DRAFT)
+    for campaign in campaigns:
+        send_newsletter_campaign(campaign)
+    modeladmin.message_user(
+        request, "%d campaign(s) scheduled for sending." % len(campaigns)
+    )
+
+
+send_newsletter.short_description = "Send selected newsletter campaigns"
+
+
+class NewsletterCampaignAdmin(admin.ModelAdmin):
+    list_display = [
+        "id", "name", "subject", "status", "recipients_count", "sent_count",
+        "failed_count", "creation_date", "finished_at"
+    ]
+    search_fields = ["name", "subject"]
+    list_filter = ["status", "creation_date"]
+    readonly_fields = [
+        "status", "recipients_count", "sent_count", "failed_count", "started_at",
+        "finished_at"
+    ]
+    actions = [send_newsletter, download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-creation_date"]
@@ -57,7 +90,7 @@ class ImageAdmin(admin.ModelAdmin):
     list_display = ["id", "image", "alt_text", "creation_date", "notes"]
     search_fields = ["image", "notes"]
     list_filter = ["creation_date"]
-    actions = [download_csv, download_json]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-creation_date"]
@@ -67,7 +100,7 @@ class ContactMessageAdmin(admin.ModelAdmin):
     list_display = ["id", "full_name", "email", "date_submitted", "subject", "subject", "date_updated"]
     search_fields = ["full_name", "email", "subject", "content"]
     list_filter = ["date_submitted", "date_updated"]
-    actions = [download_csv, download_json]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["-date_submitted"]
@@ -77,5 +110,6 @@ admin.site.register(SiteSettings, SiteSettingsAdmin)
 admin.site.register(SiteSettingsTranslation, SiteSettingsTranslationAdmin)
 admin.site.register(AuthorizationKey, AuthorizationKeyAdmin)
 admin.site.register(SiteSubscriber, SiteSubscriberAdmin)
+admin.site.register(NewsletterCampaign, NewsletterCampaignAdmin)
 admin.site.register(Image, ImageAdmin)
 admin.site.register(ContactMessage, ContactMessageAdmin)
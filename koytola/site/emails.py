@@ -0,0 +1,177 @@
+import logging
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+from django.conf import settings
+from django.core import mail
+from django.db.models import F
+from django.utils import timezone, translation
+from render_block import render_block_to_string
+
+from ..celeryconf import app
+from ..core.emails import get_email_context
+from . import NewsletterCampaignStatus
+from .models import NewsletterCampaign, SiteSubscriber
+
+logger = logging.getLogger(__name__)
+
+
+def send_newsletter_campaign(campaign: NewsletterCampaign):
+    """Trigger sending the campaign to all active site subscribers."""
+    _send_newsletter_campaign.delay(campaign.pk)
+
+
+def _iter_subscriber_ranges(chunk_size: int) -> Iterable[Tuple[int, int, int]]:
+    """Yield (first_pk, last_pk, size) ranges covering the active subscribers.
+
+    Chunks are passed to the workers as primary key ranges, so that the broker
+    messages stay small no matter how many subscribers a chunk covers.
+    """
+    subscriber_ids = (
+        SiteSubscriber.objects.filter(is_active=True)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+        .iterator(chunk_size=chunk_size)
+    )
+    chunk: List[int] = []
+    for subscriber_id in subscriber_ids:
+        chunk.append(subscriber_id)
+        if len(chunk) == chunk_size:
+            yield chunk[0], chunk[-1], len(chunk)
+            chunk = []
+    if chunk:
+        yield chunk[0], chunk[-1], len(chunk)
+
+
+@app.task
+def _send_newsletter_campaign(campaign_pk):
+    # The status is flipped atomically, so that concurrent triggers of the same
+    # campaign (e.g. a double click or a retry) don't send it twice.
+    started_at = timezone.now()
+    updated = NewsletterCampaign.objects.filter(
+        pk=campaign_pk, status=NewsletterCampaignStatus.DRAFT
+    ).update(status=NewsletterCampaignStatus.SENDING, started_at=started_at)
+    if updated != 1:
+        logger.warning("Newsletter campaign %r has already been sent", campaign_pk)
+        return
+
+    ranges = list(_iter_subscriber_ranges(settings.NEWSLETTER_CHUNK_SIZE))
+    recipients_count = sum(size for _, _, size in ranges)
+    if ranges:
+        NewsletterCampaign.objects.filter(pk=campaign_pk).update(
+            recipients_count=recipients_count
+        )
+    else:
+        NewsletterCampaign.objects.filter(pk=campaign_pk).update(
+            status=NewsletterCampaignStatus.SENT, finished_at=started_at
+        )
+
+    for first_pk, last_pk, size in ranges:
+        _send_newsletter_chunk.apply_async(
+            (campaign_pk, first_pk, last_pk, size),
+            queue=settings.NEWSLETTER_QUEUE,
+        )
+    logger.info(
+        "Newsletter campaign %r scheduled for %d subscribers in %d chunks",
+        campaign_pk,
+        recipients_count,
+        len(ranges),
+    )
+
+
+@lru_cache(maxsize=32)
+def _render_newsletter(campaign_pk: int, language_code: str) -> Dict[str, str]:
+    """Render the campaign once per locale and share it between recipients.
+
+    Campaigns are frozen once they leave the draft status, so the rendered
+    parts can be safely kept for the lifetime of the worker.
+    """
+    campaign = NewsletterCampaign.objects.get(pk=campaign_pk)
+    send_kwargs, ctx = get_email_context()
+    ctx["subject"] = campaign.subject
+    ctx["content"] = campaign.content
+    template = "templated_email/%s.email" % (campaign.template_name,)
+    with translation.override(language_code):
+        parts = {
+            block: render_block_to_string(template, block, ctx).strip()
+            for block in ("subject", "plain", "html")
+        }
+    parts["from_email"] = send_kwargs["from_email"]
+    return parts
+
+
+def _build_newsletter_message(parts: Dict[str, str], email: str, connection):
+    message = mail.EmailMultiAlternatives(
+        subject=parts["subject"],
+        body=parts["plain"],
+        from_email=parts["from_email"],
+        to=[email],
+        connection=connection,
+    )
+    message.attach_alternative(parts["html"], "text/html")
+    return message
+
+
+def _send_throttled(messages: List[mail.EmailMessage], connection) -> int:
+    """Send messages over a single connection, honouring the rate limit.
+
+    `NEWSLETTER_RATE_LIMIT` is the number of messages a single worker is
+    allowed to hand over to the email provider per second.
+    """
+    rate_limit = settings.NEWSLETTER_RATE_LIMIT
+    sent = 0
+    for start in range(0, len(messages), rate_limit):
+        started_at = time.monotonic()
+        sent += connection.send_messages(messages[start : start + rate_limit]) or 0
+        elapsed = time.monotonic() - started_at
+        if start + rate_limit < len(messages) and elapsed < 1:
+            time.sleep(1 - elapsed)
+    return sent
+
+
+@app.task(acks_late=True)
+def _send_newsletter_chunk(campaign_pk, first_pk, last_pk, expected_count):
+    recipients = SiteSubscriber.objects.filter(
+        is_active=True, pk__gte=first_pk, pk__lte=last_pk
+    ).values_list("email", "language_code")
+
+    connection = mail.get_connection(fail_silently=True)
+    messages = [
+        _build_newsletter_message(
+            _render_newsletter(campaign_pk, language_code), email, connection
+        )
+        for email, language_code in recipients
+    ]
+    sent = 0
+    if messages:
+        connection.open()
+        try:
+            sent = _send_throttled(messages, connection)
+        finally:
+            connection.close()
+
+    # Subscribers who opted out after the campaign was scheduled are no longer
+    # counted as recipients.
+    NewsletterCampaign.objects.filter(pk=campaign_pk).update(
+        recipients_count=F("recipients_count") - (expected_count - len(messages)),
+        sent_count=F("sent_count") + sent,
+        failed_count=F("failed_count") + len(messages) - sent,
+    )
+    finished = NewsletterCampaign.objects.filter(
+        pk=campaign_pk,
+        status=NewsletterCampaignStatus.SENDING,
+        recipients_count__lte=F("sent_count") + F("failed_count"),
+    )
+    finished.filter(sent_count=0, failed_count__gt=0).update(
+        status=NewsletterCampaignStatus.FAILED, finished_at=timezone.now()
+    )
+    finished.update(status=NewsletterCampaignStatus.SENT, finished_at=timezone.now())
+    logger.debug(
+        "[Newsletter campaign %r] Sent %d of %d messages (subscribers %r-%r)",
+        campaign_pk,
+        sent,
+        len(messages),
+        first_pk,
+        last_pk,
+    )
@@ -0,0 +1,40 @@
+# Generated by Django 3.1 on 2026-10-19 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('site', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sitesubscriber',
+            name='language_code',
+            field=models.CharField(choices=[('en', 'English'), ('es', 'Spanish')], default='en', max_length=35),
+        ),
+        migrations.CreateModel(
+            name='NewsletterCampaign',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=128)),
+                ('subject', models.CharField(max_length=255)),
+                ('template_name', models.CharField(default='site/newsletter', max_length=255)),
+                ('content', models.TextField(blank=True, default='')),
+                ('status', models.CharField(choices=[('draft', 'Campaign is a draft'), ('sending', 'Campaign is being sent'), ('sent', 'Campaign has been sent'), ('failed', 'Campaign sending failed')], default='draft', max_length=32)),
+                ('recipients_count', models.PositiveIntegerField(default=0)),
+                ('sent_count', models.PositiveIntegerField(default=0)),
+                ('failed_count', models.PositiveIntegerField(default=0)),
+                ('creation_date', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Newsletter Campaign',
+                'verbose_name_plural': 'Newsletter Campaigns',
+                'ordering': ['-creation_date'],
+            },
+        ),
+    ]
@@ -10,7 +10,7 @@ from django.db import models
 
 from ..core.permissions import SitePermissions
 from ..core.utils.translations import TranslationProxy
-from . import AuthenticationBackends, ContactMessageStatus
+from . import AuthenticationBackends, ContactMessageStatus, NewsletterCampaignStatus
 from .error_codes import SiteErrorCode
 from .patch_sites import patch_contrib_sites
 
@@ -136,6 +136,9 @@ class SiteSubscriber(models.Model):
     email = models.EmailField(max_length=128)
     creation_date = models.DateTimeField(auto_now_add=True)
     is_active = models.BooleanField(default=True)
+    language_code = models.CharField(
+        max_length=35, choices=settings.LANGUAGES, default=settings.LANGUAGE_CODE
+    )
 
     class Meta:
         verbose_name = "Site Subscriber"
@@ -148,6 +151,40 @@ class SiteSubscriber(models.Model):
         ]
 
 
+class NewsletterCampaign(models.Model):
+    name = models.CharField(max_length=128)
+    subject = models.CharField(max_length=255)
+    template_name = models.CharField(
+        max_length=255, default="site/newsletter"
+    )
+    content = models.TextField(blank=True, default="")
+    status = models.CharField(
+        max_length=32,
+        choices=NewsletterCampaignStatus.CHOICES,
+        default=NewsletterCampaignStatus.DRAFT,
+    )
+    recipients_count = models.PositiveIntegerField(default=0)
+    sent_count = models.PositiveIntegerField(default=0)
+    failed_count = models.PositiveIntegerField(default=0)
+    creation_date = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        verbose_name = "Newsletter Campaign"
+        verbose_name_plural = "Newsletter Campaigns"
+        ordering = ["-creation_date"]
+
+    def __str__(self):
+        return self.name
+
+    @property
+    def progress(self) -> float:
+        if not self.recipients_count:
+            return 0.0
+        return (self.sent_count + self.failed_count) / self.recipients_count
+
+
 class Image(models.Model):
     image = models.FileField(
         verbose_name="Image",
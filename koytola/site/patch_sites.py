@@ -19,12 +19,9 @@ def new_get_current(self, request=None):
     from django.conf import settings
 
     if getattr(settings, "SITE_ID", ""):
-        site_id = settings.SITE_ID
-        if site_id not in THREADED_SITE_CACHE:
-            with lock:
-                site = self.prefetch_related("settings").filter(pk=site_id)[0]
-                THREADED_SITE_CACHE[site_id] = site
-        return THREADED_SITE_CACHE[site_id]
+        from .utils import get_current_site
+
+        return get_current_site()
     elif request:
         host = request.get_host()
         try:
@@ -56,9 +53,12 @@ def new_get_current(self, request=None):
 
 
 def new_clear_cache(self):
+    from .utils import site_cache
+
     global THREADED_SITE_CACHE
     with lock:
         THREADED_SITE_CACHE = {}
+    site_cache.clear()
 
 
 def new_get_by_natural_key(self, domain):
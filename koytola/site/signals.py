@@ -0,0 +1,34 @@
+from django.contrib.sites.models import Site
+from django.db.models.signals import post_delete, post_save, pre_delete
+
+from ..account.models import Address
+from .models import SiteSettings, SiteSettingsTranslation
+from .utils import get_site_company_address_id, invalidate_site_cache
+
+
+def _invalidate_site(**_kwargs):
+    invalidate_site_cache()
+
+
+def _invalidate_site_company_address(instance, **_kwargs):
+    if instance.pk == get_site_company_address_id():
+        invalidate_site_cache()
+
+
+def connect_signals():
+    for model in (Site, SiteSettings, SiteSettingsTranslation):
+        dispatch_uid = f"invalidate_site_{model.__name__}"
+        post_save.connect(_invalidate_site, sender=model, dispatch_uid=dispatch_uid)
+        post_delete.connect(_invalidate_site, sender=model, dispatch_uid=dispatch_uid)
+    # Addresses are saved often, so only the company address of the site
+    # invalidates the cache.
+    post_save.connect(
+        _invalidate_site_company_address,
+        sender=Address,
+        dispatch_uid="invalidate_site_company_address",
+    )
+    pre_delete.connect(
+        _invalidate_site_company_address,
+        sender=Address,
+        dispatch_uid="invalidate_site_company_address",
+    )
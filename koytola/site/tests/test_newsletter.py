@@ -0,0 +1,125 @@
+from unittest import mock
+
+import pytest
+from django.core import mail
+
+from .. import NewsletterCampaignStatus, emails
+from ..models import NewsletterCampaign, SiteSubscriber
+
+
+@pytest.fixture
+def newsletter_campaign(db):
+    return NewsletterCampaign.objects.create(
+        name="Spring", subject="Spring deals", content="New products are in."
+    )
+
+
+@pytest.fixture
+def site_subscribers(db):
+    return SiteSubscriber.objects.bulk_create(
+        [
+            SiteSubscriber(email="en1@example.com", language_code="en"),
+            SiteSubscriber(email="es1@example.com", language_code="es"),
+            SiteSubscriber(email="en2@example.com", language_code="en"),
+            SiteSubscriber(email="off@example.com", is_active=False),
+            SiteSubscriber(email="es2@example.com", language_code="es"),
+        ]
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_rendered_newsletters():
+    emails._render_newsletter.cache_clear()
+
+
+def test_iter_subscriber_ranges(site_subscribers):
+    pks = sorted(s.pk for s in SiteSubscriber.objects.filter(is_active=True))
+
+    ranges = list(emails._iter_subscriber_ranges(3))
+
+    assert ranges == [(pks[0], pks[2], 3), (pks[3], pks[3], 1)]
+
+
+def test_send_newsletter_campaign(newsletter_campaign, site_subscribers, settings):
+    settings.NEWSLETTER_CHUNK_SIZE = 2
+
+    emails.send_newsletter_campaign(newsletter_campaign)
+
+    assert sorted(message.to[0] for message in mail.outbox) == [
+        "en1@example.com",
+        "en2@example.com",
+        "es1@example.com",
+        "es2@example.com",
+    ]
+    # The campaign is rendered once per locale, not once per recipient.
+    assert emails._render_newsletter.cache_info().misses == 2
+    newsletter_campaign.refresh_from_db()
+    assert newsletter_campaign.status == NewsletterCampaignStatus.SENT
+    assert newsletter_campaign.recipients_count == 4
+    assert newsletter_campaign.sent_count == 4
+    assert newsletter_campaign.failed_count == 0
+    assert newsletter_campaign.finished_at is not None
+
+
+@mock.patch("koytola.site.emails._send_newsletter_chunk.apply_async")
+def test_send_newsletter_campaign_queue(
+    mocked_send_chunk, newsletter_campaign, site_subscribers, settings
+):
+    settings.NEWSLETTER_QUEUE = None
+    emails.send_newsletter_campaign(newsletter_campaign)
+    assert mocked_send_chunk.call_args[1]["queue"] is None
+
+    settings.NEWSLETTER_QUEUE = "newsletter"
+    NewsletterCampaign.objects.filter(pk=newsletter_campaign.pk).update(
+        status=NewsletterCampaignStatus.DRAFT
+    )
+    emails.send_newsletter_campaign(newsletter_campaign)
+    assert mocked_send_chunk.call_args[1]["queue"] == "newsletter"
+
+
+def test_send_newsletter_campaign_only_once(newsletter_campaign, site_subscribers):
+    emails.send_newsletter_campaign(newsletter_campaign)
+    emails.send_newsletter_campaign(newsletter_campaign)
+
+    assert len(mail.outbox) == 4
+
+
+def test_send_newsletter_campaign_without_subscribers(newsletter_campaign):
+    emails.send_newsletter_campaign(newsletter_campaign)
+
+    newsletter_campaign.refresh_from_db()
+    assert newsletter_campaign.status == NewsletterCampaignStatus.SENT
+    assert newsletter_campaign.recipients_count == 0
+    assert not mail.outbox
+
+
+def test_send_newsletter_chunk_skips_unsubscribed(
+    newsletter_campaign, site_subscribers
+):
+    pks = sorted(s.pk for s in site_subscribers)
+    NewsletterCampaign.objects.filter(pk=newsletter_campaign.pk).update(
+        status=NewsletterCampaignStatus.SENDING, recipients_count=5
+    )
+
+    emails._send_newsletter_chunk(newsletter_campaign.pk, pks[0], pks[-1], 5)
+
+    newsletter_campaign.refresh_from_db()
+    assert newsletter_campaign.recipients_count == 4
+    assert newsletter_campaign.sent_count == 4
+    assert newsletter_campaign.status == NewsletterCampaignStatus.SENT
+
+
+@mock.patch("koytola.site.emails._send_throttled", return_value=0)
+def test_send_newsletter_chunk_failed(
+    mocked_send, newsletter_campaign, site_subscribers
+):
+    pks = sorted(s.pk for s in site_subscribers)
+    NewsletterCampaign.objects.filter(pk=newsletter_campaign.pk).update(
+        status=NewsletterCampaignStatus.SENDING, recipients_count=4
+    )
+
+    emails._send_newsletter_chunk(newsletter_campaign.pk, pks[0], pks[-1], 4)
+
+    newsletter_campaign.refresh_from_db()
+    assert newsletter_campaign.failed_count == 4
+    assert newsletter_campaign.status == NewsletterCampaignStatus.FAILED
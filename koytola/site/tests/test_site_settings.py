@@ -51,3 +51,32 @@ def test_new_get_current():
     assert result.domain == "test.com"
     assert type(result.settings) == SiteSettings
     assert str(result.settings) == "test.com"
+
+
+def test_get_current_site_cached(site_settings, django_assert_num_queries):
+    utils.get_current_site()
+
+    with django_assert_num_queries(0):
+        site = utils.get_current_site()
+        assert site.settings.header_text == site_settings.header_text
+        assert list(site.settings.translations.all()) == []
+
+
+def test_get_current_site_returns_copies(site_settings):
+    site = utils.get_current_site()
+    site.name = "Changed"
+    site.settings.header_text = "Changed"
+
+    other_site = utils.get_current_site()
+    assert other_site.name != "Changed"
+    assert other_site.settings.header_text != "Changed"
+    assert other_site.settings.site is other_site
+
+
+def test_get_current_site_invalidated_on_settings_change(site_settings):
+    utils.get_current_site()
+
+    site_settings.header_text = "New header"
+    site_settings.save(update_fields=["header_text"])
+
+    assert utils.get_current_site().settings.header_text == "New header"
@@ -1,9 +1,14 @@
+import copy
 from typing import Optional
 
 from django.conf import settings
+from django.contrib.sites.models import Site
 
+from ..core.cache import VersionedCache, bump_version
 from .models import AuthorizationKey
 
+SITE_CACHE_NAME = "site"
+
 
 def get_authorization_key_for_backend(backend_name: str) -> Optional[AuthorizationKey]:
     site_id = getattr(settings, "SITE_ID", None)
@@ -11,3 +16,73 @@ def get_authorization_key_for_backend(backend_name: str) -> Optional[Authorizati
         name=backend_name, site_settings__site__id=site_id
     )
     return authorization_key.first()
+
+
+def _get_current_site() -> Site:
+    return (
+        Site.objects.select_related("settings", "settings__company_address")
+        .prefetch_related("settings__translations")
+        .get(pk=settings.SITE_ID)
+    )
+
+
+site_cache: VersionedCache[Site] = VersionedCache(SITE_CACHE_NAME, _get_current_site)
+
+
+def _get_cached_site() -> Site:
+    site = site_cache.get()
+    if site.pk != settings.SITE_ID:
+        site_cache.clear()
+        site = site_cache.get()
+    return site
+
+
+def _copy_instance(instance):
+    # A shallow copy with its own caches of the related objects. Unlike a deep
+    # copy, it keeps the prefetched translations, whose querysets are shared.
+    copied = copy.copy(instance)
+    copied._state = copy.copy(instance._state)
+    copied._state.fields_cache = dict(instance._state.fields_cache)
+    if hasattr(instance, "_prefetched_objects_cache"):
+        copied._prefetched_objects_cache = dict(instance._prefetched_objects_cache)
+    return copied
+
+
+def get_current_site() -> Site:
+    """Return the current site along with its settings and their translations.
+
+    The site is cached until the site or its settings change. Callers may update
+    the returned site and its settings in place, so each of them gets its own
+    copy of these, while the translations are shared.
+    """
+    cached_site = _get_cached_site()
+    site = _copy_instance(cached_site)
+    site_settings = cached_site._state.fields_cache.get("settings")
+    if site_settings is not None:
+        site_settings = _copy_instance(site_settings)
+        site_settings._state.fields_cache["site"] = site
+        company_address = site_settings._state.fields_cache.get("company_address")
+        if company_address is not None:
+            site_settings._state.fields_cache["company_address"] = _copy_instance(
+                company_address
+            )
+        site._state.fields_cache["settings"] = site_settings
+    return site
+
+
+def get_site_domain() -> str:
+    """Return the domain of the current site, cached until the site changes."""
+    return _get_cached_site().domain
+
+
+def get_site_company_address_id() -> Optional[int]:
+    try:
+        return _get_cached_site().settings.company_address_id
+    except (Site.DoesNotExist, Site.settings.RelatedObjectDoesNotExist):
+        return None
+
+
+def invalidate_site_cache():
+    # Rebuilt right away as well, so that the current transaction sees its own
+    # changes of the settings.
+    bump_version(SITE_CACHE_NAME, immediately=True)
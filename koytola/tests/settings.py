@@ -53,3 +53,9 @@ PATTERNS_IGNORED_IN_QUERY_CAPTURES: List[Union[Pattern, SimpleLazyObject]] = [
 INSTALLED_APPS.append("koytola.tests")  # noqa: F405
 
 JWT_EXPIRE = True
+
+GRAPHQL_NPLUSONE_DETECTION = "log"
+
+# The tracking buffers are only flushed by the tests themselves, and not by
+# their background threads in the middle of a test.
+TRACKING_FLUSH_INTERVAL = 60 * 60
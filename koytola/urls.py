@@ -6,6 +6,7 @@ from django.contrib.staticfiles.views import serve
 from django.views.decorators.csrf import csrf_exempt
 from django.views.generic.base import TemplateView
 
+from .core.views import metrics
 from .graphql.api import schema
 from .graphql.views import GraphQLView
 
@@ -20,6 +21,9 @@ urlpatterns = [
     path('admin/', admin.site.urls),  # 'admin-board/' on production
 ]
 
+if settings.METRICS_ENABLED:
+    urlpatterns += [path("metrics/", metrics, name="metrics")]
+
 
 if settings.DEBUG:
     import warnings
@@ -0,0 +1 @@
+default_app_config = "koytola.webhook.apps.WebhookAppConfig"
@@ -1,13 +1,14 @@
 from django.contrib import admin
 from .models import Webhook, WebhookEvent
-from ..core.utils import download_csv
+from ..core.utils.export import download_csv, download_jsonl, download_xlsx
 
 
 class WebhookAdmin(admin.ModelAdmin):
     list_display = ["id", "app", "name", "target_url", "is_active"]
     search_fields = ["app", "name", "target_url"]
     list_filter = ["is_active"]
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
+    export_exclude = ["secret_key"]
 
     def get_ordering(self, request):
         return ["name"]
@@ -17,7 +18,7 @@ class WebhookEventAdmin(admin.ModelAdmin):
     list_display = ["id", "webhook"]
     search_fields = ["webhook"]
     list_filter = []
-    actions = [download_csv]
+    actions = [download_csv, download_jsonl, download_xlsx]
 
     def get_ordering(self, request):
         return ["id"]
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class WebhookAppConfig(AppConfig):
+    name = "koytola.webhook"
+
+    def ready(self):
+        from .signals import connect_signals
+
+        connect_signals()
@@ -0,0 +1,70 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ....order.models import Order
+from ...payload_serializers import PayloadSerializer
+from ...payloads import (
+    ADDRESS_FIELDS,
+    ORDER_FIELDS,
+    PAYMENT_FIELDS,
+    generate_orders_payload,
+)
+
+
+def generate_legacy_orders_payload(orders):
+    return PayloadSerializer().serialize(
+        orders,
+        fields=ORDER_FIELDS,
+        additional_fields={
+            "payments": (lambda o: o.payments.all(), PAYMENT_FIELDS),
+            "billing_address": (lambda o: o.billing_address, ADDRESS_FIELDS),
+        },
+    )
+
+
+class Command(BaseCommand):
+    help = "Compare the speed of the legacy and the current order payload serializers."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--orders",
+            type=int,
+            default=100,
+            help="Number of orders serialized into a single payload.",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=5, help="Number of measured runs."
+        )
+
+    def handle(self, *args, **options):
+        orders_count = options["orders"]
+        repeat = options["repeat"]
+        if not Order.objects.exists():
+            raise CommandError("There are no orders to serialize.")
+
+        results = {}
+        for name, generator in [
+            ("legacy", generate_legacy_orders_payload),
+            ("current", generate_orders_payload),
+        ]:
+            timings = []
+            for _ in range(repeat):
+                # Orders are fetched again on every run, so that neither
+                # serializer benefits from the objects cached by the other.
+                orders = list(Order.objects.order_by("pk")[:orders_count])
+                with CaptureQueriesContext(connection) as queries:
+                    start = time.perf_counter()
+                    payload = generator(orders)
+                    timings.append(time.perf_counter() - start)
+            results[name] = payload
+            self.stdout.write(
+                "%s: best %.2f ms, %d queries, %d bytes"
+                % (name, min(timings) * 1000, len(queries), len(payload))
+            )
+
+        if results["legacy"] != results["current"]:
+            raise CommandError("Payloads generated by the serializers differ.")
+        self.stdout.write(self.style.SUCCESS("Payloads are identical."))
@@ -1,9 +1,9 @@
 import json
-from typing import Optional
+from typing import Iterable, Optional
 
 from django.db.models import QuerySet
 
-from ..account.models import User
+from ..account.models import Address, User
 from ..core.utils.anonymization import (
     anonymize_order,
     generate_fake_user,
@@ -11,8 +11,9 @@ from ..core.utils.anonymization import (
 from ..invoice.models import Invoice
 from ..order import OrderEvents
 from ..order.models import Order
+from ..payment.models import Payment
 from .event_types import WebhookEventType
-from .payload_serializers import PayloadSerializer
+from .payload_serializers import ModelPayloadSerializer, PayloadSpec
 
 ADDRESS_FIELDS = (
     "first_name",
@@ -38,76 +39,88 @@ ORDER_FIELDS = (
 )
 
 
+PAYMENT_FIELDS = (
+    "gateway",
+    "payment_method_type",
+    "cc_brand",
+    "is_active",
+    "created",
+    "modified",
+    "charge_status",
+    "total",
+    "currency",
+    "billing_email",
+    "billing_first_name",
+    "billing_last_name",
+    "billing_company_name",
+    "billing_address_1",
+    "billing_address_2",
+    "billing_city",
+    "billing_city_area",
+    "billing_postal_code",
+    "billing_country_code",
+    "billing_country_area",
+)
+
+INVOICE_FIELDS = ("id", "number", "external_url", "created")
+
+CUSTOMER_FIELDS = (
+    "email",
+    "first_name",
+    "last_name",
+    "is_active",
+    "date_joined",
+    "private_metadata",
+    "metadata",
+)
+
+ORDER_PAYLOAD = PayloadSpec(
+    Order,
+    ORDER_FIELDS,
+    related={
+        "payments": ("payments", PayloadSpec(Payment, PAYMENT_FIELDS)),
+        "billing_address": ("billing_address", PayloadSpec(Address, ADDRESS_FIELDS)),
+    },
+)
+
+INVOICE_PAYLOAD = PayloadSpec(
+    Invoice,
+    INVOICE_FIELDS,
+    related={"order": ("order", PayloadSpec(Order, ORDER_FIELDS))},
+)
+
+CUSTOMER_PAYLOAD = PayloadSpec(
+    User,
+    CUSTOMER_FIELDS,
+    related={
+        # Keys are crossed with the attributes on purpose: receivers rely on the
+        # shape of the payload sent so far.
+        "default_shipping_address": (
+            "default_billing_address",
+            PayloadSpec(Address, ADDRESS_FIELDS),
+        ),
+        "default_billing_address": (
+            "default_shipping_address",
+            PayloadSpec(Address, ADDRESS_FIELDS),
+        ),
+    },
+)
+
+
 def generate_order_payload(order: "Order"):
-    serializer = PayloadSerializer()
-    payment_fields = (
-        "gateway",
-        "payment_method_type",
-        "cc_brand",
-        "is_active",
-        "created",
-        "modified",
-        "charge_status",
-        "total",
-        "currency",
-        "billing_email",
-        "billing_first_name",
-        "billing_last_name",
-        "billing_company_name",
-        "billing_address_1",
-        "billing_address_2",
-        "billing_city",
-        "billing_city_area",
-        "billing_postal_code",
-        "billing_country_code",
-        "billing_country_area",
-    )
-    order_data = serializer.serialize(
-        [order],
-        fields=ORDER_FIELDS,
-        additional_fields={
-            "payments": (lambda o: o.payments.all(), payment_fields),
-            "billing_address": (lambda o: o.billing_address, ADDRESS_FIELDS),
-        },
-    )
-    return order_data
+    return ModelPayloadSerializer(ORDER_PAYLOAD).serialize([order])
+
+
+def generate_orders_payload(orders: Iterable["Order"]):
+    return ModelPayloadSerializer(ORDER_PAYLOAD).serialize(orders)
 
 
 def generate_invoice_payload(invoice: "Invoice"):
-    serializer = PayloadSerializer()
-    invoice_fields = ("id", "number", "external_url", "created")
-    return serializer.serialize(
-        [invoice],
-        fields=invoice_fields,
-        additional_fields={"order": (lambda i: i.order, ORDER_FIELDS)},
-    )
+    return ModelPayloadSerializer(INVOICE_PAYLOAD).serialize([invoice])
 
 
 def generate_customer_payload(customer: "User"):
-    serializer = PayloadSerializer()
-    data = serializer.serialize(
-        [customer],
-        fields=[
-            "email",
-            "first_name",
-            "last_name",
-            "is_active",
-            "date_joined",
-            "private_metadata",
-            "metadata",
-        ],
-        additional_fields={
-            "default_shipping_address": (
-                lambda c: c.default_billing_address,
-                ADDRESS_FIELDS,
-            ),
-            "default_billing_address": (
-                lambda c: c.default_shipping_address,
-                ADDRESS_FIELDS,
-            ),
-        },
-    )
-    return data
+    return ModelPayloadSerializer(CUSTOMER_PAYLOAD).serialize([customer])
 
 
 def _get_sample_object(qs: QuerySet):
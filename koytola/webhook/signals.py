@@ -0,0 +1,23 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from ..app.models import App
+from .models import Webhook, WebhookEvent
+from .utils import invalidate_webhooks_cache
+
+
+def _invalidate_webhooks(**_kwargs):
+    invalidate_webhooks_cache()
+
+
+def connect_signals():
+    for model in (Webhook, WebhookEvent, App):
+        dispatch_uid = f"invalidate_webhooks_{model.__name__}"
+        post_save.connect(_invalidate_webhooks, sender=model, dispatch_uid=dispatch_uid)
+        post_delete.connect(
+            _invalidate_webhooks, sender=model, dispatch_uid=dispatch_uid
+        )
+    m2m_changed.connect(
+        _invalidate_webhooks,
+        sender=App.permissions.through,
+        dispatch_uid="invalidate_webhooks_app_permissions",
+    )
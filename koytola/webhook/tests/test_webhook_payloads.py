@@ -2,7 +2,20 @@ import json
 
 import graphene
 
-from ..payloads import ORDER_FIELDS, generate_order_payload
+from ...invoice.models import Invoice
+from ...order.models import Order
+from ..payload_serializers import PayloadSerializer
+from ..payloads import (
+    ADDRESS_FIELDS,
+    CUSTOMER_FIELDS,
+    INVOICE_FIELDS,
+    ORDER_FIELDS,
+    PAYMENT_FIELDS,
+    generate_customer_payload,
+    generate_invoice_payload,
+    generate_order_payload,
+    generate_orders_payload,
+)
 
 
 def test_generate_order_payload(
@@ -24,3 +37,69 @@ def test_generate_order_payload(
     assert payload.get("shipping_address")
     assert payload.get("billing_address")
     assert payload.get("fulfillments")
+
+
+def _generate_legacy_order_payload(order):
+    return PayloadSerializer().serialize(
+        [order],
+        fields=ORDER_FIELDS,
+        additional_fields={
+            "payments": (lambda o: o.payments.all(), PAYMENT_FIELDS),
+            "billing_address": (lambda o: o.billing_address, ADDRESS_FIELDS),
+        },
+    )
+
+
+def test_generate_order_payload_matches_legacy_serializer(payment_dummy):
+    order = payment_dummy.order
+    legacy_payload = _generate_legacy_order_payload(order)
+
+    assert generate_order_payload(order) == legacy_payload
+
+
+def test_generate_orders_payload_prefetches_related_objects(
+    payment_dummy, django_assert_num_queries
+):
+    order = payment_dummy.order
+    order_copy = Order.objects.get(pk=order.pk)
+    order_copy.pk = None
+    order_copy.save()
+    orders = list(Order.objects.filter(pk__in=[order.pk, order_copy.pk]))
+
+    # One query for the payments and one for the addresses of all the orders.
+    with django_assert_num_queries(2):
+        payload = json.loads(generate_orders_payload(orders))
+
+    assert [item["id"] for item in payload] == [
+        graphene.Node.to_global_id("Order", o.pk) for o in orders
+    ]
+
+
+def test_generate_customer_payload_matches_legacy_serializer(customer_user):
+    legacy_payload = PayloadSerializer().serialize(
+        [customer_user],
+        fields=CUSTOMER_FIELDS,
+        additional_fields={
+            "default_shipping_address": (
+                lambda c: c.default_billing_address,
+                ADDRESS_FIELDS,
+            ),
+            "default_billing_address": (
+                lambda c: c.default_shipping_address,
+                ADDRESS_FIELDS,
+            ),
+        },
+    )
+
+    assert generate_customer_payload(customer_user) == legacy_payload
+
+
+def test_generate_invoice_payload_matches_legacy_serializer(order):
+    invoice = Invoice.objects.create(order=order, number="1/2020")
+    legacy_payload = PayloadSerializer().serialize(
+        [invoice],
+        fields=INVOICE_FIELDS,
+        additional_fields={"order": (lambda i: i.order, ORDER_FIELDS)},
+    )
+
+    assert generate_invoice_payload(invoice) == legacy_payload
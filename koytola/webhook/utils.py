@@ -0,0 +1,57 @@
+from collections import defaultdict
+from typing import Dict, List, NamedTuple
+
+from ..core.cache import VersionedCache
+from .event_types import WebhookEventType
+from .models import Webhook
+
+WEBHOOKS_CACHE_NAME = "webhooks"
+
+
+class WebhookTarget(NamedTuple):
+    pk: int
+    target_url: str
+    secret_key: str
+
+
+def _build_webhooks_index() -> Dict[str, List[WebhookTarget]]:
+    """Map every event type to the active webhooks allowed to receive it."""
+    webhooks = (
+        Webhook.objects.filter(is_active=True, app__is_active=True)
+        .select_related("app")
+        .prefetch_related("events", "app__permissions__content_type")
+        .order_by("pk")
+    )
+    index: Dict[str, List[WebhookTarget]] = defaultdict(list)
+    for webhook in webhooks:
+        subscribed = {event.event_type for event in webhook.events.all()}
+        app_permissions = {
+            f"{perm.content_type.app_label}.{perm.codename}"
+            for perm in webhook.app.permissions.all()
+        }
+        target = WebhookTarget(webhook.pk, webhook.target_url, webhook.secret_key)
+        for event_type, required_permission in WebhookEventType.PERMISSIONS.items():
+            if event_type not in subscribed and WebhookEventType.ANY not in subscribed:
+                continue
+            if required_permission and required_permission.value not in app_permissions:
+                continue
+            index[event_type].append(target)
+    return dict(index)
+
+
+webhooks_cache: VersionedCache[Dict[str, List[WebhookTarget]]] = VersionedCache(
+    WEBHOOKS_CACHE_NAME, _build_webhooks_index
+)
+
+
+def get_webhooks_for_event(event_type: str) -> List[WebhookTarget]:
+    """Return the webhooks subscribed to the event.
+
+    The index is built once per process and rebuilt only after a webhook, its
+    events, an app or its permissions have changed.
+    """
+    return webhooks_cache.get().get(event_type, [])
+
+
+def invalidate_webhooks_cache():
+    webhooks_cache.invalidate()